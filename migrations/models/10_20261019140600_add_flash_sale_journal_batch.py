@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `flash_sale_journal_batch` (
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `batch_id` VARCHAR(32) NOT NULL UNIQUE,
+    KEY `idx_flash_sale__created_899d9d` (`created_at`)
+) CHARACTER SET utf8mb4 COMMENT='MySQL에 반영한 한정 판매 저널 배치 (반영과 같은 트랜잭션에 기록해, Redis ack가 실패해도 다시 반영하지 않음)';
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `flash_sale_journal_batch`;
+    """
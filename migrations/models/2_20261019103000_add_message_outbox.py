@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `message_outbox` (
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `channel` VARCHAR(10) NOT NULL  COMMENT 'EMAIL: email\nSMS: sms',
+    `recipient` VARCHAR(255) NOT NULL,
+    `subject` VARCHAR(255),
+    `body` LONGTEXT NOT NULL,
+    `status` VARCHAR(10) NOT NULL  COMMENT 'PENDING: pending\nSENDING: sending\nSENT: sent\nFAILED: failed' DEFAULT 'pending',
+    `attempts` INT NOT NULL  DEFAULT 0,
+    `next_attempt_at` DATETIME(6) NOT NULL,
+    `claimed_at` DATETIME(6),
+    `last_error` LONGTEXT,
+    KEY `idx_message_out_status_50db73` (`status`, `next_attempt_at`)
+) CHARACTER SET utf8mb4 COMMENT='Outbox of email/SMS messages delivered by the background worker';
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `message_outbox`;
+    """
@@ -0,0 +1,24 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `payment_webhook_event` (
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `imp_uid` VARCHAR(255) NOT NULL,
+    `merchant_uid` VARCHAR(255) NOT NULL,
+    `status` VARCHAR(50) NOT NULL,
+    `fail_reason` LONGTEXT,
+    `applied_at` DATETIME(6),
+    UNIQUE KEY `uid_payment_web_imp_uid_dfde3f` (`imp_uid`, `status`),
+    KEY `idx_payment_web_applied_9d8cd9` (`applied_at`, `created_at`)
+) CHARACTER SET utf8mb4 COMMENT='PG사 웹훅 수신 기록 (응답 전에 저장하여, 반영 전에 워커가 종료되어도 다시 반영)';
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `payment_webhook_event`;
+    """
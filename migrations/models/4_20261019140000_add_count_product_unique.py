@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        -- 같은 (product_id, option_id)로 나뉘어 쌓인 재고 행을 가장 먼저 만든 행 하나로 합침
+        UPDATE `count_product` `keep`
+        JOIN (
+            SELECT MIN(`id`) AS `id`, SUM(`count`) AS `total`
+            FROM `count_product`
+            GROUP BY `product_id`, `option_id`
+            HAVING COUNT(*) > 1
+        ) `merged` ON `merged`.`id` = `keep`.`id`
+        SET `keep`.`count` = `merged`.`total`;
+        DELETE `duplicate` FROM `count_product` `duplicate`
+        JOIN `count_product` `keep`
+          ON `keep`.`product_id` = `duplicate`.`product_id`
+         AND `keep`.`option_id` = `duplicate`.`option_id`
+         AND `keep`.`id` < `duplicate`.`id`;
+        ALTER TABLE `count_product` ADD UNIQUE INDEX `uid_count_produ_product_3e8fb7` (`product_id`, `option_id`);
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `count_product` DROP INDEX `uid_count_produ_product_3e8fb7`;
+    """
@@ -0,0 +1,26 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `option` ADD `stock` INT NOT NULL  DEFAULT 0;
+        ALTER TABLE `product` ADD `total_stock` INT NOT NULL  DEFAULT 0;
+        -- 기존 재고를 count_product 합계로 채움
+        UPDATE `option` `o`
+        JOIN (
+            SELECT `option_id`, SUM(`count`) AS `total` FROM `count_product` GROUP BY `option_id`
+        ) `cp` ON `cp`.`option_id` = `o`.`id`
+        SET `o`.`stock` = `cp`.`total`;
+        UPDATE `product` `p`
+        JOIN (
+            SELECT `product_id`, SUM(`count`) AS `total` FROM `count_product` GROUP BY `product_id`
+        ) `cp` ON `cp`.`product_id` = `p`.`id`
+        SET `p`.`total_stock` = `cp`.`total`;
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `option` DROP COLUMN `stock`;
+        ALTER TABLE `product` DROP COLUMN `total_stock`;
+    """
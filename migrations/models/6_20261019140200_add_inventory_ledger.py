@@ -0,0 +1,42 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `inventory_movement` (
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `product_id` INT NOT NULL,
+    `option_id` INT NOT NULL,
+    `delta` INT NOT NULL,
+    `reason` VARCHAR(20) NOT NULL  COMMENT 'INITIAL: initial\nSYNC: sync\nORDER: order\nRELEASE: release\nFLASH_SALE: flash_sale',
+    `reference` VARCHAR(100),
+    KEY `idx_inventory_m_option__351d6a` (`option_id`, `id`),
+    KEY `idx_inventory_m_created_0d13ac` (`created_at`)
+) CHARACTER SET utf8mb4 COMMENT='재고 변동 원장 (추가만 하고 수정/삭제하지 않음)';
+        CREATE TABLE IF NOT EXISTS `inventory_snapshot` (
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `product_id` INT NOT NULL,
+    `option_id` INT NOT NULL,
+    `quantity` INT NOT NULL,
+    `last_movement_id` BIGINT NOT NULL,
+    UNIQUE KEY `uid_inventory_s_option__9bf2f2` (`option_id`, `last_movement_id`),
+    KEY `idx_inventory_s_last_mo_0eb785` (`last_movement_id`)
+) CHARACTER SET utf8mb4 COMMENT='옵션별 재고 스냅샷: last_movement_id까지의 원장 합계 (created_at이 스냅샷 시각)';
+        -- 기존 재고를 원장의 기준값(INITIAL)으로 기록 (원장 이력이 없는 옵션만)
+        INSERT INTO `inventory_movement` (`product_id`, `option_id`, `delta`, `reason`, `reference`)
+        SELECT `cp`.`product_id`, `cp`.`option_id`, `cp`.`count`, 'initial', 'backfill'
+        FROM `count_product` `cp`
+        WHERE `cp`.`count` <> 0
+          AND NOT EXISTS (SELECT 1 FROM `inventory_movement` `m` WHERE `m`.`option_id` = `cp`.`option_id`);
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `inventory_snapshot`;
+        DROP TABLE IF EXISTS `inventory_movement`;
+    """
@@ -0,0 +1,25 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `stock_hold` (
+    `created_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL  DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `order_id` INT NOT NULL,
+    `product_id` INT NOT NULL,
+    `option_id` INT NOT NULL,
+    `quantity` INT NOT NULL,
+    `status` VARCHAR(20) NOT NULL  COMMENT 'HELD: held\nCONVERTED: converted\nRELEASED: released' DEFAULT 'held',
+    `expires_at` DATETIME(6) NOT NULL,
+    KEY `idx_stock_hold_order_i_bef02f` (`order_id`),
+    KEY `idx_stock_hold_status_834726` (`status`, `expires_at`)
+) CHARACTER SET utf8mb4 COMMENT='주문 ~ 결제 승인 사이의 재고 점유 (expires_at이 지나면 스위퍼가 재고 복원)';
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `stock_hold`;
+    """
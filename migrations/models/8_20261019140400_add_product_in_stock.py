@@ -0,0 +1,16 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `product` ADD `in_stock` BOOL NOT NULL  DEFAULT 0;
+        UPDATE `product` SET `in_stock` = (`total_stock` > 0);
+        ALTER TABLE `product` ADD INDEX `idx_product_status_e0b395` (`status`, `in_stock`, `created_at`);
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `product` DROP INDEX `idx_product_status_e0b395`;
+        ALTER TABLE `product` DROP COLUMN `in_stock`;
+    """
@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `product` ADD `sale_price` DECIMAL(10,2) NOT NULL  DEFAULT 0;
+        -- Product.calculate_sale_price와 같은 계산으로 기존 상품을 채움
+        UPDATE `product` SET `sale_price` = ROUND(CASE WHEN `discount_option` = 'amount'
+            THEN CASE WHEN `price` - `discount` > 0 THEN `price` - `discount` ELSE 0 END
+            ELSE CASE WHEN 100 - `discount` > 0 THEN `price` * (100 - `discount`) / 100.0 ELSE 0 END END, 2);
+        ALTER TABLE `product` ADD INDEX `idx_product_sale_pr_55a553` (`sale_price`);
+    """
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `product` DROP INDEX `idx_product_sale_pr_55a553`;
+        ALTER TABLE `product` DROP COLUMN `sale_price`;
+    """
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, File, Form, Path, Query, UploadFile
 from app.banner.dtos.request import BannerCreateRequest, BannerUpdateRequest
 from app.banner.dtos.response import BannerListResponse, BannerResponse
 from app.banner.services.banner_service import BannerService
+from common.utils.http_cache import cache_control
 from common.utils.pagination_and_sorting_dto import PaginationAndSortingDTO
 
 router = APIRouter(prefix="/banners", tags=["배너"], redirect_slashes=False)
@@ -14,6 +15,7 @@ router = APIRouter(prefix="/banners", tags=["배너"], redirect_slashes=False)
     summary="배너 목록 조회",
     description="배너 또는 프로모션 목록을 페이지네이션하여 조회합니다.",
 )
+@cache_control(max_age=300, stale_while_revalidate=600)
 async def get_banners(
     query: str | None = Query(
         None,
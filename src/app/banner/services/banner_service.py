@@ -4,9 +4,7 @@ from typing import Any, Optional
 from uuid import uuid4
 
 from fastapi import HTTPException, UploadFile
-from PIL import Image
 from tortoise.expressions import F
-from tortoise.transactions import atomic
 
 from app.banner.dtos.request import BannerCreateRequest, BannerUpdateRequest
 from app.banner.dtos.response import BannerListResponse, BannerResponse
@@ -14,6 +12,7 @@ from app.banner.models.banner import Banner
 from common.utils.ncp_s3_client import get_object_storage_client
 from common.utils.pagination_and_sorting_dto import PaginationAndSortingDTO
 from core.configs import settings
+from core.database.db_router import read_replica, write_atomic
 
 
 class BannerService:
@@ -23,6 +22,7 @@ class BannerService:
     # IMAGE_SIZE = (1920, 1080)
 
     @classmethod
+    @read_replica
     async def get_banners(
         cls,
         query_type: str | None = None,
@@ -115,6 +115,8 @@ class BannerService:
             unique_id = str(uuid4())[:8]
             filename = f"banner_{timestamp}_{unique_id}.jpg"
 
+            from PIL import Image  # 워커 부팅 시간을 줄이기 위해 실제로 사용할 때 import
+
             with Image.open(image.file) as img:
                 img = img.convert("RGB")
                 buffer = BytesIO()
@@ -147,7 +149,7 @@ class BannerService:
             raise HTTPException(status_code=400, detail="JPG 형식의 이미지만 업로드 가능합니다")
 
     @classmethod
-    @atomic()
+    @write_atomic
     async def create_banner(cls, request: BannerCreateRequest, image: UploadFile) -> BannerResponse:
         """새로운 배너를 생성하고 이미지 업로드"""
         cls._validate_image(image)
@@ -167,7 +169,7 @@ class BannerService:
         return BannerResponse.from_banner(banner)
 
     @classmethod
-    @atomic()
+    @write_atomic
     async def update_banner(
         cls,
         banner_id: int,
@@ -203,7 +205,7 @@ class BannerService:
         return BannerResponse.from_banner(banner)
 
     @classmethod
-    @atomic()
+    @write_atomic
     async def toggle_banner_status(cls, banner_id: int) -> BannerResponse:
         """배너의 활성화 상태를 전환 (활성화↔비활성화)"""
         banner = await Banner.get_or_none(id=banner_id)
@@ -215,7 +217,7 @@ class BannerService:
         return BannerResponse.from_banner(banner)
 
     @classmethod
-    @atomic()
+    @write_atomic
     async def delete_banner(cls, banner_id: int) -> bool:
         """배너와 관련 이미지를 삭제하고 순서 재조정"""
         banner = await Banner.get_or_none(id=banner_id)
@@ -4,6 +4,7 @@ from app.cart.dtos.cart_request import CartItemAddRequest, CartItemRequest
 from app.cart.dtos.cart_response import CartItemResponse, CartResponse
 from app.cart.services.cart_services import CartService
 from app.user.services.auth_service import AuthenticateService
+from common.utils.json_response import ModelJSONResponse
 
 router = APIRouter(prefix="/cart", tags=["Cart"])
 
@@ -11,11 +12,11 @@ router = APIRouter(prefix="/cart", tags=["Cart"])
 @router.get("/", response_model=CartResponse, summary="장바구니 조회")
 async def get_cart(
     user_id: int = Depends(AuthenticateService().get_user_id),
-) -> CartResponse:
+) -> ModelJSONResponse:
     """
     유저의 장바구니를 조회합니다.
     """
-    return await CartService.get_cart(user_id)
+    return ModelJSONResponse(await CartService.get_cart(user_id))
 
 
 @router.post("/", response_model=CartItemResponse, summary="장바구니에 상품 추가")
@@ -5,7 +5,7 @@ from tortoise.exceptions import DoesNotExist
 
 from app.cart.dtos.cart_response import CartItemResponse, CartResponse
 from app.cart.models.cart import Cart
-from app.product.models.product import CountProduct, Option
+from app.product.models.product import Option
 
 
 class CartService:
@@ -14,15 +14,6 @@ class CartService:
         # 해당 유저의 모든 장바구니 가져오기 (product, option 관계 포함)
         cart = await Cart.filter(user_id=user_id).prefetch_related("product", "option", "option__images").all()
 
-        # option_id와 product_id 추출
-        option_ids = [item.option_id for item in cart]  # type: ignore
-        product_ids = [item.product_id for item in cart]  # type: ignore
-
-        # count_product 가져오기
-        stock = await CountProduct.filter(option_id__in=option_ids, product_id__in=product_ids).all()
-
-        count_product_map = {(cp.product_id, cp.option_id): cp.count for cp in stock}  # type: ignore
-
         # 장바구니가 없다면
         if not cart:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cart does not exist")
@@ -40,7 +31,7 @@ class CartService:
                 product_color=item.option.color,
                 product_size=item.option.size,
                 product_amount=item.product_count,
-                product_stock=count_product_map.get((item.product_id, item.option_id), 0),  # type: ignore
+                product_stock=item.option.stock,
                 origin_price=item.product.origin_price,
                 price=float(item.product.price),
                 discount=item.product.discount,
@@ -136,8 +127,8 @@ class CartService:
     @staticmethod
     async def update_cart(user_id: int, product_id: int, option_id: int, product_count: int) -> CartItemResponse:
         # Option과 재고를 조회
-        stock = await CountProduct.filter(option_id=option_id, product_id=product_id).first()
-        if not stock or product_count > stock.count:
+        option = await Option.get_or_none(id=option_id, product_id=product_id)
+        if not option or product_count > option.stock:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Requested quantity exceeds available stock.",
@@ -169,7 +160,7 @@ class CartService:
             product_color=user_cart.option.color,
             product_size=user_cart.option.size,
             product_amount=user_cart.product_count,
-            product_stock=stock.count,
+            product_stock=option.stock,
             origin_price=user_cart.product.origin_price,
             price=float(user_cart.product.price),
             discount=user_cart.product.discount,
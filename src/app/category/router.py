@@ -6,11 +6,13 @@ from fastapi import APIRouter, Path, Query
 from app.category.dtos.category_request import CategoryCreateRequest, CategoryCreateTreeRequest, CategoryUpdateRequest
 from app.category.dtos.category_response import CategoryResponse, CategoryTreeResponse
 from app.category.services.category_services import CategoryService
+from common.utils.http_cache import cache_control
 
 router = APIRouter(prefix="/category", tags=["카테고리"])
 
 
 @router.get("", response_model=List[CategoryResponse], summary="카테고리 목록 조회")
+@cache_control(max_age=300, stale_while_revalidate=3600)
 async def get_categories(
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(10, ge=1, le=100, description="페이지당 항목 수"),
@@ -20,6 +22,7 @@ async def get_categories(
 
 
 @router.get("/{category_id}", response_model=CategoryResponse, summary="카테고리 상세 조회")
+@cache_control(max_age=300, stale_while_revalidate=3600)
 async def get_category(category_id: int = Path(..., description="카테고리 ID")) -> CategoryResponse:
     return await CategoryService.get_category_detail(category_id)
 
@@ -16,16 +16,19 @@ from app.category.dtos.category_response import (
     CategoryWithSubcategoriesResponse,
 )
 from app.category.models.category import Category
+from core.database.db_router import read_replica
 
 
 class CategoryService:
     @staticmethod
+    @read_replica
     async def get_categories(page: int, limit: int, parent_id: Optional[int] = None) -> List[CategoryResponse]:
         skip = (page - 1) * limit
         categories = await Category.filter(parent_id=parent_id if parent_id else None).offset(skip).limit(limit)
         return [CategoryResponse.model_validate(category, from_attributes=True) for category in categories]
 
     @staticmethod
+    @read_replica
     async def get_category_detail(category_id: int) -> CategoryResponse:
         category = await Category.get_or_none(id=category_id)
         if not category:
@@ -120,10 +123,12 @@ class CategoryService:
         await category.delete()
 
     @staticmethod
+    @read_replica
     async def get_category_and_subcategories(category_id: int) -> list[tuple[Any, ...]]:
         return await Category.filter(Q(id=category_id) | Q(parent_id=category_id)).values_list("id", flat=True)
 
     @staticmethod
+    @read_replica
     async def get_category_with_ancestors(category_id: int) -> dict[str, Any]:
         category = await Category.get_or_none(id=category_id)
         if not category:
@@ -82,6 +82,10 @@ class PurchaseOrderRequest(BaseModel):
     status: str = Field("CONFIRMED", description="발주 상태")
 
 
+class BatchPurchaseOrderRequest(BaseModel):
+    order_ids: List[int] = Field(..., min_length=1, max_length=1000, description="발주 확인할 주문 ID 목록")
+
+
 class UpdateOrderStatusRequest(BaseModel):
     order_id: int = Field(..., description="주문 ID")
     status: str = Field(..., description="변경할 상태")
@@ -116,6 +116,31 @@ class PurchaseOrderResponse(BaseModel):
     stock_check: StockCheckResponse
 
 
+class PurchaseOrderStockCheck(StockCheckResponse):
+    order_id: int
+    order_product_id: int
+
+
+class BatchPurchaseOrderResponse(BaseModel):
+    confirmed_count: int
+    pending_count: int
+    stock_checks: List[PurchaseOrderStockCheck]
+
+
+class ShippingImportFailure(BaseModel):
+    row: int  # 요청 목록/CSV 데이터 행 번호 (1부터)
+    order_id: Optional[int] = None
+    reason: str  # invalid, not_found, duplicate
+    message: Optional[str] = None
+
+
+class ShippingImportResponse(BaseModel):
+    total_count: int
+    updated_count: int
+    failed_count: int
+    failures: List[ShippingImportFailure]  # 반영되지 않은 행만 포함
+
+
 class PaginatedOrderResponse(BaseModel):
     orders: List[OrderResponse]  # 주문 목록
     total: int  # 총 주문 수
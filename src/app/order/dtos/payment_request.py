@@ -26,3 +26,18 @@ class PaymentApproveRequestDTO(BaseModel):
 
     payment_id: str = Field(..., description="가맹점 거래 고유번호")
     tx_id: str = Field(..., description="포트원 거래 고유번호")
+
+
+class BatchPaymentApproveRequestDTO(BaseModel):
+    """결제 일괄 승인 요청 DTO"""
+
+    payments: list[PaymentApproveRequestDTO] = Field(..., min_length=1, max_length=1000, description="승인할 결제 목록")
+
+
+class PaymentWebhookRequestDTO(BaseModel):
+    """결제 웹훅 요청 DTO"""
+
+    imp_uid: str = Field(..., description="포트원 거래 고유번호")
+    merchant_uid: str = Field(..., description="가맹점 거래 고유번호")
+    status: str = Field(..., description="결제 상태 (paid, failed, cancelled)")
+    fail_reason: Optional[str] = Field(None, description="결제 실패 사유")
@@ -9,3 +9,26 @@ class PaymentReserveResponseDTO(BaseModel):
     @classmethod
     async def build(cls, payment_id: str) -> "PaymentReserveResponseDTO":
         return cls(payment_id=payment_id)
+
+
+class BatchPaymentApproveResponseDTO(BaseModel):
+    """결제 일괄 승인 응답 DTO"""
+
+    approved_count: int = Field(..., description="승인된 결제 수")
+    approved: list[str] = Field(..., description="승인된 결제 ID 목록")
+    not_found: list[str] = Field(..., description="존재하지 않는 결제 ID 목록")
+    rejected: list[str] = Field(default_factory=list, description="예약 상태가 아니어서 승인하지 않은 결제 ID 목록")
+
+    @classmethod
+    def build(cls, approved: list[str], not_found: list[str], rejected: list[str]) -> "BatchPaymentApproveResponseDTO":
+        return cls(approved_count=len(approved), approved=approved, not_found=not_found, rejected=rejected)
+
+
+class PaymentWebhookResponseDTO(BaseModel):
+    """결제 웹훅 수신 응답 DTO"""
+
+    status: str = Field(..., description="수신 결과 (accepted, duplicate)")
+
+    @classmethod
+    def build(cls, status: str) -> "PaymentWebhookResponseDTO":
+        return cls(status=status)
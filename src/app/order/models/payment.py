@@ -27,6 +27,22 @@ class NonUserPayment(BaseModel):
         table = "non_user_payment"
 
 
+class PaymentWebhookEvent(BaseModel):
+    """PG사 웹훅 수신 기록 (응답 전에 저장하여, 반영 전에 워커가 종료되어도 다시 반영)"""
+
+    id = fields.BigIntField(pk=True)
+    imp_uid = fields.CharField(max_length=255)
+    merchant_uid = fields.CharField(max_length=255)
+    status = fields.CharField(max_length=50)
+    fail_reason = fields.TextField(null=True)
+    applied_at = fields.DatetimeField(null=True)
+
+    class Meta:
+        table = "payment_webhook_event"
+        unique_together = (("imp_uid", "status"),)
+        indexes = (("applied_at", "created_at"),)
+
+
 # class UserPayment(BaseModel):
 #     pass
 
@@ -62,6 +78,7 @@ class PaymentStatus(StrEnum):
     PAID = "paid"  # 결제 완료 상태 (덕배 Step 3)
     FAILED = "failed"  # 결제 실패
     CANCELLED = "cancelled"  # 결제 취소
+    REFUND_REQUIRED = "refund_required"  # 결제 완료 후 재고를 확보하지 못해 취소/환불이 필요한 상태
 
 
 class PaymentType(StrEnum):
@@ -2,10 +2,11 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Union
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Path, Query, UploadFile
 
 from app.order.dtos.order_request import (
     BatchOrderStatusRequest,
+    BatchPurchaseOrderRequest,
     BatchUpdatePurchaseStatusRequest,
     BatchUpdateShippingStatusRequest,
     BulkUpdateShippingRequest,
@@ -22,16 +23,20 @@ from app.order.dtos.order_request import (
     UpdateShippingRequest,
 )
 from app.order.dtos.order_response import (
+    BatchPurchaseOrderResponse,
     BatchUpdateStatusResponse,
     OrderResponse,
     OrderSearchResponse,
     OrderStatisticsResponse,
     PurchaseOrderResponse,
+    ShippingImportResponse,
     ShippingStatusResponse,
     StockCheckResponse,
     UpdateOrderStatusResponse,
 )
 from app.order.services.order_services import OrderService
+from app.order.services.shipping_import_service import ShippingImportService
+from common.utils.json_response import ModelJSONResponse
 
 
 class OrderStatus(Enum):
@@ -148,8 +153,8 @@ async def update_shipping_info(
 @router.get("/search", response_model=OrderSearchResponse, summary="주문 상세 검색")
 async def search_orders(
     params: OrderSearchRequest = Depends(),  # 여기서 OrderSearchRequest를 의존성으로 사용
-) -> OrderSearchResponse:
-    return await OrderService.advanced_search(params)
+) -> ModelJSONResponse:
+    return ModelJSONResponse(await OrderService.advanced_search(params))
 
 
 @router.put(
@@ -181,6 +186,22 @@ async def update_purchase_order(
     return PurchaseOrderResponse(order=order_response, stock_check=stock_check)
 
 
+@router.post(
+    "/purchase/batch",
+    response_model=BatchPurchaseOrderResponse,
+    summary="발주 일괄 확인",
+    description="""
+    여러 주문의 모든 상품에 대해 한 번에 발주를 확인하고 재고를 차감합니다.
+    - 주문 ID, 상품 순서대로 재고를 배정하며 재고가 부족한 상품만 PENDING으로 설정
+    - 이미 CONFIRMED인 상품은 다시 차감하지 않습니다.
+    """,
+)
+async def batch_update_purchase_orders(
+    request: BatchPurchaseOrderRequest = Body(..., description="발주 일괄 확인 요청")
+) -> BatchPurchaseOrderResponse:
+    return await OrderService.batch_update_purchase_orders(request)
+
+
 @router.get("/statistics", response_model=OrderStatisticsResponse, summary="주문 통계")
 async def get_order_statistics() -> OrderStatisticsResponse:
     return await OrderService.get_order_statistics()
@@ -239,22 +260,45 @@ async def seller_cancel(request: SellerCancelRequest = Body(...)) -> OrderRespon
 
 
 @router.put("/bulk-shipping", response_model=List[ShippingStatusResponse])
-async def bulk_update_shipping_info(request: BulkUpdateShippingRequest = Body(...)) -> List[ShippingStatusResponse]:
-    responses = []
-    for shipping_request in request.order_products:
-        response = await OrderService.update_shipping_info(shipping_request)
-        responses.append(response)
-    return responses
+async def bulk_update_shipping_info(request: BulkUpdateShippingRequest = Body(...)) -> ModelJSONResponse:
+    return ModelJSONResponse(await ShippingImportService.import_rows_or_404(request.order_products))
+
+
+@router.post(
+    "/bulk-shipping/import",
+    response_model=ShippingImportResponse,
+    summary="송장 일괄 등록",
+    description="택배사 송장 목록을 한 번에 반영하고, 반영되지 않은 행만 행 번호와 사유(invalid/not_found/duplicate)로 반환합니다.",
+)
+async def import_shipping_info(request: BulkUpdateShippingRequest = Body(...)) -> ShippingImportResponse:
+    return await ShippingImportService.import_rows(request.order_products)
+
+
+@router.post(
+    "/bulk-shipping/import/csv",
+    response_model=ShippingImportResponse,
+    summary="송장 CSV 일괄 등록",
+    description="""
+        택배사 CSV 파일(UTF-8)을 읽어 송장을 반영합니다.
+        - 헤더: order_id(주문번호), courier(택배사), tracking_number(운송장번호), shipping_status(배송상태, 선택)
+        - 배송상태가 없으면 shipping_status 값 사용
+    """,
+)
+async def import_shipping_info_csv(
+    file: UploadFile = File(..., description="택배사 송장 CSV"),
+    shipping_status: str = Form("SHIPPING", description="CSV에 배송 상태가 없을 때 사용할 상태"),
+) -> ShippingImportResponse:
+    return await ShippingImportService.import_csv(file, default_shipping_status=shipping_status)
 
 
 @router.put("/batch-shipping-status", response_model=List[OrderResponse])
-async def batch_update_shipping_status(request: BatchUpdateShippingStatusRequest = Body(...)) -> List[OrderResponse]:
-    return await OrderService.batch_update_shipping_status(request)
+async def batch_update_shipping_status(request: BatchUpdateShippingStatusRequest = Body(...)) -> ModelJSONResponse:
+    return ModelJSONResponse(await OrderService.batch_update_shipping_status(request))
 
 
 @router.get("/page/{page_type}", response_model=List[OrderResponse])
-async def get_orders_by_page_type(page_type: PageType) -> List[OrderResponse]:
-    return await OrderService.get_orders_by_page_type(page_type)
+async def get_orders_by_page_type(page_type: PageType) -> ModelJSONResponse:
+    return ModelJSONResponse(await OrderService.get_orders_by_page_type(page_type))
 
 
 # 전체 주문의 리스트 조회
@@ -1,10 +1,19 @@
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request
 
-from app.order.dtos.payment_request import PaymentApproveRequestDTO, PaymentReserveRequestDTO
-from app.order.dtos.payment_response import PaymentReserveResponseDTO
+from app.order.dtos.payment_request import (
+    BatchPaymentApproveRequestDTO,
+    PaymentApproveRequestDTO,
+    PaymentReserveRequestDTO,
+)
+from app.order.dtos.payment_response import (
+    BatchPaymentApproveResponseDTO,
+    PaymentReserveResponseDTO,
+    PaymentWebhookResponseDTO,
+)
 from app.order.services.payment_service import PaymentService
+from app.order.services.payment_webhook_service import PaymentWebhookService
 
 router = APIRouter(prefix="/payments", tags=["비회원/회원_결제"])
 
@@ -28,3 +37,38 @@ async def approve_payment(
 ) -> None:
     """Step 3: 결제 승인"""
     await payment_service.approve_payment(payment_data=request)
+
+
+@router.post(
+    "/approve/batch",
+    response_model=BatchPaymentApproveResponseDTO,
+    summary="결제 일괄 승인",
+    description=(
+        "여러 결제를 한 트랜잭션에서 승인합니다. 존재하지 않는 결제 ID는 not_found로, "
+        "예약 상태가 아닌(취소/실패/이미 승인) 결제 ID는 rejected로 반환됩니다."
+    ),
+)
+async def approve_payments(
+    request: BatchPaymentApproveRequestDTO,
+    payment_service: PaymentService = Depends(),
+) -> BatchPaymentApproveResponseDTO:
+    return await payment_service.approve_payments(payments_data=request.payments)
+
+
+@router.post(
+    "/webhook",
+    response_model=PaymentWebhookResponseDTO,
+    summary="결제 웹훅 수신",
+    description="""
+    PG사 결제 웹훅을 수신합니다.
+    - X-Webhook-Signature 헤더의 HMAC-SHA256 시그니처를 먼저 검증
+    - (imp_uid, status) 기준으로 중복 웹훅은 무시
+    - 상태 반영은 백그라운드 컨슈머가 배치로 처리하며 요청은 즉시 응답
+    """,
+)
+async def receive_payment_webhook(
+    request: Request,
+    signature: Optional[str] = Header(None, alias="X-Webhook-Signature"),
+    webhook_service: PaymentWebhookService = Depends(),
+) -> PaymentWebhookResponseDTO:
+    return await webhook_service.ingest(payload=await request.body(), signature=signature)
@@ -1,13 +1,13 @@
-import asyncio
 import uuid
 from decimal import Decimal
 from typing import Dict, List
 
 from fastapi import HTTPException
-from tortoise.expressions import F
+from tortoise.expressions import Q
 
 from app.order.dtos.order_request import (
     BatchOrderStatusRequest,
+    BatchPurchaseOrderRequest,
     BatchUpdatePurchaseStatusRequest,
     BatchUpdateShippingStatusRequest,
     CreateOrderRequest,
@@ -22,6 +22,7 @@ from app.order.dtos.order_request import (
     UpdateShippingRequest,
 )
 from app.order.dtos.order_response import (
+    BatchPurchaseOrderResponse,
     BatchUpdateStatusResponse,
     OrderProductResponse,
     OrderResponse,
@@ -29,13 +30,17 @@ from app.order.dtos.order_response import (
     OrderStatisticsResponse,
     PaginatedOrderResponse,
     ProductOptionResponse,
+    PurchaseOrderStockCheck,
     ShippingStatusResponse,
     StockCheckResponse,
     UpdateOrderStatusResponse,
     VerifyOrderOwnerResponse,
 )
 from app.order.models.order import NonUserOrder, NonUserOrderProduct
-from app.product.models.product import CountProduct, Option, Product
+from app.product.models.product import Option, Product
+from app.product.services.stock_hold_service import StockHoldService
+from app.product.services.stock_service import StockAllocation, StockService
+from core.database.db_router import read_replica
 
 PAGE_STATUS_MAP: Dict[PageType, List[str]] = {
     PageType.UNPAID: ["UNPAID"],  # 미결제 상태
@@ -73,13 +78,6 @@ class OrderService:
         options = await Option.get_by_product_ids(product_ids)
         option_map = {(opt.product_id, opt.id): opt for opt in options}  # type: ignore
 
-        # 재고 정보 한 번에 가져오기
-        option_ids = [item.option_id for item in request.products]
-        stocks = await CountProduct.filter(product_id__in=product_ids, option_id__in=option_ids).all()
-
-        # 재고 정보 매핑
-        stock_map = {(stock.product_id, stock.option_id): stock.count for stock in stocks}  # type: ignore
-
         for product_item in request.products:
             # 상품 정보 가져오기 (이미 검증됨)
             product = product_map[product_item.product_id]
@@ -96,8 +94,8 @@ class OrderService:
                     detail=f"Option {product_item.option_id} not found for product {product_item.product_id}",
                 )
 
-            # 재고 확인 (메모리에서 수행)
-            stock = stock_map.get((product_item.product_id, product_item.option_id), 0)
+            # 재고 확인 (option.stock 비정규화 값 사용)
+            stock = option.stock
             if stock < product_item.quantity:
                 raise HTTPException(
                     status_code=400,
@@ -109,37 +107,33 @@ class OrderService:
             total_amount += product_item.price * product_item.quantity
             products_to_order.append((product, option, product_item))
 
-        # 재고 한 번에 업데이트
-        updates = []
-        for product_item in request.products:
-            updates.append(
-                CountProduct.filter(product_id=product_item.product_id, option_id=product_item.option_id).update(
-                    count=F("count") - product_item.quantity
-                )
+        async with StockService.transaction() as connection:
+            # 주문 생성
+            order = await NonUserOrder.create(
+                name=request.name,
+                phone=request.phone,
+                shipping_address=request.shipping_address,
+                detail_address=request.detail_address,
+                request=request.request,
+                current_status=request.current_status,
+                using_db=connection,
             )
 
-        if updates:
-            await asyncio.gather(*updates)
-
-        # 주문 생성
-        order = await NonUserOrder.create(
-            name=request.name,
-            phone=request.phone,
-            shipping_address=request.shipping_address,
-            detail_address=request.detail_address,
-            request=request.request,
-            current_status=request.current_status,
-        )
+            # 주문 상품 생성
+            for product, option, product_item in products_to_order:
+                await NonUserOrderProduct.create(
+                    order=order,
+                    product=product,
+                    option_id=option.id,
+                    quantity=product_item.quantity,
+                    price=product_item.price,
+                    current_status="PENDING",
+                    using_db=connection,
+                )
 
-        # 주문 상품 생성
-        for product, option, product_item in products_to_order:
-            await NonUserOrderProduct.create(
-                order=order,
-                product=product,
-                option_id=option.id,
-                quantity=product_item.quantity,
-                price=product_item.price,
-                current_status="PENDING",
+            # 재고 차감 후 결제 승인 전까지 점유 (동시 주문으로 재고가 부족해지면 주문 전체 롤백)
+            await StockHoldService.hold(
+                order.pk, [(item.product_id, item.option_id, item.quantity) for item in request.products], connection
             )
 
         return await OrderService.get_order(order.pk)
@@ -334,37 +328,26 @@ class OrderService:
         """
         재고 확인 및 업데이트
         """
-        # 해당 상품/옵션의 재고들을 생성일순으로 조회
-        stocks = await CountProduct.filter(product_id=product_id, option_id=option_id).order_by("created_at")
-
-        available_quantity = sum(stock.count for stock in stocks)
-        has_sufficient_stock = available_quantity >= quantity
-
-        message = None
-        if has_sufficient_stock:
-            # FIFO로 재고 차감
-            remaining = quantity
-            for stock in stocks:
-                if stock.count >= remaining:
-                    stock.count -= remaining
-                    await stock.save()
-                    break
-                else:
-                    remaining -= stock.count
-                    stock.count = 0
-                    await stock.save()
+        async with StockService.transaction() as connection:
+            [allocation] = await StockService.allocate([(product_id, option_id, quantity)], connection)
+
+        return StockCheckResponse(**OrderService._stock_check_fields(allocation))
+
+    @staticmethod
+    def _stock_check_fields(allocation: StockAllocation) -> dict[str, object]:
+        if allocation.allocated:
             message = "재고 차감 완료"
         else:
-            message = f"재고 부족 (필요: {quantity}, 현재: {available_quantity})"
-
-        return StockCheckResponse(
-            has_sufficient_stock=has_sufficient_stock,
-            available_quantity=available_quantity,
-            product_id=product_id,
-            option_id=option_id,
-            requested_quantity=quantity,
-            message=message,
-        )
+            message = f"재고 부족 (필요: {allocation.quantity}, 현재: {allocation.available_quantity})"
+
+        return {
+            "has_sufficient_stock": allocation.allocated,
+            "available_quantity": allocation.available_quantity,
+            "product_id": allocation.product_id,
+            "option_id": allocation.option_id,
+            "requested_quantity": allocation.quantity,
+            "message": message,
+        }
 
     @staticmethod
     async def update_purchase_order(request: PurchaseOrderRequest) -> tuple[OrderResponse, StockCheckResponse]:
@@ -375,22 +358,72 @@ class OrderService:
         if not order_product:
             raise HTTPException(status_code=404, detail="Order not found")
 
-        # 재고 확인
-        stock_check = await OrderService.check_and_update_stock(
-            order_product.product_id, order_product.option_id, order_product.quantity  # type: ignore
-        )
+        async with StockService.transaction() as connection:
+            # 재고 확인 및 차감
+            [allocation] = await StockService.allocate(
+                [(order_product.product_id, order_product.option_id, order_product.quantity)],  # type: ignore
+                connection,
+                references=[f"order:{request.order_id}"],
+            )
 
-        # 재고 상태에 따른 발주 상태 설정
-        status = "CONFIRMED" if stock_check.has_sufficient_stock else "PENDING"
+            # 재고 상태에 따른 발주 상태 설정 (재고 차감과 같은 트랜잭션)
+            order_product.procurement_status = "CONFIRMED" if allocation.allocated else "PENDING"
+            await order_product.save(using_db=connection)
 
-        # 발주 정보 업데이트
-        order_product.procurement_status = status
-        await order_product.save()
+        stock_check = StockCheckResponse(**OrderService._stock_check_fields(allocation))
 
         order_response = await OrderService.get_order(request.order_id)
         return order_response, stock_check
 
     @staticmethod
+    async def batch_update_purchase_orders(request: BatchPurchaseOrderRequest) -> BatchPurchaseOrderResponse:
+        """
+        여러 주문의 모든 상품 라인을 한 트랜잭션에서 발주 확인
+        - 주문 ID, 라인 순서(FIFO)대로 재고를 배정하고 부족한 라인만 PENDING
+        - 이미 CONFIRMED인 라인은 다시 차감하지 않음
+        """
+        async with StockService.transaction() as connection:
+            lines = (
+                await NonUserOrderProduct.filter(
+                    Q(procurement_status__isnull=True) | Q(procurement_status__not="CONFIRMED"),
+                    order_id__in=request.order_ids,
+                )
+                .select_for_update()
+                .using_db(connection)
+                .order_by("order_id", "id")
+            )
+            allocations = await StockService.allocate(
+                [(line.product_id, line.option_id, line.quantity) for line in lines],  # type: ignore[attr-defined]
+                connection,
+                references=[f"order:{line.order_id}" for line in lines],  # type: ignore[attr-defined]
+            )
+
+            confirmed_ids = [line.pk for line, allocation in zip(lines, allocations) if allocation.allocated]
+            pending_ids = [line.pk for line, allocation in zip(lines, allocations) if not allocation.allocated]
+            if confirmed_ids:
+                await NonUserOrderProduct.filter(id__in=confirmed_ids).using_db(connection).update(
+                    procurement_status="CONFIRMED"
+                )
+            if pending_ids:
+                await NonUserOrderProduct.filter(id__in=pending_ids).using_db(connection).update(
+                    procurement_status="PENDING"
+                )
+
+        return BatchPurchaseOrderResponse(
+            confirmed_count=len(confirmed_ids),
+            pending_count=len(pending_ids),
+            stock_checks=[
+                PurchaseOrderStockCheck(
+                    order_id=line.order_id,  # type: ignore[attr-defined]
+                    order_product_id=line.pk,
+                    **OrderService._stock_check_fields(allocation),
+                )
+                for line, allocation in zip(lines, allocations)
+            ],
+        )
+
+    @staticmethod
+    @read_replica
     async def get_order_statistics() -> OrderStatisticsResponse:
         total = await NonUserOrder.all().count()
 
@@ -456,6 +489,7 @@ class OrderService:
         return responses
 
     @staticmethod
+    @read_replica
     async def advanced_search(request: OrderSearchRequest) -> OrderSearchResponse:
         query = NonUserOrder.all()
 
@@ -1,12 +1,21 @@
-import asyncio
 import time
 import uuid
 from typing import Any, Optional, Type
 
+from tortoise.backends.base.client import BaseDBAsyncClient
+
 from app.order.dtos.payment_request import PaymentApproveRequestDTO, PaymentReserveRequestDTO
-from app.order.dtos.payment_response import PaymentReserveResponseDTO
+from app.order.dtos.payment_response import BatchPaymentApproveResponseDTO, PaymentReserveResponseDTO
 from app.order.models.order import NonUserOrder, NonUserOrderProduct
 from app.order.models.payment import NonUserPayment, PaymentStatus
+from app.product.services.stock_hold_service import StockHoldService
+from app.product.services.stock_service import StockService
+from common.exceptions.payment_exception import PaymentStatusError
+
+# 결제 승인 시 주문 상품이 전환되는 상태 (발주 대기)
+APPROVED_ORDER_PRODUCT_STATUS = "ITEM_PENDING"
+# 결제 승인 전에 재고 점유가 만료되어 재고를 다시 확보하지 못한 주문 상품 (결제는 REFUND_REQUIRED로 전환)
+OUT_OF_STOCK_ORDER_PRODUCT_STATUS = "OUT_OF_STOCK"
 
 
 class MerchantUIDGenerator:
@@ -31,14 +40,18 @@ class PaymentService:
 
         order = await NonUserOrder.get(id=payment_data.non_user_order_id)
 
-        payment = await payment_model.create(
-            transaction_id=merchant_uid,
-            amount=payment_data.amount,
-            payment_type=payment_data.payment_type,
-            payment_status=PaymentStatus.RESERVED.value,
-            order=order,
-        )
-        await payment.save()
+        async with StockService.transaction() as connection:
+            # 결제가 진행되는 동안 주문 재고 점유가 만료되지 않도록 연장 (이미 만료되었으면 다시 점유, 부족하면 400)
+            await StockHoldService.extend(order.id, connection)
+
+            payment = await payment_model.create(
+                transaction_id=merchant_uid,
+                amount=payment_data.amount,
+                payment_type=payment_data.payment_type,
+                payment_status=PaymentStatus.RESERVED.value,
+                order=order,
+                using_db=connection,
+            )
 
         return await PaymentReserveResponseDTO.build(payment_id=payment.transaction_id)
 
@@ -49,23 +62,79 @@ class PaymentService:
     @staticmethod
     async def approve_payment(payment_data: PaymentApproveRequestDTO) -> None:
         """
-        결제 승인
+        결제 승인 (예약 상태인 결제만, 취소/실패한 결제는 400)
         """
-        payment = await NonUserPayment.get(transaction_id=payment_data.payment_id).prefetch_related(
-            "order__order_product"
-        )
-
-        payment.payment_status = PaymentStatus.PAID.value
-        payment.approval_number = payment_data.tx_id
-
-        tasks = []
+        async with StockService.transaction() as connection:
+            payment = (
+                await NonUserPayment.select_for_update()
+                .using_db(connection)
+                .get(transaction_id=payment_data.payment_id)
+            )
+            if payment.payment_status != PaymentStatus.RESERVED:
+                raise PaymentStatusError(f"승인할 수 없는 결제 상태입니다: {payment.payment_status}")
+
+            await NonUserPayment.filter(id=payment.id).using_db(connection).update(
+                payment_status=PaymentStatus.PAID.value,
+                approval_number=payment_data.tx_id,
+            )
+            await PaymentService.mark_orders_paid([payment.order_id], connection)  # type: ignore[attr-defined]
 
-        if hasattr(payment.order, "order_product"):
-            products = payment.order.order_product
+    @staticmethod
+    async def approve_payments(payments_data: list[PaymentApproveRequestDTO]) -> BatchPaymentApproveResponseDTO:
+        """
+        결제 일괄 승인 (정산 대사용)
+        - 예약 상태가 아닌 결제(취소/실패/이미 승인)는 승인하지 않고 rejected로 반환
+        """
+        tx_id_map = {payment_data.payment_id: payment_data.tx_id for payment_data in payments_data}
+
+        async with StockService.transaction() as connection:
+            locked = (
+                await NonUserPayment.select_for_update()
+                .using_db(connection)
+                .filter(transaction_id__in=list(tx_id_map.keys()))
+            )
+            payments = [payment for payment in locked if payment.payment_status == PaymentStatus.RESERVED]
+            rejected = [
+                payment.transaction_id for payment in locked if payment.payment_status != PaymentStatus.RESERVED
+            ]
+
+            for payment in payments:
+                payment.payment_status = PaymentStatus.PAID.value
+                payment.approval_number = tx_id_map[payment.transaction_id]
+
+            if payments:
+                await NonUserPayment.bulk_update(
+                    payments, fields=["payment_status", "approval_number"], using_db=connection
+                )
+                await PaymentService.mark_orders_paid(
+                    [payment.order_id for payment in payments], connection  # type: ignore[attr-defined]
+                )
+
+        approved = [payment.transaction_id for payment in payments]
+        found_ids = {payment.transaction_id for payment in locked}
+        not_found = [payment_id for payment_id in tx_id_map if payment_id not in found_ids]
+
+        return BatchPaymentApproveResponseDTO.build(approved=approved, not_found=not_found, rejected=rejected)
 
-            for product in products:
-                product.current_status = "ITEM_PENDING"
-                tasks.append(product.save())
+    @staticmethod
+    async def mark_orders_paid(order_ids: list[int], connection: BaseDBAsyncClient) -> None:
+        """
+        결제된 주문의 상품을 발주 대기로 전환하고 재고 점유를 확정
+        - 재고를 다시 확보하지 못한 주문 상품은 OUT_OF_STOCK으로 표시하고, 그 주문의 결제는 REFUND_REQUIRED로 전환
+          (PAID로 남기지 않아 취소/환불 처리 대상으로 조회되도록 함)
+        """
+        await NonUserOrderProduct.filter(order_id__in=order_ids).using_db(connection).update(
+            current_status=APPROVED_ORDER_PRODUCT_STATUS
+        )
 
-        tasks.append(payment.save())
-        await asyncio.gather(*tasks)
+        # 재고 부족은 드문 경우이므로 점유마다 갱신
+        shortages = await StockHoldService.convert(order_ids, connection)
+        for hold in shortages:
+            await NonUserOrderProduct.filter(order_id=hold.order_id, option_id=hold.option_id).using_db(
+                connection
+            ).update(current_status=OUT_OF_STOCK_ORDER_PRODUCT_STATUS)
+
+        if shortages:
+            await NonUserPayment.filter(
+                order_id__in={hold.order_id for hold in shortages}, payment_status=PaymentStatus.PAID
+            ).using_db(connection).update(payment_status=PaymentStatus.REFUND_REQUIRED.value)
@@ -0,0 +1,289 @@
+import asyncio
+import hashlib
+import hmac
+from datetime import timedelta
+from typing import Optional
+
+from fastapi import Depends
+from pydantic import ValidationError
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+from app.order.dtos.payment_request import PaymentWebhookRequestDTO
+from app.order.dtos.payment_response import PaymentWebhookResponseDTO
+from app.order.models.payment import NonUserPayment, PaymentStatus, PaymentWebhookEvent
+from app.order.services.payment_service import PaymentService
+from app.product.services.flash_sale_stock_service import FlashSaleStockService
+from common.exceptions.payment_exception import PaymentValidationError
+from common.utils.cache_services import get_cache_service
+from common.utils.cache_services.cache_service import CacheService
+from common.utils.logger import setup_logger
+from core.configs import settings
+from core.database.db_router import write_connection_name
+
+logger = setup_logger("payment_webhook_logger", settings=settings)
+
+WEBHOOK_IDEMPOTENCY_KEY_PREFIX = "payment-webhook"
+
+# 웹훅으로 허용되는 결제 상태 전이
+VALID_WEBHOOK_TRANSITIONS: dict[str, set[str]] = {
+    PaymentStatus.RESERVED: {PaymentStatus.PAID, PaymentStatus.FAILED, PaymentStatus.CANCELLED},
+    PaymentStatus.CHECKOUT: {PaymentStatus.PAID, PaymentStatus.FAILED, PaymentStatus.CANCELLED},
+    PaymentStatus.PAID: {PaymentStatus.CANCELLED},
+    PaymentStatus.REFUND_REQUIRED: {PaymentStatus.CANCELLED},
+    PaymentStatus.FAILED: {PaymentStatus.PAID},
+}
+
+# 수신 즉시 반영할 웹훅 기록 ID (유실되어도 저장된 기록에서 다시 반영)
+payment_webhook_queue: "asyncio.Queue[int]" = asyncio.Queue(maxsize=settings.PAYMENT_WEBHOOK_QUEUE_MAXSIZE)
+
+
+def _idempotency_key(event: PaymentWebhookRequestDTO) -> str:
+    return f"{WEBHOOK_IDEMPOTENCY_KEY_PREFIX}:{event.imp_uid}:{event.status}"
+
+
+class PaymentWebhookService:
+    def __init__(self, cache_service: CacheService = Depends(get_cache_service)) -> None:
+        self.cache_service = cache_service
+
+    @staticmethod
+    def verify_signature(payload: bytes, signature: Optional[str]) -> None:
+        """요청 원문(raw body)에 대한 HMAC-SHA256 시그니처 검증"""
+        if not signature:
+            raise PaymentValidationError("웹훅 시그니처가 누락되었습니다")
+
+        expected = hmac.new(
+            settings.PAYMENT_WEBHOOK_SECRET.encode("utf-8"),
+            payload,
+            hashlib.sha256,
+        ).hexdigest()
+
+        if not hmac.compare_digest(expected, signature):
+            raise PaymentValidationError("유효하지 않은 웹훅 요청입니다")
+
+    async def ingest(self, payload: bytes, signature: Optional[str]) -> PaymentWebhookResponseDTO:
+        """
+        웹훅 수신: 시그니처 검증 → (imp_uid, status) 중복 제거 → 수신 기록 저장 후 응답
+        상태 반영은 PaymentWebhookConsumer가 배치로 처리 (저장된 기록 기준이므로 워커가 종료되어도 유실되지 않음)
+        """
+        self.verify_signature(payload, signature)
+
+        try:
+            event = PaymentWebhookRequestDTO.model_validate_json(payload)
+        except ValidationError as e:
+            raise PaymentValidationError(f"웹훅 데이터가 유효하지 않습니다: {e.errors()}")
+
+        # Redis 키로 재전송 대부분을 DB 쓰기 없이 거르고, 최종 중복 판단은 (imp_uid, status) 유니크 인덱스
+        key = _idempotency_key(event)
+        is_new = await self.cache_service.set_if_absent(
+            key, "1", ttl_seconds=settings.PAYMENT_WEBHOOK_IDEMPOTENCY_TTL_SECONDS
+        )
+        if not is_new:
+            return PaymentWebhookResponseDTO.build(status="duplicate")
+
+        try:
+            record = await PaymentWebhookEvent.create(
+                imp_uid=event.imp_uid,
+                merchant_uid=event.merchant_uid,
+                status=event.status,
+                fail_reason=event.fail_reason,
+            )
+        except IntegrityError:
+            return PaymentWebhookResponseDTO.build(status="duplicate")
+        except Exception:
+            # 저장하지 못했으면 PG사가 재전송할 수 있도록 중복 키를 해제
+            await self.cache_service.delete(key)
+            raise
+
+        try:
+            payment_webhook_queue.put_nowait(record.id)
+        except asyncio.QueueFull:
+            logger.warning(f"Payment webhook queue is full, event {record.id} will be applied on retry")
+
+        return PaymentWebhookResponseDTO.build(status="accepted")
+
+
+class PaymentWebhookConsumer:
+    def __init__(
+        self,
+        queue: "asyncio.Queue[int]",
+        batch_size: int = settings.PAYMENT_WEBHOOK_BATCH_SIZE,
+        flush_interval: float = settings.PAYMENT_WEBHOOK_FLUSH_INTERVAL_SECONDS,
+        retry_after: int = settings.PAYMENT_WEBHOOK_RETRY_AFTER_SECONDS,
+        retry_window: int = settings.PAYMENT_WEBHOOK_RETRY_WINDOW_SECONDS,
+    ) -> None:
+        self.queue = queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_after = retry_after
+        self.retry_window = retry_window
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # 종료 전 남은 이벤트 반영 (반영하지 못한 이벤트는 다른 워커가 저장된 기록에서 다시 반영)
+        remaining = []
+        while not self.queue.empty():
+            remaining.append(self.queue.get_nowait())
+        if remaining:
+            await self._apply_safely(remaining)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_retry = loop.time()
+        while True:
+            batch = await self._next_batch(timeout=next_retry - loop.time())
+            if batch:
+                await self._apply_safely(batch)
+
+            # 대기열이 계속 차 있어도 retry_after마다 반영되지 않은 채 남은 기록을 다시 반영
+            if loop.time() >= next_retry:
+                await self._retry_pending()
+                next_retry = loop.time() + self.retry_after
+
+    async def _next_batch(self, timeout: float) -> list[int]:
+        if not self.queue.empty():
+            batch = [self.queue.get_nowait()]
+        elif timeout <= 0:
+            return []
+        else:
+            try:
+                batch = [await asyncio.wait_for(self.queue.get(), timeout=timeout)]
+            except asyncio.TimeoutError:
+                return []
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def pending_event_ids(self) -> list[int]:
+        """
+        수신 후 retry_after가 지나도록 반영되지 않은 기록 (워커 종료, 대기열 초과, 반영 실패, 결제 없음, 허용되지 않은 전이)
+        - retry_window가 지난 기록은 더 이상 다시 반영하지 않음 (반영되지 않은 채 남아 조회할 수 있음)
+        """
+        now = timezone.now()
+        events = (
+            await PaymentWebhookEvent.filter(
+                applied_at__isnull=True,
+                created_at__lte=now - timedelta(seconds=self.retry_after),
+                created_at__gt=now - timedelta(seconds=self.retry_window),
+            )
+            .order_by("id")
+            .limit(self.batch_size)
+            .only("id")
+        )
+        return [event.pk for event in events]
+
+    async def _retry_pending(self) -> None:
+        try:
+            event_ids = await self.pending_event_ids()
+        except Exception as e:
+            logger.error(f"Payment webhook retry lookup failed: {str(e)}", exc_info=e)
+            return
+        if event_ids:
+            await self._apply_safely(event_ids)
+
+    async def _apply_safely(self, event_ids: list[int]) -> None:
+        try:
+            await self.apply_batch(event_ids)
+        except Exception as e:
+            # 기록이 남아 있으므로 retry_after 이후 다시 반영
+            logger.error(f"Payment webhook batch failed: {str(e)} | size: {len(event_ids)}", exc_info=e)
+
+    @staticmethod
+    async def apply_batch(event_ids: list[int]) -> None:
+        """
+        결제별 마지막 이벤트만 반영하여 한 트랜잭션으로 상태 전이
+        - 결제 상태와 함께 수신 기록을 반영 완료로 표시 (여러 워커가 같은 기록을 반영하지 않도록 SKIP LOCKED)
+        - 결제가 아직 없거나 지금 허용되지 않는 전이인 결제의 기록은 반영하지 않고 남겨 retry_after 이후 다시 반영
+        """
+        # 결제 승인 중 만료된 재고 점유를 다시 차감할 수 있으므로, 실패하면 한정 판매(Redis) 차감을 되돌림
+        async with FlashSaleStockService.track_deductions() as deductions:
+            try:
+                async with in_transaction(write_connection_name()) as connection:
+                    await PaymentWebhookConsumer._apply_events(event_ids, connection)
+            except BaseException:
+                await FlashSaleStockService.compensate(deductions)
+                raise
+
+    @staticmethod
+    async def _apply_events(event_ids: list[int], connection: BaseDBAsyncClient) -> None:
+        events = (
+            await PaymentWebhookEvent.filter(id__in=event_ids, applied_at__isnull=True)
+            .select_for_update(skip_locked=True)
+            .using_db(connection)
+            .order_by("id")
+        )
+        if not events:
+            return
+
+        latest_events = {event.merchant_uid: event for event in events}
+        payments = await NonUserPayment.filter(transaction_id__in=list(latest_events.keys())).using_db(connection)
+
+        missing = latest_events.keys() - {payment.transaction_id for payment in payments}
+        if missing:
+            logger.warning(f"Payment webhook for unknown payments, will retry: {sorted(missing)}")
+
+        payments_to_update = []
+        paid_order_ids = []
+        applied_merchant_uids = set()
+
+        for payment in payments:
+            event = latest_events[payment.transaction_id]
+            if event.status not in VALID_WEBHOOK_TRANSITIONS.get(payment.payment_status, set()):
+                logger.warning(
+                    f"Deferred payment webhook transition: {payment.payment_status} -> {event.status} "
+                    f"| payment: {payment.transaction_id}"
+                )
+                continue
+
+            applied_merchant_uids.add(payment.transaction_id)
+            payment.payment_status = event.status
+            payment.approval_number = event.imp_uid
+            if event.status == PaymentStatus.FAILED:
+                payment.fail_reason = event.fail_reason or ""
+            payments_to_update.append(payment)
+
+            if event.status == PaymentStatus.PAID:
+                paid_order_ids.append(payment.order_id)  # type: ignore[attr-defined]
+
+        if payments_to_update:
+            await NonUserPayment.bulk_update(
+                payments_to_update, fields=["payment_status", "approval_number", "fail_reason"], using_db=connection
+            )
+        if paid_order_ids:
+            await PaymentService.mark_orders_paid(paid_order_ids, connection)
+
+        applied_event_ids = [event.id for event in events if event.merchant_uid in applied_merchant_uids]
+        if applied_event_ids:
+            await PaymentWebhookEvent.filter(id__in=applied_event_ids).using_db(connection).update(
+                applied_at=timezone.now()
+            )
+
+
+payment_webhook_consumer = PaymentWebhookConsumer(queue=payment_webhook_queue)
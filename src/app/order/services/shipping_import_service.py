@@ -0,0 +1,229 @@
+import csv
+import io
+import itertools
+from datetime import datetime
+from enum import StrEnum
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile, status
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+from app.order.dtos.order_request import UpdateShippingRequest
+from app.order.dtos.order_response import ShippingImportFailure, ShippingImportResponse, ShippingStatusResponse
+from app.order.models.order import NonUserOrderProduct
+from core.database.db_router import write_connection_name
+
+# 한 트랜잭션/UPDATE 문에서 처리할 최대 행 수
+SHIPPING_IMPORT_CHUNK_SIZE = 1000
+
+# 택배사 CSV 헤더 -> UpdateShippingRequest 필드
+CSV_COLUMN_ALIASES = {
+    "order_id": "order_id",
+    "주문번호": "order_id",
+    "courier": "courier",
+    "택배사": "courier",
+    "tracking_number": "tracking_number",
+    "운송장번호": "tracking_number",
+    "shipping_status": "shipping_status",
+    "배송상태": "shipping_status",
+}
+
+# (행 번호, 송장 정보)
+ShippingRow = tuple[int, UpdateShippingRequest]
+
+
+class ShippingImportFailureReason(StrEnum):
+    INVALID = "invalid"  # 필수 값 누락/형식 오류
+    NOT_FOUND = "not_found"  # 없는 주문
+    DUPLICATE = "duplicate"  # 같은 주문이 뒤에 다시 나와 뒤의 행으로 대체
+
+
+class ShippingImportService:
+    """
+    송장(택배사, 운송장 번호, 배송 상태) 일괄 반영
+    - 청크마다 트랜잭션 안에서 주문 존재 확인 SELECT 1번 + 다중 행 CASE UPDATE 1번으로 반영
+    - 반영되지 않은 행만 행 번호와 사유를 돌려줌 (같은 주문이 여러 번 나오면 청크가 달라도 마지막 행만 반영으로 집계)
+    """
+
+    @classmethod
+    async def import_rows(cls, requests: list[UpdateShippingRequest]) -> ShippingImportResponse:
+        applied_rows: dict[int, int] = {}
+        failures: list[ShippingImportFailure] = []
+        rows = list(enumerate(requests, start=1))
+
+        for start in range(0, len(rows), SHIPPING_IMPORT_CHUNK_SIZE):
+            async with in_transaction(write_connection_name()) as connection:
+                applied, chunk_failures = await cls._apply(
+                    rows[start : start + SHIPPING_IMPORT_CHUNK_SIZE], connection, timezone.now()
+                )
+            failures.extend(chunk_failures)
+            cls._record_applied(applied, applied_rows, failures)
+
+        return cls._response(len(rows), len(applied_rows), failures)
+
+    @classmethod
+    async def import_csv(cls, file: UploadFile, default_shipping_status: str) -> ShippingImportResponse:
+        """
+        택배사 CSV(order_id/주문번호, courier/택배사, tracking_number/운송장번호, shipping_status/배송상태)를
+        청크 단위로 읽으며 반영 (배송 상태 컬럼이 없거나 비어 있으면 default_shipping_status)
+        """
+        reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""))
+        total_count = 0
+        applied_rows: dict[int, int] = {}
+        failures: list[ShippingImportFailure] = []
+
+        while chunk := await cls._read_chunk(reader):
+            rows: list[ShippingRow] = []
+            for row_number, record in enumerate(chunk, start=total_count + 1):
+                try:
+                    rows.append((row_number, cls._parse_csv_record(record, default_shipping_status)))
+                except ValidationError as e:
+                    message = ", ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+                    failures.append(cls._failure(row_number, None, ShippingImportFailureReason.INVALID, message))
+            total_count += len(chunk)
+
+            async with in_transaction(write_connection_name()) as connection:
+                applied, chunk_failures = await cls._apply(rows, connection, timezone.now())
+            failures.extend(chunk_failures)
+            cls._record_applied(applied, applied_rows, failures)
+
+        return cls._response(total_count, len(applied_rows), failures)
+
+    @classmethod
+    async def import_rows_or_404(cls, requests: list[UpdateShippingRequest]) -> list[ShippingStatusResponse]:
+        """기존 /bulk-shipping 응답 형태 유지: 없는 주문이 하나라도 있으면 404 (전체 롤백)"""
+        rows = list(enumerate(requests, start=1))
+        responses: list[ShippingStatusResponse] = []
+        now = timezone.now()
+
+        async with in_transaction(write_connection_name()) as connection:
+            for start in range(0, len(rows), SHIPPING_IMPORT_CHUNK_SIZE):
+                applied, failures = await cls._apply(rows[start : start + SHIPPING_IMPORT_CHUNK_SIZE], connection, now)
+                if any(failure.reason == ShippingImportFailureReason.NOT_FOUND for failure in failures):
+                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
+                responses.extend(
+                    ShippingStatusResponse(
+                        status=request.shipping_status,
+                        courier=request.courier,
+                        tracking_number=request.tracking_number,
+                        tracking_url="",
+                        current_location="",
+                        updated_at=now,
+                    )
+                    for _, request in applied
+                )
+
+        return responses
+
+    @staticmethod
+    async def _read_chunk(reader: "csv.DictReader[str]") -> list[dict[str, str]]:
+        # 업로드 파일은 디스크에 스풀될 수 있으므로 읽기는 스레드풀에서
+        try:
+            return await run_in_threadpool(list, itertools.islice(reader, SHIPPING_IMPORT_CHUNK_SIZE))
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"CSV must be UTF-8 encoded (rows before line {reader.line_num} were applied)",
+            )
+
+    @staticmethod
+    def _parse_csv_record(record: dict[str, str], default_shipping_status: str) -> UpdateShippingRequest:
+        # 헤더보다 값이 많은 행은 DictReader가 None 키에 리스트로 담으므로 문자열 값만 사용
+        values = {
+            CSV_COLUMN_ALIASES[key.strip()]: value.strip()
+            for key, value in record.items()
+            if isinstance(key, str) and key.strip() in CSV_COLUMN_ALIASES and isinstance(value, str) and value.strip()
+        }
+        if "order_id" in values:
+            # 주문 검색과 같이 ORD- 접두사가 붙은 주문번호도 허용
+            values["order_id"] = values["order_id"].removeprefix("ORD-")
+        values.setdefault("shipping_status", default_shipping_status)
+        return UpdateShippingRequest.model_validate(values)
+
+    @classmethod
+    async def _apply(
+        cls, rows: list[ShippingRow], connection: BaseDBAsyncClient, now: datetime
+    ) -> tuple[list[ShippingRow], list[ShippingImportFailure]]:
+        """청크 하나를 반영하고 (반영한 행, 반영하지 않은 행) 반환"""
+        failures = []
+
+        # 같은 주문이 여러 번 오면 마지막 행 기준
+        latest: dict[int, ShippingRow] = {}
+        for row_number, request in rows:
+            if request.order_id in latest:
+                failures.append(
+                    cls._failure(latest[request.order_id][0], request.order_id, ShippingImportFailureReason.DUPLICATE)
+                )
+            latest[request.order_id] = (row_number, request)
+
+        order_products = (
+            await NonUserOrderProduct.filter(order_id__in=list(latest)).using_db(connection).only("order_id")
+        )
+        existing: set[int] = {order_product.order_id for order_product in order_products}  # type: ignore[attr-defined]
+        found = [row for order_id, row in latest.items() if order_id in existing]
+        failures.extend(
+            cls._failure(row_number, order_id, ShippingImportFailureReason.NOT_FOUND)
+            for order_id, (row_number, _) in latest.items()
+            if order_id not in existing
+        )
+
+        if found:
+            await cls._update(connection, [request for _, request in found], now)
+
+        return found, failures
+
+    @classmethod
+    def _record_applied(
+        cls, applied: list[ShippingRow], applied_rows: dict[int, int], failures: list[ShippingImportFailure]
+    ) -> None:
+        # 앞선 청크에서 반영한 주문이 다시 나오면 뒤의 행으로 덮어썼으므로 앞의 행을 중복으로 집계
+        for row_number, request in applied:
+            if request.order_id in applied_rows:
+                failures.append(
+                    cls._failure(
+                        applied_rows[request.order_id], request.order_id, ShippingImportFailureReason.DUPLICATE
+                    )
+                )
+            applied_rows[request.order_id] = row_number
+
+    @staticmethod
+    async def _update(db: BaseDBAsyncClient, requests: list[UpdateShippingRequest], now: datetime) -> None:
+        # UPDATE ... SET courier = CASE order_id WHEN ? THEN ? ... END, ... WHERE order_id IN (...)
+        placeholder = "%s" if db.capabilities.dialect == "mysql" else "?"
+        cases = " ".join([f"WHEN {placeholder} THEN {placeholder}"] * len(requests))
+
+        values: list[object] = []
+        for field in ("courier", "tracking_number", "shipping_status"):
+            for request in requests:
+                values.extend([request.order_id, getattr(request, field)])
+
+        await db.execute_query(
+            "UPDATE non_user_order_product SET "
+            f"courier = CASE order_id {cases} END, "
+            f"shipping_id = CASE order_id {cases} END, "
+            f"current_status = CASE order_id {cases} END, "
+            f"updated_at = {placeholder} "
+            f"WHERE order_id IN ({', '.join([placeholder] * len(requests))})",
+            [*values, now, *[request.order_id for request in requests]],
+        )
+
+    @staticmethod
+    def _failure(
+        row: int, order_id: Optional[int], reason: ShippingImportFailureReason, message: Optional[str] = None
+    ) -> ShippingImportFailure:
+        return ShippingImportFailure(row=row, order_id=order_id, reason=reason, message=message)
+
+    @staticmethod
+    def _response(
+        total_count: int, updated_count: int, failures: list[ShippingImportFailure]
+    ) -> ShippingImportResponse:
+        return ShippingImportResponse(
+            total_count=total_count,
+            updated_count=updated_count,
+            failed_count=total_count - updated_count,
+            failures=sorted(failures, key=lambda failure: failure.row),
+        )
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict
 
 from pydantic_settings import BaseSettings
@@ -74,3 +75,9 @@ class PaymentSettings(BaseSettings):
                 "sandbox": self.SANDBOX,
             },
         }
+
+
+@lru_cache
+def get_payment_settings() -> PaymentSettings:
+    """.env를 인스턴스마다 다시 읽지 않도록 프로세스당 한 번만 생성"""
+    return PaymentSettings()
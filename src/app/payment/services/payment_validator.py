@@ -2,13 +2,13 @@ from decimal import Decimal
 from typing import Any, Dict
 
 from app.payment.models.payment import PaymentMethod, PaymentStatus, PaymentType
-from app.payment.services.payment_config import PaymentSettings
+from app.payment.services.payment_config import PaymentSettings, get_payment_settings
 from common.exceptions.payment_exception import PaymentValidationError
 
 
 class PaymentValidator:
     def __init__(self) -> None:
-        self.config: PaymentSettings = PaymentSettings()
+        self.config: PaymentSettings = get_payment_settings()
 
     async def validate_payment_data(self, payment_data: Dict[str, Any]) -> None:
         """결제 데이터 기본 검증"""
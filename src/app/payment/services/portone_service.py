@@ -2,7 +2,7 @@ from typing import Any, Dict, Optional, TypedDict
 
 import httpx
 
-from app.payment.services.payment_config import PaymentSettings
+from app.payment.services.payment_config import PaymentSettings, get_payment_settings
 from common.exceptions.payment_exception import PaymentProcessError
 
 
@@ -14,7 +14,7 @@ class PortoneResponse(TypedDict):
 
 class PortoneService:
     def __init__(self) -> None:
-        self.config: PaymentSettings = PaymentSettings()
+        self.config: PaymentSettings = get_payment_settings()
         self.base_url: str = self.config.PORTONE_BASE_URL
         self.access_token: Optional[str] = None
         self.timeout = httpx.Timeout(30.0)
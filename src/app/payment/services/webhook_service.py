@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any, Dict, Union, cast
 
 from app.payment.models.payment import NonUserPayment, PaymentStatus, UserPayment
-from app.payment.services.payment_config import PaymentSettings
+from app.payment.services.payment_config import PaymentSettings, get_payment_settings
 from app.payment.services.portone_service import PortoneService
 from common.exceptions.payment_exception import PaymentNotFoundError, PaymentValidationError
 
@@ -13,7 +13,7 @@ from common.exceptions.payment_exception import PaymentNotFoundError, PaymentVal
 class WebhookService:
     def __init__(self) -> None:
         self.portone_service: PortoneService = PortoneService()
-        self.config: PaymentSettings = PaymentSettings()
+        self.config: PaymentSettings = get_payment_settings()
 
     async def _verify_webhook_signature(self, webhook_data: Dict[str, Any], signature: str) -> bool:
         """웹훅 시그니처 검증"""
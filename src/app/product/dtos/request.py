@@ -57,6 +57,9 @@ class ProductFilterRequestDTO(BaseModel):
     product_id: Optional[int] = Field(None, description="특정 제품의 ID")
     product_code: Optional[str] = Field(None, description="검색할 제품 코드")
     sale_status: Optional[str] = Field(None, description="판매 상태 (예: available, sold_out 등)")
+    in_stock: Optional[bool] = Field(None, description="구매 가능(재고 있음) 여부")
+    min_price: Optional[float] = Field(None, ge=0, description="최소 할인 적용가")
+    max_price: Optional[float] = Field(None, ge=0, description="최대 할인 적용가")
     category_id: Optional[int] = Field(None, description="카테고리 ID")
     start_date: Optional[datetime] = Field(None, description="검색 시작 날짜 (YYYY-MM-DD 형식)")
     end_date: Optional[datetime] = Field(None, description="검색 종료 날짜 (YYYY-MM-DD 형식)")
@@ -67,6 +70,9 @@ class ProductFilterRequestDTO(BaseModel):
         if self.start_date is not None and self.end_date is not None:
             if self.start_date > self.end_date:
                 raise ValueError("start_date는 end_date보다 빠를 수 없습니다.")
+        if self.min_price is not None and self.max_price is not None:
+            if self.min_price > self.max_price:
+                raise ValueError("min_price는 max_price보다 클 수 없습니다.")
         return self
 
 
@@ -83,6 +89,21 @@ class BatchUpdateStatusRequest(BaseModel):
         }
 
 
+class BatchUpdateDiscountRequest(BaseModel):
+    product_ids: Optional[list[int]] = Field(None, min_length=1, description="대상 상품 ID (없으면 전체 상품)")
+    discount: float = Field(..., ge=0, description="할인율 or 할인금액")
+    discount_option: str = Field(..., pattern=r"^(percent|amount)$")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "product_ids": [1, 2, 3],
+                "discount": 10,
+                "discount_option": "percent",
+            }
+        }
+
+
 class SizeOptionUpdateDTO(SizeOptionDTO):
     id: Optional[int] = None
 
@@ -100,3 +121,19 @@ class ProductWithOptionUpdateRequestDTO(BaseModel):
     product: ProductUpdateDTO
     options: list[OptionUpdateDTO]
     image_mapping: dict[str, list[str]]
+
+
+class StockSyncItemDTO(BaseModel):
+    option_id: int
+    stock: int = Field(..., ge=0)
+
+
+class StockSyncRequestDTO(BaseModel):
+    items: list[StockSyncItemDTO] = Field(..., min_length=1, max_length=10000)
+
+    class Config:
+        json_schema_extra = {"example": {"items": [{"option_id": 1, "stock": 50}, {"option_id": 2, "stock": 0}]}}
+
+
+class FlashSaleStockRequestDTO(BaseModel):
+    option_ids: list[int] = Field(..., min_length=1, max_length=1000)
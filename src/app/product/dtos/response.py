@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -33,11 +36,14 @@ class ProductDTO(BaseModel):
     discount: float
     discount_option: str
     origin_price: float
+    sale_price: float = 0
     description: str
     detail: str
     brand: str
     status: str
     product_code: str
+    total_stock: int = 0
+    in_stock: bool = False
 
     class Config:
         from_attributes = True
@@ -59,3 +65,90 @@ class ProductsResponseDTO(BaseModel):
     @classmethod
     def build(cls, products: list[ProductResponseDTO], total_count: int) -> "ProductsResponseDTO":
         return cls(products=products, total_count=total_count)
+
+
+class ProductSummaryDTO(BaseModel):
+    """목록 그리드용 요약 (설명/상세 TEXT 컬럼과 옵션 트리 제외)"""
+
+    id: int
+    name: str
+    price: float
+    discount: float
+    discount_option: str
+    sale_price: float
+    status: str
+    in_stock: bool
+    thumbnail_url: Optional[str] = None
+
+
+class ProductSummariesResponseDTO(BaseModel):
+    products: list[ProductSummaryDTO]
+    total_count: int
+
+    @classmethod
+    def build(cls, products: list[ProductSummaryDTO], total_count: int) -> "ProductSummariesResponseDTO":
+        return cls(products=products, total_count=total_count)
+
+
+class CategoryFacetDTO(BaseModel):
+    category_id: int
+    count: int
+
+
+class ColorFacetDTO(BaseModel):
+    color: str
+    color_code: str
+    count: int
+
+
+class SizeFacetDTO(BaseModel):
+    size: str
+    count: int
+
+
+class PriceBucketFacetDTO(BaseModel):
+    min_price: int
+    max_price: Optional[int]  # None이면 상한 없음
+    count: int
+
+
+class ProductFacetsResponseDTO(BaseModel):
+    total_count: int
+    categories: list[CategoryFacetDTO]
+    colors: list[ColorFacetDTO]
+    sizes: list[SizeFacetDTO]
+    price_buckets: list[PriceBucketFacetDTO]
+
+
+class StockSyncResponseDTO(BaseModel):
+    updated_count: int
+    missing_option_ids: list[int]
+
+
+class OptionStockDTO(BaseModel):
+    option_id: int
+    stock: int
+
+
+class ProductStockResponseDTO(BaseModel):
+    product_id: int
+    at: Optional[datetime]
+    total_stock: int
+    options: list[OptionStockDTO]
+
+
+class StockMismatchDTO(BaseModel):
+    product_id: int
+    option_id: int
+    ledger_stock: int
+    count_product_stock: int
+    option_stock: int
+
+
+class StockReconciliationResponseDTO(BaseModel):
+    checked_count: int
+    mismatches: list[StockMismatchDTO]
+
+
+class FlashSaleStockResponseDTO(BaseModel):
+    option_ids: list[int]
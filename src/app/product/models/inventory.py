@@ -0,0 +1,79 @@
+from enum import StrEnum
+
+from tortoise import fields
+
+from common.models.base_model import BaseModel
+
+
+class InventoryReason(StrEnum):
+    INITIAL = "initial"  # 상품 등록 시 초기 재고
+    SYNC = "sync"  # 관리자 수정/창고 동기화로 재고를 덮어씀
+    ORDER = "order"  # 주문으로 차감
+    RELEASE = "release"  # 결제되지 않은 주문의 재고 점유 만료로 복원
+    FLASH_SALE = "flash_sale"  # 한정 판매 옵션의 Redis 재고 변동을 모아서 반영
+
+
+class InventoryMovement(BaseModel):
+    """
+    재고 변동 원장 (추가만 하고 수정/삭제하지 않음)
+    옵션/상품이 삭제되어도 이력이 남도록 FK 대신 ID만 저장
+    """
+
+    id = fields.BigIntField(pk=True)
+    product_id = fields.IntField()
+    option_id = fields.IntField()
+    delta = fields.IntField()
+    reason = fields.CharEnumField(InventoryReason, max_length=20)
+    reference = fields.CharField(max_length=100, null=True)  # ex) order:123
+
+    class Meta:
+        table = "inventory_movement"
+        indexes = (("option_id", "id"), ("created_at",))
+
+
+class StockHoldStatus(StrEnum):
+    HELD = "held"  # 주문 시 차감된 재고를 결제 대기 중으로 점유
+    CONVERTED = "converted"  # 결제 승인으로 확정 차감
+    RELEASED = "released"  # 만료되어 재고 복원
+
+
+class StockHold(BaseModel):
+    """주문 ~ 결제 승인 사이의 재고 점유 (expires_at이 지나면 스위퍼가 재고 복원)"""
+
+    id = fields.BigIntField(pk=True)
+    order_id = fields.IntField(index=True)
+    product_id = fields.IntField()
+    option_id = fields.IntField()
+    quantity = fields.IntField()
+    status = fields.CharEnumField(StockHoldStatus, max_length=20, default=StockHoldStatus.HELD)
+    expires_at = fields.DatetimeField()
+
+    class Meta:
+        table = "stock_hold"
+        indexes = (("status", "expires_at"),)
+
+
+class FlashSaleJournalBatch(BaseModel):
+    """MySQL에 반영한 한정 판매 저널 배치 (반영과 같은 트랜잭션에 기록해, Redis ack가 실패해도 다시 반영하지 않음)"""
+
+    id = fields.BigIntField(pk=True)
+    batch_id = fields.CharField(max_length=32, unique=True)
+
+    class Meta:
+        table = "flash_sale_journal_batch"
+        indexes = (("created_at",),)
+
+
+class InventorySnapshot(BaseModel):
+    """옵션별 재고 스냅샷: last_movement_id까지의 원장 합계 (created_at이 스냅샷 시각)"""
+
+    id = fields.BigIntField(pk=True)
+    product_id = fields.IntField()
+    option_id = fields.IntField()
+    quantity = fields.IntField()
+    last_movement_id = fields.BigIntField()
+
+    class Meta:
+        table = "inventory_snapshot"
+        unique_together = (("option_id", "last_movement_id"),)
+        indexes = (("last_movement_id",),)
@@ -1,9 +1,11 @@
+from decimal import ROUND_HALF_UP, Decimal
 from enum import StrEnum
+from typing import Any, Iterable, Optional
 
 from fastapi import HTTPException, status
 from tortoise import fields
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.fields import ReverseRelation
-from tortoise.functions import Sum
 
 from app.category.models.category import CategoryProduct
 from common.models.base_model import BaseModel
@@ -21,22 +23,53 @@ class Product(BaseModel):
     discount = fields.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     discount_option = fields.CharEnumField(DiscountOption, max_length=10, default=DiscountOption.PERCENT)
     origin_price = fields.DecimalField(max_digits=10, decimal_places=2)
+    # 할인 적용가 (비정규화, 저장 시 price/discount/discount_option으로 계산, 일괄 변경은 ProductService.update_pricing)
+    sale_price = fields.DecimalField(max_digits=10, decimal_places=2, default=0.00, index=True)
     description = fields.TextField(null=True)
     detail = fields.TextField(null=True)
     brand = fields.CharField(max_length=255, default="micgolf")
     status = fields.CharField(max_length=1, default="Y")  # Y, N
     product_code = fields.CharField(max_length=255, unique=True)
+    # 옵션 재고 합계 (비정규화, StockService가 재고 변경 시 함께 갱신)
+    total_stock = fields.IntField(default=0)
+    # 구매 가능 여부 (total_stock > 0, StockService가 재고가 0을 넘나들 때만 갱신)
+    in_stock = fields.BooleanField(default=False)
 
     options: ReverseRelation["Option"]
     categories: fields.ReverseRelation["CategoryProduct"]
 
     class Meta:
         table = "product"
+        # 목록 조회의 판매 상태/구매 가능 필터 + 최신순 정렬용
+        indexes = (("status", "in_stock", "created_at"),)
 
     @classmethod
     async def get_by_id(cls, product_id: int) -> "Product":
         return await cls.get(id=product_id)
 
+    @staticmethod
+    def calculate_sale_price(price: Any, discount: Any, discount_option: Optional[str]) -> Decimal:
+        """percent면 discount%를, amount면 discount 금액을 뺀 가격 (0 미만은 0)"""
+        base_price = Decimal(str(price))
+        discount_value = Decimal(str(discount or 0))
+        if discount_option == DiscountOption.AMOUNT:
+            sale_price = base_price - discount_value
+        else:
+            sale_price = base_price * (100 - discount_value) / 100
+        return max(sale_price, Decimal(0)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    async def save(
+        self,
+        using_db: Optional[BaseDBAsyncClient] = None,
+        update_fields: Optional[Iterable[str]] = None,
+        force_create: bool = False,
+        force_update: bool = False,
+    ) -> None:
+        self.sale_price = self.calculate_sale_price(self.price, self.discount, self.discount_option)
+        if update_fields is not None:
+            update_fields = {*update_fields, "sale_price"}
+        await super().save(using_db, update_fields, force_create, force_update)
+
 
 class Option(BaseModel):
     id = fields.IntField(pk=True)
@@ -46,6 +79,8 @@ class Option(BaseModel):
     product: fields.ForeignKeyRelation["Product"] = fields.ForeignKeyField(
         "models.Product", related_name="options", on_delete=fields.CASCADE
     )
+    # count_product 재고 (비정규화, StockService가 재고 변경 시 함께 갱신)
+    stock = fields.IntField(default=0)
     images: ReverseRelation["OptionImage"]
 
     class Meta:
@@ -54,23 +89,15 @@ class Option(BaseModel):
 
     @classmethod
     async def get_with_stock_and_images_by_product_id(cls, product_id: int) -> list["Option"]:
-        return (
-            await cls.filter(product__id=product_id)
-            .annotate(stock=Sum("option_stock__count"))
-            .prefetch_related("images")
-        )
+        return await cls.filter(product__id=product_id).prefetch_related("images")
 
     @classmethod
     async def get_all_with_stock_and_images(cls) -> list["Option"]:
-        return await cls.all().annotate(stock=Sum("option_stock__count")).prefetch_related("images")
+        return await cls.all().prefetch_related("images")
 
     @classmethod
     async def get_by_product_ids(cls, product_ids: list[int]) -> list["Option"]:
-        return (
-            await cls.filter(product__id__in=product_ids)
-            .annotate(stock=Sum("option_stock__count"))
-            .prefetch_related("images")
-        )
+        return await cls.filter(product__id__in=product_ids).prefetch_related("images")
 
     @classmethod
     async def get_option_with_stock(cls, product_id: int, color: str, size: str) -> tuple["Option", int]:
@@ -84,15 +111,7 @@ class Option(BaseModel):
                 detail="The specified option does not exist.",
             )
 
-        # 재고 확인
-        stock = await CountProduct.filter(product_id=product_id, option_id=option.id).first()
-        if not stock:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Stock information is not available for this option.",
-            )
-
-        return option, stock.count
+        return option, option.stock
 
 
 class OptionImage(BaseModel):
@@ -118,3 +137,4 @@ class CountProduct(BaseModel):
 
     class Meta:
         table = "count_product"
+        unique_together = (("product", "option"),)
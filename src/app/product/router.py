@@ -1,26 +1,60 @@
 import json
+from datetime import datetime
+from typing import Optional, Union
 
-from fastapi import APIRouter, Body, Depends, File, Path, UploadFile, status
+from fastapi import APIRouter, Body, Depends, File, Path, Query, UploadFile, status
 
 from app.product.dtos.request import (
+    BatchUpdateDiscountRequest,
     BatchUpdateStatusRequest,
+    FlashSaleStockRequestDTO,
     ProductFilterRequestDTO,
     ProductWithOptionCreateRequestDTO,
     ProductWithOptionUpdateRequestDTO,
+    StockSyncRequestDTO,
+)
+from app.product.dtos.response import (
+    FlashSaleStockResponseDTO,
+    ProductFacetsResponseDTO,
+    ProductResponseDTO,
+    ProductsResponseDTO,
+    ProductStockResponseDTO,
+    ProductSummariesResponseDTO,
+    StockReconciliationResponseDTO,
+    StockSyncResponseDTO,
 )
-from app.product.dtos.response import ProductResponseDTO, ProductsResponseDTO
 from app.product.example_schema.create_request_example import (
     PRODUCT_CREATE_DESCRIPTION,
     PRODUCT_CREATE_REQUEST_EXAMPLE_SCHEMA,
     PRODUCT_UPDATE_REQUEST_EXAMPLE_SCHEMA,
 )
+from app.product.services.flash_sale_stock_service import FlashSaleStockService
+from app.product.services.inventory_ledger_service import InventoryLedgerService
+from app.product.services.product_facet_service import ProductFacetService
 from app.product.services.product_service import ProductService
+from app.product.services.stock_service import StockService
+from common.utils.http_cache import cache_control
+from common.utils.json_response import ModelJSONResponse
 from common.utils.pagination_and_sorting_dto import PaginationAndSortingDTO
 from core.configs import settings
 
 router = APIRouter(prefix="/products", tags=["상품"])
 
 
+@router.get(
+    "/facets",
+    status_code=status.HTTP_200_OK,
+    response_model=ProductFacetsResponseDTO,
+    summary="상품 목록 필터 패싯 조회 API",
+    description="상품 전체 조회와 같은 필터 조건으로 카테고리/색상/사이즈/가격 구간별 상품 수를 조회합니다",
+)
+@cache_control(max_age=60, stale_while_revalidate=300)
+async def get_product_facets_handler(
+    filters: ProductFilterRequestDTO = Depends(),
+) -> ProductFacetsResponseDTO:
+    return await ProductFacetService.get_facets(filters)
+
+
 @router.get(
     "/{product_id}",
     status_code=status.HTTP_200_OK,
@@ -28,6 +62,7 @@ router = APIRouter(prefix="/products", tags=["상품"])
     summary="상품 단일 조회 API",
     description="상품 단일 조회로 상품의 정보를 조회합니다",
 )
+@cache_control(max_age=60, stale_while_revalidate=300)
 async def get_product_handler(
     product_id: int = Path(..., description="조회할 상품의 ID"),
 ) -> ProductResponseDTO:
@@ -37,19 +72,32 @@ async def get_product_handler(
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=ProductsResponseDTO,
+    response_model=Union[ProductsResponseDTO, ProductSummariesResponseDTO],
     summary="상품 전체 조회 API",
-    description="상품 전체 조회로 다양한 조건으로 필터링하여 조회가 가능합니다",
+    description=(
+        "상품 전체 조회로 다양한 조건으로 필터링하여 조회가 가능합니다. "
+        "view=summary면 목록 그리드용 요약(설명/상세/옵션 제외, 대표 이미지 1장)만 반환합니다"
+    ),
 )
+@cache_control(max_age=60, stale_while_revalidate=300)
 async def get_products_handler(
     filters: ProductFilterRequestDTO = Depends(),
     pagination_and_sorting: PaginationAndSortingDTO = Depends(),
-) -> ProductsResponseDTO:
-    return await ProductService.get_products_with_options(
+    view: str = Query(
+        "full", pattern=r"^(full|summary)$", description="응답 형태 (full: 옵션 포함 전체, summary: 요약)"
+    ),
+) -> ModelJSONResponse:
+    list_products = (
+        ProductService.get_product_summaries if view == "summary" else ProductService.get_products_with_options
+    )
+    products = await list_products(
         product_name=filters.product_name,
         product_id=filters.product_id,
         product_code=filters.product_code,
         sale_status=filters.sale_status,
+        in_stock=filters.in_stock,
+        min_price=filters.min_price,
+        max_price=filters.max_price,
         category_id=filters.category_id,
         start_date=filters.start_date,
         end_date=filters.end_date,
@@ -58,6 +106,7 @@ async def get_products_handler(
         sort=pagination_and_sorting.sort,
         order=pagination_and_sorting.order,
     )
+    return ModelJSONResponse(products)
 
 
 @router.post(
@@ -93,6 +142,76 @@ async def update_products_status_handler(request: BatchUpdateStatusRequest) -> N
     return await ProductService.update_products_status(product_ids=request.product_ids, status=request.status)
 
 
+@router.patch(
+    "/discount",
+    status_code=status.HTTP_200_OK,
+    summary="상품 할인 일괄 변경 API",
+    description="상품 할인을 변경하고 할인 적용가(sale_price)를 일괄 재계산합니다. product_ids가 없으면 전체 상품에 적용합니다.",
+)
+async def update_products_discount_handler(request: BatchUpdateDiscountRequest) -> None:
+    return await ProductService.update_products_discount(
+        product_ids=request.product_ids, discount=request.discount, discount_option=request.discount_option
+    )
+
+
+@router.put(
+    "/stock",
+    status_code=status.HTTP_200_OK,
+    response_model=StockSyncResponseDTO,
+    summary="재고 일괄 동기화 API",
+    description="옵션 ID별 재고를 한 번에 덮어씁니다. (창고 재고 동기화, 최대 10,000건)",
+)
+async def sync_stock_handler(request: StockSyncRequestDTO) -> StockSyncResponseDTO:
+    return await StockService.sync_stock(request)
+
+
+@router.get(
+    "/stock/reconciliation",
+    status_code=status.HTTP_200_OK,
+    response_model=StockReconciliationResponseDTO,
+    summary="재고 대사 API",
+    description="재고 원장(스냅샷 + 이후 변동) 합계와 count_product, 옵션 재고가 다른 옵션을 조회합니다.",
+)
+async def reconcile_stock_handler() -> StockReconciliationResponseDTO:
+    return await InventoryLedgerService.reconcile()
+
+
+@router.post(
+    "/stock/flash-sale",
+    status_code=status.HTTP_200_OK,
+    response_model=FlashSaleStockResponseDTO,
+    summary="한정 판매 재고 적재 API",
+    description="옵션 재고를 Redis 카운터로 적재해 주문 시 MySQL 행 잠금 없이 차감합니다. (FLASH_SALE_STOCK_ENABLED 필요)",
+)
+async def enable_flash_sale_stock_handler(request: FlashSaleStockRequestDTO) -> FlashSaleStockResponseDTO:
+    return FlashSaleStockResponseDTO(option_ids=await FlashSaleStockService.enable(request.option_ids))
+
+
+@router.delete(
+    "/stock/flash-sale",
+    status_code=status.HTTP_200_OK,
+    response_model=FlashSaleStockResponseDTO,
+    summary="한정 판매 재고 해제 API",
+    description="Redis 카운터를 제거하고 남은 변동량을 MySQL에 반영합니다.",
+)
+async def disable_flash_sale_stock_handler(request: FlashSaleStockRequestDTO) -> FlashSaleStockResponseDTO:
+    return FlashSaleStockResponseDTO(option_ids=await FlashSaleStockService.disable(request.option_ids))
+
+
+@router.get(
+    "/{product_id}/stock",
+    status_code=status.HTTP_200_OK,
+    response_model=ProductStockResponseDTO,
+    summary="시점별 재고 조회 API",
+    description="재고 원장 기준 옵션별 재고를 조회합니다. at을 지정하면 해당 시점의 재고를 반환합니다.",
+)
+async def get_product_stock_handler(
+    product_id: int = Path(..., description="조회할 상품의 ID"),
+    at: Optional[datetime] = Query(None, description="조회 시점 (생략하면 현재 재고)"),
+) -> ProductStockResponseDTO:
+    return await InventoryLedgerService.get_product_stock(product_id, at=at)
+
+
 @router.patch(
     "/{product_id}",
     status_code=status.HTTP_200_OK,
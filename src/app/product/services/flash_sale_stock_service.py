@@ -0,0 +1,350 @@
+import asyncio
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, status
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+from app.product.models.inventory import FlashSaleJournalBatch, InventoryReason
+from app.product.models.product import Option
+from common.utils.cache_services import get_cache_service
+from common.utils.logger import setup_logger
+from core.configs import settings
+from core.database.db_router import write_connection_name
+
+logger = setup_logger("flash_sale_stock_logger", settings=settings)
+
+FLASH_SALE_STOCK_KEY_PREFIX = "flash_sale:stock:"
+FLASH_SALE_JOURNAL_KEY = "flash_sale:journal"
+FLASH_SALE_FLUSH_LOCK_KEY = "flash_sale:flush_lock"
+FLASH_SALE_FLUSH_LOCK_TTL_SECONDS = 30
+FLASH_SALE_FLUSH_LOCK_POLL_SECONDS = 0.05
+# 반영 중에는 잠금이 만료되지 않도록 TTL의 1/3마다 연장
+FLASH_SALE_FLUSH_LOCK_RENEW_SECONDS = FLASH_SALE_FLUSH_LOCK_TTL_SECONDS / 3
+# 반영한 배치 기록 보관 기간 (ack가 실패한 배치는 다음 반영에서 바로 다시 확인되므로 짧아도 됨)
+FLASH_SALE_JOURNAL_BATCH_RETENTION = timedelta(days=1)
+
+# (product_id, option_id, count) - stock_service.StockRow와 동일 (순환 import 방지)
+StockRow = tuple[int, int, int]
+
+# 현재 트랜잭션에서 Redis로 차감한 순수 수량 (product_id, option_id) -> 수량 (트랜잭션이 실패하면 되돌림)
+_pending_deductions: ContextVar[Optional[dict[tuple[int, int], int]]] = ContextVar(
+    "flash_sale_pending_deductions", default=None
+)
+
+
+def _stock_key(option_id: int) -> str:
+    return f"{FLASH_SALE_STOCK_KEY_PREFIX}{option_id}"
+
+
+def _option_id(key: str) -> int:
+    return int(key.removeprefix(FLASH_SALE_STOCK_KEY_PREFIX))
+
+
+class FlashSaleStockService:
+    """
+    한정 판매(핫 SKU) 옵션의 재고를 Redis 카운터로 차감
+    - Redis에 카운터가 있는 옵션만 대상 (enable로 적재, disable로 해제)
+    - 주문의 모든 라인을 스크립트 한 번으로 검사/차감하여 count_product 행 잠금 경합을 피함
+    - 변동량은 저널에 쌓이고 FlashSaleStockWriter가 주기적으로 MySQL에 반영 (write-behind)
+    - 적재/해제는 count_product 행을 잠근 트랜잭션 안에서 카운터를 바꿔, 전환 중에 MySQL로 차감한 주문이 어긋나지 않도록 함
+    - Redis 차감은 DB 롤백 대상이 아니므로 StockService.transaction이 실패한 트랜잭션의 차감을 되돌림
+    - 반영한 저널 배치는 같은 트랜잭션에 기록하여, 커밋 후 ack가 실패해도 같은 변동량을 다시 반영하지 않음
+    """
+
+    @staticmethod
+    async def enable(option_ids: list[int]) -> list[int]:
+        """현재 MySQL 재고를 Redis 카운터로 적재하고 적재된 옵션 ID를 반환 (이미 적재된 옵션은 유지)"""
+        if not settings.FLASH_SALE_STOCK_ENABLED or not option_ids:
+            return []
+
+        from app.product.services.stock_service import StockService
+
+        cache = get_cache_service()
+        keys = [_stock_key(option_id) for option_id in option_ids]
+        created: list[str] = []
+        async with FlashSaleStockService._flush_lock(wait=True):
+            try:
+                async with in_transaction(write_connection_name()) as connection:
+                    # 적재할 재고에 아직 반영되지 않은 변동량이 없도록 먼저 반영
+                    batch_ids, _ = await FlashSaleStockService._apply_journal(connection)
+                    # 행을 잠근 채 카운터를 만들고 커밋하여, 잠금을 기다리던 MySQL 차감은 커밋 후 카운터를 보고 Redis로 차감
+                    counts = await StockService._lock_counts(set(option_ids), connection)
+                    for (_, option_id), count in counts.items():
+                        if await cache.set_if_absent(_stock_key(option_id), str(count)):
+                            created.append(_stock_key(option_id))
+            except BaseException:
+                await cache.delete(*created)
+                raise
+            await cache.ack_journal(FLASH_SALE_JOURNAL_KEY, batch_ids)
+
+        values = await cache.get_many(keys)
+        return sorted(option_id for option_id, value in zip(option_ids, values) if value is not None)
+
+    @staticmethod
+    async def disable(option_ids: list[int]) -> list[int]:
+        """카운터를 제거해 이후 주문은 MySQL로 차감하고, 남은 변동량을 반영한 뒤 해제된 옵션 ID를 반환"""
+        if not settings.FLASH_SALE_STOCK_ENABLED or not option_ids:
+            return []
+
+        from app.product.services.stock_service import StockService
+
+        cache = get_cache_service()
+        async with FlashSaleStockService._flush_lock(wait=True):
+            keys = [_stock_key(option_id) for option_id in option_ids]
+            hot_keys = [key for key, value in zip(keys, await cache.get_many(keys)) if value is not None]
+            if not hot_keys:
+                return []
+
+            async with in_transaction(write_connection_name()) as connection:
+                # 카운터 제거와 남은 변동량 반영이 커밋될 때까지 행을 잠가,
+                # 카운터가 없어져 MySQL로 넘어온 주문이 반영 전 재고로 차감하지 않도록 함
+                await StockService._lock_counts({_option_id(key) for key in hot_keys}, connection)
+                await cache.delete(*hot_keys)
+                batch_ids, _ = await FlashSaleStockService._apply_journal(connection)
+            await cache.ack_journal(FLASH_SALE_JOURNAL_KEY, batch_ids)
+
+        return sorted(_option_id(key) for key in hot_keys)
+
+    @staticmethod
+    @asynccontextmanager
+    async def track_deductions() -> AsyncIterator[dict[tuple[int, int], int]]:
+        """
+        안에서 Redis로 차감/복원한 순수 수량을 모음 (StockService.transaction에서 사용)
+        중첩되면 성공한 안쪽 범위의 수량을 바깥 범위로 넘김
+        """
+        outer = _pending_deductions.get()
+        deductions: dict[tuple[int, int], int] = defaultdict(int)
+        token = _pending_deductions.set(deductions)
+        try:
+            yield deductions
+        finally:
+            _pending_deductions.reset(token)
+
+        if outer is not None:
+            for key, quantity in deductions.items():
+                outer[key] = outer.get(key, 0) + quantity
+
+    @staticmethod
+    async def compensate(deductions: dict[tuple[int, int], int]) -> None:
+        """
+        실패한 트랜잭션에서 Redis로 차감/복원한 수량을 되돌림
+        - 그 사이 해제된 옵션은 차감이 이미 MySQL에 반영되었으므로 MySQL 재고로 되돌림
+        """
+        amounts = {key: quantity for key, quantity in deductions.items() if quantity}
+        if not settings.FLASH_SALE_STOCK_ENABLED or not amounts:
+            return
+
+        from app.product.services.stock_service import StockService
+
+        incremented = await get_cache_service().increment_counters(
+            [_stock_key(option_id) for _, option_id in amounts], list(amounts.values()), FLASH_SALE_JOURNAL_KEY
+        )
+        restored = {_option_id(key) for key in incremented}
+        released = [
+            (product_id, option_id, quantity)
+            for (product_id, option_id), quantity in amounts.items()
+            if option_id not in restored
+        ]
+        if released:
+            async with in_transaction(write_connection_name()) as connection:
+                await StockService.adjust(released, connection, reason=InventoryReason.RELEASE)
+
+    @staticmethod
+    async def decrease(items: list[StockRow]) -> set[int]:
+        """
+        한정 판매 옵션 라인만 한 번에 차감하고 차감한 옵션 ID를 반환
+        - 하나라도 부족하면 아무것도 차감하지 않고 400
+        """
+        decremented = await FlashSaleStockService.try_decrease(items)
+        if decremented is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Insufficient stock for flash sale option",
+            )
+        return decremented
+
+    @staticmethod
+    async def try_decrease(items: list[StockRow]) -> Optional[set[int]]:
+        """decrease와 같지만 재고가 부족하면 예외 대신 None"""
+        if not settings.FLASH_SALE_STOCK_ENABLED or not items:
+            return set()
+
+        amounts: dict[int, int] = defaultdict(int)
+        for _, option_id, quantity in items:
+            amounts[option_id] += quantity
+
+        decremented = await get_cache_service().decrement_counters(
+            [_stock_key(option_id) for option_id in amounts], list(amounts.values()), FLASH_SALE_JOURNAL_KEY
+        )
+        if decremented is None:
+            return None
+
+        option_ids = {_option_id(key) for key in decremented}
+        FlashSaleStockService._track([item for item in items if item[1] in option_ids], sign=1)
+        return option_ids
+
+    @staticmethod
+    async def restore(items: list[StockRow]) -> set[int]:
+        """한정 판매 옵션 라인의 차감을 되돌리고 복원한 옵션 ID를 반환"""
+        if not settings.FLASH_SALE_STOCK_ENABLED or not items:
+            return set()
+
+        amounts: dict[int, int] = defaultdict(int)
+        for _, option_id, quantity in items:
+            amounts[option_id] += quantity
+
+        incremented = await get_cache_service().increment_counters(
+            [_stock_key(option_id) for option_id in amounts], list(amounts.values()), FLASH_SALE_JOURNAL_KEY
+        )
+        option_ids = {_option_id(key) for key in incremented}
+        FlashSaleStockService._track([item for item in items if item[1] in option_ids], sign=-1)
+        return option_ids
+
+    @staticmethod
+    def _track(items: list[StockRow], sign: int) -> None:
+        if (deductions := _pending_deductions.get()) is None:
+            return
+        for product_id, option_id, quantity in items:
+            deductions[(product_id, option_id)] += sign * quantity
+
+    @staticmethod
+    async def counters(option_ids: list[int]) -> dict[int, int]:
+        """한정 판매 중인 옵션의 현재 Redis 재고"""
+        if not settings.FLASH_SALE_STOCK_ENABLED or not option_ids:
+            return {}
+
+        values = await get_cache_service().get_many([_stock_key(option_id) for option_id in option_ids])
+        return {option_id: int(value) for option_id, value in zip(option_ids, values) if value is not None}
+
+    @staticmethod
+    async def flush(wait: bool = False) -> int:
+        """
+        누적된 변동량을 count_product, option.stock, product.total_stock, 원장에 반영하고 반영한 옵션 수를 반환
+        - wait=True면 다른 워커의 반영이 끝날 때까지 기다렸다가 반영
+        """
+        async with FlashSaleStockService._flush_lock(wait) as acquired:
+            if not acquired:
+                return 0
+
+            async with in_transaction(write_connection_name()) as connection:
+                batch_ids, flushed = await FlashSaleStockService._apply_journal(connection)
+                await FlashSaleJournalBatch.filter(
+                    created_at__lt=timezone.now() - FLASH_SALE_JOURNAL_BATCH_RETENTION
+                ).using_db(connection).delete()
+            await get_cache_service().ack_journal(FLASH_SALE_JOURNAL_KEY, batch_ids)
+            return flushed
+
+    @staticmethod
+    @asynccontextmanager
+    async def _flush_lock(wait: bool) -> AsyncIterator[bool]:
+        # 여러 워커가 같은 저널을 중복 반영하지 않도록 잠금 (적재/해제도 반영과 겹치지 않도록 같은 잠금 사용)
+        cache = get_cache_service()
+        token = uuid.uuid4().hex
+        while not await cache.set_if_absent(FLASH_SALE_FLUSH_LOCK_KEY, token, FLASH_SALE_FLUSH_LOCK_TTL_SECONDS):
+            if not wait:
+                yield False
+                return
+            await asyncio.sleep(FLASH_SALE_FLUSH_LOCK_POLL_SECONDS)
+
+        renewal = asyncio.create_task(FlashSaleStockService._renew_flush_lock(token))
+        try:
+            yield True
+        finally:
+            renewal.cancel()
+            await cache.release_lock(FLASH_SALE_FLUSH_LOCK_KEY, token)
+
+    @staticmethod
+    async def _renew_flush_lock(token: str) -> None:
+        cache = get_cache_service()
+        while True:
+            await asyncio.sleep(FLASH_SALE_FLUSH_LOCK_RENEW_SECONDS)
+            if not await cache.refresh_lock(FLASH_SALE_FLUSH_LOCK_KEY, token, FLASH_SALE_FLUSH_LOCK_TTL_SECONDS):
+                # 다른 워커가 잠금을 가져가도 이미 반영한 배치는 기록으로 걸러지므로 중복 반영되지 않음
+                logger.warning("Flash sale flush lock expired while flushing")
+                return
+
+    @staticmethod
+    async def _apply_journal(connection: BaseDBAsyncClient) -> tuple[list[str], int]:
+        """
+        처리 중인 저널 배치를 반영하고 (커밋 후 ack할 배치 ID, 반영한 옵션 수)를 반환
+        - 잠금을 잡은 상태에서만 호출, 이미 반영이 기록된 배치(커밋 후 ack 실패)는 건너뜀
+        """
+        from app.product.services.stock_service import StockService
+
+        batches = await get_cache_service().drain_journal(FLASH_SALE_JOURNAL_KEY, uuid.uuid4().hex)
+        if not batches:
+            return [], 0
+
+        applied = {
+            batch.batch_id
+            for batch in await FlashSaleJournalBatch.filter(batch_id__in=list(batches)).using_db(connection)
+        }
+        pending = [batch_id for batch_id in batches if batch_id not in applied]
+        if pending:
+            await FlashSaleJournalBatch.bulk_create(
+                [FlashSaleJournalBatch(batch_id=batch_id) for batch_id in pending], using_db=connection
+            )
+
+        deltas: dict[int, int] = defaultdict(int)
+        for batch_id in pending:
+            for key, delta in batches[batch_id].items():
+                deltas[_option_id(key)] += delta
+        deltas = {option_id: delta for option_id, delta in deltas.items() if delta}
+        if not deltas:
+            return list(batches), 0
+
+        product_ids = dict(
+            await Option.filter(id__in=list(deltas)).using_db(connection).values_list("id", "product_id")
+        )
+        await StockService.adjust(
+            [
+                (product_ids[option_id], option_id, delta)
+                for option_id, delta in deltas.items()
+                if option_id in product_ids
+            ],
+            connection,
+            reason=InventoryReason.FLASH_SALE,
+        )
+        return list(batches), len(deltas)
+
+
+class FlashSaleStockWriter:
+    def __init__(self, interval: float = settings.FLASH_SALE_FLUSH_INTERVAL_SECONDS) -> None:
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if settings.FLASH_SALE_STOCK_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # 종료 전 남은 변동량 반영
+        await FlashSaleStockService.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await FlashSaleStockService.flush()
+            except Exception as e:
+                logger.error(f"Flash sale stock flush failed: {str(e)}", exc_info=e)
+
+
+flash_sale_stock_writer = FlashSaleStockWriter()
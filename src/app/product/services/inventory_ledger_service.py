@@ -0,0 +1,202 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from tortoise import timezone
+from tortoise.functions import Max, Sum
+
+from app.product.dtos.response import (
+    OptionStockDTO,
+    ProductStockResponseDTO,
+    StockMismatchDTO,
+    StockReconciliationResponseDTO,
+)
+from app.product.models.inventory import InventoryMovement, InventorySnapshot
+from app.product.models.product import CountProduct, Option, Product
+from common.utils.logger import setup_logger
+from core.configs import settings
+from core.database.db_router import read_replica
+
+logger = setup_logger("inventory_ledger_logger", settings=settings)
+
+# IN 절 하나에 담을 최대 옵션 수
+LEDGER_QUERY_CHUNK_SIZE = 1000
+
+
+class InventoryLedgerService:
+    """
+    재고 원장(inventory_movement) 조회/압축
+    - 재고 = 옵션별 최근 스냅샷 + 스냅샷 이후 원장(tail) 합계
+    - 재고 조회는 원장/스냅샷 테이블만 사용하므로 주문이 몰리는 count_product 행을 잠그지 않음
+    """
+
+    @classmethod
+    async def stock_of(cls, option_ids: list[int], at: Optional[datetime] = None) -> dict[int, int]:
+        """옵션별 현재 재고 (at을 주면 해당 시점 재고)"""
+        stocks: dict[int, int] = {}
+        for start in range(0, len(option_ids), LEDGER_QUERY_CHUNK_SIZE):
+            stocks.update(await cls._stock_of_chunk(option_ids[start : start + LEDGER_QUERY_CHUNK_SIZE], at))
+        return stocks
+
+    @classmethod
+    async def _stock_of_chunk(cls, option_ids: list[int], at: Optional[datetime]) -> dict[int, int]:
+        snapshots = await cls._latest_snapshots(option_ids, at=at)
+        stocks = {option_id: snapshots.get(option_id, (0, 0))[0] for option_id in option_ids}
+
+        # 스냅샷은 주기적으로 한꺼번에 찍으므로 대부분의 옵션이 같은 last_movement_id를 가짐 -> 그룹별로 한 번만 합산
+        options_by_watermark: dict[int, list[int]] = defaultdict(list)
+        for option_id in option_ids:
+            options_by_watermark[snapshots.get(option_id, (0, 0))[1]].append(option_id)
+
+        for watermark, ids in options_by_watermark.items():
+            query = InventoryMovement.filter(option_id__in=ids, id__gt=watermark)
+            if at is not None:
+                query = query.filter(created_at__lte=at)
+
+            tails = await query.group_by("option_id").annotate(total=Sum("delta")).values_list("option_id", "total")
+            for option_id, total in tails:
+                stocks[option_id] += int(total)
+
+        return stocks
+
+    @staticmethod
+    async def _latest_snapshots(
+        option_ids: list[int], at: Optional[datetime] = None, max_movement_id: Optional[int] = None
+    ) -> dict[int, tuple[int, int]]:
+        """옵션별 가장 최근 스냅샷 (quantity, last_movement_id)"""
+        query = InventorySnapshot.filter(option_id__in=option_ids)
+        if at is not None:
+            query = query.filter(created_at__lte=at)
+        if max_movement_id is not None:
+            query = query.filter(last_movement_id__lte=max_movement_id)
+
+        latest = dict(
+            await query.group_by("option_id").annotate(last=Max("last_movement_id")).values_list("option_id", "last")
+        )
+        if not latest:
+            return {}
+
+        rows = await InventorySnapshot.filter(
+            option_id__in=list(latest), last_movement_id__in=set(latest.values())
+        ).values_list("option_id", "last_movement_id", "quantity")
+        return {option_id: (quantity, last) for option_id, last, quantity in rows if latest[option_id] == last}
+
+    @classmethod
+    async def take_snapshots(cls, lag_seconds: int = settings.INVENTORY_SNAPSHOT_LAG_SECONDS) -> int:
+        """
+        마지막 스냅샷 이후 변동이 있는 옵션만 새 스냅샷으로 압축하고 생성한 스냅샷 수를 반환
+        - 스냅샷 값은 원장 합계로 정해지므로 여러 워커가 동시에 실행해도 같은 행은 무시됨
+        """
+        latest_snapshot = await InventorySnapshot.all().order_by("-last_movement_id").first()
+        watermark: int = latest_snapshot.last_movement_id if latest_snapshot else 0
+        upper = (
+            await InventoryMovement.filter(
+                id__gt=watermark, created_at__lte=timezone.now() - timedelta(seconds=lag_seconds)
+            )
+            .order_by("-id")
+            .first()
+            .values_list("id", flat=True)
+        )
+        if upper is None:
+            return 0
+
+        tails = (
+            await InventoryMovement.filter(id__gt=watermark, id__lte=upper)
+            .group_by("option_id", "product_id")
+            .annotate(total=Sum("delta"))
+            .values_list("option_id", "product_id", "total")
+        )
+
+        snapshots: list[InventorySnapshot] = []
+        for start in range(0, len(tails), LEDGER_QUERY_CHUNK_SIZE):
+            chunk = tails[start : start + LEDGER_QUERY_CHUNK_SIZE]
+            previous = await cls._latest_snapshots([row[0] for row in chunk], max_movement_id=watermark)
+            snapshots.extend(
+                InventorySnapshot(
+                    product_id=product_id,
+                    option_id=option_id,
+                    quantity=previous.get(option_id, (0, 0))[0] + int(total),
+                    last_movement_id=upper,
+                )
+                for option_id, product_id, total in chunk
+            )
+
+        await InventorySnapshot.bulk_create(snapshots, batch_size=LEDGER_QUERY_CHUNK_SIZE, ignore_conflicts=True)
+        return len(snapshots)
+
+    @classmethod
+    @read_replica
+    async def get_product_stock(cls, product_id: int, at: Optional[datetime] = None) -> ProductStockResponseDTO:
+        await Product.get_by_id(product_id=product_id)
+        option_ids = await Option.filter(product_id=product_id).order_by("id").values_list("id", flat=True)
+        stocks = await cls.stock_of(option_ids, at=at)  # type: ignore[arg-type]
+
+        return ProductStockResponseDTO(
+            product_id=product_id,
+            at=at,
+            total_stock=sum(stocks.values()),
+            options=[OptionStockDTO(option_id=option_id, stock=stock) for option_id, stock in stocks.items()],
+        )
+
+    @classmethod
+    @read_replica
+    async def reconcile(cls) -> StockReconciliationResponseDTO:
+        """원장 재고와 count_product, option.stock이 다른 옵션 목록 (잠금 없는 일반 SELECT만 사용)"""
+        options = await Option.all().order_by("id").values_list("id", "product_id", "stock")
+
+        mismatches = []
+        for start in range(0, len(options), LEDGER_QUERY_CHUNK_SIZE):
+            chunk = options[start : start + LEDGER_QUERY_CHUNK_SIZE]
+            option_ids = [row[0] for row in chunk]
+            counts = dict(await CountProduct.filter(option_id__in=option_ids).values_list("option_id", "count"))
+            ledger = await cls.stock_of(option_ids)
+
+            for option_id, product_id, option_stock in chunk:
+                count = counts.get(option_id, 0)
+                if ledger[option_id] != count or option_stock != count:
+                    mismatches.append(
+                        StockMismatchDTO(
+                            product_id=product_id,
+                            option_id=option_id,
+                            ledger_stock=ledger[option_id],
+                            count_product_stock=count,
+                            option_stock=option_stock,
+                        )
+                    )
+
+        return StockReconciliationResponseDTO(checked_count=len(options), mismatches=mismatches)
+
+
+class InventorySnapshotWorker:
+    def __init__(self, interval: float = settings.INVENTORY_SNAPSHOT_INTERVAL_SECONDS) -> None:
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                created = await InventoryLedgerService.take_snapshots()
+                if created:
+                    logger.info(f"Inventory snapshots created: {created}")
+            except Exception as e:
+                logger.error(f"Inventory snapshot failed: {str(e)}", exc_info=e)
+
+
+inventory_snapshot_worker = InventorySnapshotWorker()
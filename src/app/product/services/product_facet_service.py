@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Optional
+from uuid import uuid4
+
+from tortoise.expressions import Q, Subquery
+from tortoise.functions import Count
+
+from app.category.models.category import CategoryProduct
+from app.product.dtos.request import ProductFilterRequestDTO
+from app.product.dtos.response import (
+    CategoryFacetDTO,
+    ColorFacetDTO,
+    PriceBucketFacetDTO,
+    ProductFacetsResponseDTO,
+    SizeFacetDTO,
+)
+from app.product.models.product import Option, Product
+from app.product.services.product_service import ProductService
+from common.utils.cache_services import get_cache_service
+from common.utils.http_cache import register_purge_hook
+from core.configs import settings
+from core.database.db_router import read_replica
+
+PRODUCT_FACET_KEY_PREFIX = "product_facets:"
+# 카탈로그가 바뀌면 값을 바꿔 이전 집계 캐시를 한 번에 무효화
+PRODUCT_FACET_GENERATION_KEY = "product_facets:generation"
+PRODUCT_FACET_PURGE_PATH = "/api/v1/products"
+
+# 할인 적용가(sale_price) 구간 경계: [0, 50,000), [50,000, 100,000), ..., [300,000, ∞)
+PRICE_BUCKET_BOUNDARIES = (50_000, 100_000, 200_000, 300_000)
+
+
+def _price_bucket_filters() -> list[Q]:
+    bounds = list(zip((None, *PRICE_BUCKET_BOUNDARIES), (*PRICE_BUCKET_BOUNDARIES, None)))
+    return [
+        Q(
+            *([Q(sale_price__gte=lower)] if lower is not None else []),
+            *([Q(sale_price__lt=upper)] if upper is not None else []),
+        )
+        for lower, upper in bounds
+    ]
+
+
+class ProductFacetService:
+    """
+    상품 목록 필터 사이드바용 패싯(카테고리/색상/사이즈/가격 구간별 상품 수) 집계
+    - 현재 필터에 맞는 상품 ID 서브쿼리를 기준으로 색상/사이즈/카테고리 GROUP BY와 가격 구간 조건부 집계를 함께 실행
+    - 정규화한 필터를 키로 캐시 (카탈로그 변경 시 무효화)
+    """
+
+    @classmethod
+    @read_replica
+    async def get_facets(cls, filters: ProductFilterRequestDTO) -> ProductFacetsResponseDTO:
+        cache = get_cache_service()
+        cache_key = await cls._cache_key(filters)
+        if (cached := await cache.get(cache_key)) is not None:
+            return ProductFacetsResponseDTO.model_validate_json(cached)
+
+        facets = await cls._aggregate(filters)
+        await cache.set(cache_key, facets.model_dump_json(), settings.PRODUCT_FACET_CACHE_TTL_SECONDS)
+        return facets
+
+    @staticmethod
+    async def _cache_key(filters: ProductFilterRequestDTO) -> str:
+        # 값이 없는 조건은 빼고, 문자열 조건은 앞뒤 공백을 제거해 같은 검색이 같은 키를 쓰도록 정규화
+        normalized = {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in filters.model_dump(mode="json", exclude_none=True).items()
+        }
+        digest = hashlib.sha256(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+        generation = await get_cache_service().get(PRODUCT_FACET_GENERATION_KEY) or "0"
+        return f"{PRODUCT_FACET_KEY_PREFIX}{generation}:{digest}"
+
+    @staticmethod
+    async def _aggregate(filters: ProductFilterRequestDTO) -> ProductFacetsResponseDTO:
+        q = await ProductService.build_filters(
+            product_name=filters.product_name,
+            product_id=filters.product_id,
+            product_code=filters.product_code,
+            sale_status=filters.sale_status,
+            in_stock=filters.in_stock,
+            min_price=filters.min_price,
+            max_price=filters.max_price,
+            category_id=filters.category_id,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+        )
+        product_ids = Subquery(Product.filter(q).values("id"))
+        price_buckets = {
+            f"bucket_{index}": Count("id", _filter=condition) for index, condition in enumerate(_price_bucket_filters())
+        }
+
+        colors, sizes, categories, totals = await asyncio.gather(
+            Option.filter(product_id__in=product_ids)
+            .group_by("color", "color_code")
+            .annotate(count=Count("product_id", distinct=True))
+            .values("color", "color_code", "count"),
+            Option.filter(product_id__in=product_ids)
+            .group_by("size")
+            .annotate(count=Count("product_id", distinct=True))
+            .values("size", "count"),
+            CategoryProduct.filter(product_id__in=product_ids)
+            .group_by("category_id")
+            .annotate(count=Count("product_id", distinct=True))
+            .values("category_id", "count"),
+            Product.filter(q).annotate(total=Count("id"), **price_buckets).first().values("total", *price_buckets),
+        )
+
+        return ProductFacetService._build_response(colors, sizes, categories, totals or {})
+
+    @staticmethod
+    def _build_response(
+        color_rows: list[dict[str, Any]],
+        size_rows: list[dict[str, Any]],
+        category_rows: list[dict[str, Any]],
+        totals: dict[str, Any],
+    ) -> ProductFacetsResponseDTO:
+        colors = sorted(
+            (ColorFacetDTO(color=row["color"], color_code=row["color_code"], count=row["count"]) for row in color_rows),
+            key=lambda facet: (-facet.count, facet.color),
+        )
+        sizes = sorted(
+            (SizeFacetDTO(size=row["size"], count=row["count"]) for row in size_rows),
+            key=lambda facet: (-facet.count, facet.size),
+        )
+        categories = sorted(
+            (CategoryFacetDTO(category_id=row["category_id"], count=row["count"]) for row in category_rows),
+            key=lambda facet: (-facet.count, facet.category_id),
+        )
+
+        # 상품이 없는 구간도 0으로 내려 사이드바 구간이 고정되도록 함
+        bounds: list[tuple[int, Optional[int]]] = list(
+            zip((0, *PRICE_BUCKET_BOUNDARIES), (*PRICE_BUCKET_BOUNDARIES, None))
+        )
+        price_buckets = [
+            PriceBucketFacetDTO(min_price=lower, max_price=upper, count=totals.get(f"bucket_{index}") or 0)
+            for index, (lower, upper) in enumerate(bounds)
+        ]
+
+        return ProductFacetsResponseDTO(
+            total_count=totals.get("total") or 0,
+            categories=categories,
+            colors=colors,
+            sizes=sizes,
+            price_buckets=price_buckets,
+        )
+
+
+async def invalidate_product_facets(paths: tuple[str, ...]) -> None:
+    """상품/카테고리 변경 API가 성공하면 패싯 캐시 세대를 바꿔 이전 집계를 무효화"""
+    if PRODUCT_FACET_PURGE_PATH in paths:
+        await get_cache_service().set(PRODUCT_FACET_GENERATION_KEY, uuid4().hex)
+
+
+register_purge_hook(invalidate_product_facets)
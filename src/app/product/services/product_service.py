@@ -7,7 +7,10 @@ from typing import Any, Coroutine, Optional, Union
 from uuid import uuid4
 
 from fastapi import UploadFile
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.expressions import Q
+from tortoise.functions import Min
 from tortoise.transactions import in_transaction
 
 from app.category.models.category import Category, CategoryProduct
@@ -18,15 +21,46 @@ from app.product.dtos.request import (
     ProductWithOptionCreateRequestDTO,
     ProductWithOptionUpdateRequestDTO,
 )
-from app.product.dtos.response import OptionDTO, OptionImageDTO, ProductDTO, ProductResponseDTO, ProductsResponseDTO
-from app.product.models.product import CountProduct, Option, OptionImage, Product
+from app.product.dtos.response import (
+    OptionDTO,
+    OptionImageDTO,
+    ProductDTO,
+    ProductResponseDTO,
+    ProductsResponseDTO,
+    ProductSummariesResponseDTO,
+    ProductSummaryDTO,
+)
+from app.product.models.inventory import InventoryReason
+from app.product.models.product import Option, OptionImage, Product
+from app.product.services.stock_service import StockService
 from common.exceptions.custom_exceptions import MaxImageSizeExceeded, MaxImagesPerColorExceeded
+from common.utils.logger import setup_logger
 from common.utils.ncp_s3_client import get_object_storage_client
 from core.configs import settings
+from core.database.db_router import read_replica, write_connection_name
+
+logger = setup_logger("product_logger", settings=settings)
+
+# 요약 목록에서 조회하는 컬럼 (description/detail TEXT 컬럼 제외)
+PRODUCT_SUMMARY_FIELDS = ("id", "name", "price", "discount", "discount_option", "sale_price", "status", "in_stock")
+
+# sale_price 계산에 쓰이는 컬럼 (UPDATE 문으로 바꿀 때는 ProductService.update_pricing 사용)
+SALE_PRICE_SOURCE_FIELDS = {"price", "discount", "discount_option"}
+
+# sale_price 일괄 재계산 시 한 UPDATE 문에 담을 최대 상품 수
+SALE_PRICE_RECOMPUTE_CHUNK_SIZE = 1000
+
+# Product.calculate_sale_price와 같은 계산을 DB에서 수행
+SALE_PRICE_SQL = (
+    "ROUND(CASE WHEN discount_option = 'amount' "
+    "THEN CASE WHEN price - discount > 0 THEN price - discount ELSE 0 END "
+    "ELSE CASE WHEN 100 - discount > 0 THEN price * (100 - discount) / 100.0 ELSE 0 END END, 2)"
+)
 
 
 class ProductService:
     @classmethod
+    @read_replica
     async def get_product_with_options(cls, product_id: int) -> ProductResponseDTO:
         product, options = await asyncio.gather(
             Product.get_by_id(product_id=product_id),
@@ -39,12 +73,16 @@ class ProductService:
         return ProductResponseDTO.build(product=product_dto, options=option_dtos)
 
     @classmethod
+    @read_replica
     async def get_products_with_options(
         cls,
         product_name: Optional[str] = None,
         product_id: Optional[int] = None,
         product_code: Optional[str] = None,
         sale_status: Optional[str] = None,
+        in_stock: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
         category_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
@@ -59,6 +97,9 @@ class ProductService:
             product_id=product_id,
             product_code=product_code,
             sale_status=sale_status,
+            in_stock=in_stock,
+            min_price=min_price,
+            max_price=max_price,
             category_id=category_id,
             start_date=start_date,
             end_date=end_date,
@@ -86,6 +127,71 @@ class ProductService:
 
         return ProductsResponseDTO.build(products=product_response_dtos, total_count=total_count)
 
+    @classmethod
+    @read_replica
+    async def get_product_summaries(
+        cls,
+        product_name: Optional[str] = None,
+        product_id: Optional[int] = None,
+        product_code: Optional[str] = None,
+        sale_status: Optional[str] = None,
+        in_stock: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        category_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page: int = 1,
+        page_size: int = 10,
+        sort: str = "created_at",
+        order: str = "desc",
+    ) -> ProductSummariesResponseDTO:
+        """목록 그리드용: 요약 컬럼만 조회하고 옵션/사이즈/이미지 대신 상품별 대표 이미지 1장만 조회"""
+        filters = await cls.build_filters(
+            product_name=product_name,
+            product_id=product_id,
+            product_code=product_code,
+            sale_status=sale_status,
+            in_stock=in_stock,
+            min_price=min_price,
+            max_price=max_price,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        order_by = f"-{sort}" if order == "desc" else sort
+
+        rows = (
+            await Product.filter(filters)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .order_by(order_by)
+            .values(*PRODUCT_SUMMARY_FIELDS)
+        )
+        total_count = await Product.filter(filters).count()
+        thumbnails = await cls._get_thumbnails([row["id"] for row in rows])
+
+        return ProductSummariesResponseDTO.build(
+            products=[ProductSummaryDTO(**row, thumbnail_url=thumbnails.get(row["id"])) for row in rows],
+            total_count=total_count,
+        )
+
+    @staticmethod
+    async def _get_thumbnails(product_ids: list[int]) -> dict[int, str]:
+        # 상품별로 가장 먼저 등록된 옵션 이미지를 대표 이미지로 사용
+        if not product_ids:
+            return {}
+
+        first_image_ids = (
+            await OptionImage.filter(option__product_id__in=product_ids)
+            .annotate(first_id=Min("id"))
+            .group_by("option__product_id")
+            .values_list("first_id", flat=True)
+        )
+        images = await OptionImage.filter(id__in=list(first_image_ids)).values_list("option__product_id", "image_url")
+        first_images: dict[int, str] = {product_id: image_url for product_id, image_url in images}
+        return first_images
+
     @staticmethod
     def map_options_by_color(options: list[Option]) -> list[OptionDTO]:
         color_options_map = {}
@@ -142,12 +248,9 @@ class ProductService:
         created_options = await Option.filter(product=product).all()
         option_map = {(opt.color_code, opt.size): opt for opt in created_options}
 
-        count_products_to_create = [
-            CountProduct(
-                product=product,
-                option=option_map[(option_dto.color_code, size_option.size)],
-                count=size_option.stock,
-            )
+        # 초기 재고도 StockService를 거쳐 option.stock/product.total_stock/원장을 함께 기록
+        stock_rows = [
+            (product.id, option_map[(option_dto.color_code, size_option.size)].id, size_option.stock)
             for option_dto in option_dtos
             for size_option in option_dto.sizes
         ]
@@ -155,7 +258,7 @@ class ProductService:
         option_image_entries = await cls._process_images(created_options, image_mapping, files)
 
         await asyncio.gather(
-            CountProduct.bulk_create(count_products_to_create),
+            StockService.bulk_upsert(stock_rows, reason=InventoryReason.INITIAL),
             OptionImage.bulk_create(option_image_entries),
         )
 
@@ -236,7 +339,7 @@ class ProductService:
                         )
                         upload_tasks.append((upload_task, color_code))  # 작업과 색상 코드 매핑
 
-        print(f"Number of upload tasks: {len(upload_tasks)}")
+        logger.debug(f"Number of upload tasks: {len(upload_tasks)}")
 
         # 업로드 작업 수행 및 에러 처리
         upload_results = await asyncio.gather(*[task[0] for task in upload_tasks], return_exceptions=True)
@@ -244,9 +347,9 @@ class ProductService:
         # 업로드 결과를 색상 코드별로 매핑
         for result, (_, color_code) in zip(upload_results, upload_tasks):
             if isinstance(result, Exception):
-                print(f"Error occurred during upload for color {color_code}: {result}")
+                logger.error(f"Error occurred during upload for color {color_code}: {result}")
             else:
-                print(f"Uploaded URL: {result}")
+                logger.debug(f"Uploaded URL: {result}")
                 uploaded_urls_map[color_code].append(result)
 
         # 옵션과 업로드된 이미지를 연결
@@ -258,19 +361,19 @@ class ProductService:
         return option_image_entries
 
     @staticmethod
-    async def _get_filtered_products_and_options(
+    async def build_filters(
         product_name: Optional[str] = None,
         product_id: Optional[int] = None,
         product_code: Optional[str] = None,
         sale_status: Optional[str] = None,
+        in_stock: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
         category_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        page: int = 1,
-        page_size: int = 10,
-        sort: str = "created_at",
-        order: str = "desc",
-    ) -> tuple[list[Product], list[Option], int]:
+    ) -> Q:
+        """상품 목록/패싯 집계가 함께 쓰는 필터 조건"""
         filters = Q()
 
         if product_name:
@@ -281,6 +384,13 @@ class ProductService:
             filters &= Q(product_code__icontains=product_code)
         if sale_status:
             filters &= Q(status=sale_status)
+        if in_stock is not None:
+            # count_product 집계 없이 비정규화된 in_stock으로 필터 (status, in_stock, created_at 인덱스)
+            filters &= Q(in_stock=in_stock)
+        if min_price is not None:
+            filters &= Q(sale_price__gte=min_price)
+        if max_price is not None:
+            filters &= Q(sale_price__lte=max_price)
         if start_date:
             filters &= Q(created_at__gte=start_date)
         if end_date:
@@ -290,6 +400,38 @@ class ProductService:
             category_ids = await CategoryService.get_category_and_subcategories(category_id=category_id)
             filters &= Q(product_category__category_id__in=category_ids)
 
+        return filters
+
+    @staticmethod
+    async def _get_filtered_products_and_options(
+        product_name: Optional[str] = None,
+        product_id: Optional[int] = None,
+        product_code: Optional[str] = None,
+        sale_status: Optional[str] = None,
+        in_stock: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        category_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        page: int = 1,
+        page_size: int = 10,
+        sort: str = "created_at",
+        order: str = "desc",
+    ) -> tuple[list[Product], list[Option], int]:
+        filters = await ProductService.build_filters(
+            product_name=product_name,
+            product_id=product_id,
+            product_code=product_code,
+            sale_status=sale_status,
+            in_stock=in_stock,
+            min_price=min_price,
+            max_price=max_price,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
         offset = (page - 1) * page_size
         limit = page_size
 
@@ -307,6 +449,50 @@ class ProductService:
     async def update_products_status(cls, product_ids: list[int], status: str) -> None:
         await Product.filter(id__in=product_ids).update(status=status)
 
+    @classmethod
+    async def update_products_discount(
+        cls, product_ids: Optional[list[int]], discount: float, discount_option: str
+    ) -> None:
+        """여러 상품(product_ids가 없으면 전체 상품)의 할인을 변경하고 sale_price를 일괄 재계산"""
+        await cls.update_pricing(product_ids, discount=discount, discount_option=discount_option)
+
+    @classmethod
+    async def update_pricing(cls, product_ids: Optional[list[int]], **values: Any) -> None:
+        """
+        price/discount/discount_option을 UPDATE 문으로 일괄 변경하는 유일한 경로
+        - Product.save()를 거치지 않으므로 같은 트랜잭션에서 sale_price도 재계산
+        """
+        if unknown := values.keys() - SALE_PRICE_SOURCE_FIELDS:
+            raise ValueError(f"update_pricing cannot update {sorted(unknown)}")
+
+        async with in_transaction(write_connection_name()) as connection:
+            query = Product.all() if product_ids is None else Product.filter(id__in=product_ids)
+            await query.using_db(connection).update(**values)
+            await cls.recompute_sale_prices(product_ids, connection)
+
+    @staticmethod
+    async def recompute_sale_prices(product_ids: Optional[list[int]], connection: BaseDBAsyncClient) -> None:
+        """
+        sale_price를 상품별로 읽고 쓰지 않고 UPDATE 한 문장으로 재계산
+        - product_ids가 없으면 전체 상품 (카탈로그 전체 할인 행사)
+        """
+        placeholder = "%s" if connection.capabilities.dialect == "mysql" else "?"
+        now = timezone.now()
+
+        if product_ids is None:
+            await connection.execute_query(
+                f"UPDATE product SET sale_price = {SALE_PRICE_SQL}, updated_at = {placeholder}", [now]
+            )
+            return
+
+        for start in range(0, len(product_ids), SALE_PRICE_RECOMPUTE_CHUNK_SIZE):
+            chunk = product_ids[start : start + SALE_PRICE_RECOMPUTE_CHUNK_SIZE]
+            await connection.execute_query(
+                f"UPDATE product SET sale_price = {SALE_PRICE_SQL}, updated_at = {placeholder} "
+                f"WHERE id IN ({', '.join([placeholder] * len(chunk))})",
+                [now, *chunk],
+            )
+
     @staticmethod
     async def _update_product_basic_info(product_id: int, product_update_dto: ProductUpdateDTO) -> Product:
         product = await Product.get(id=product_id)
@@ -384,41 +570,17 @@ class ProductService:
 
     @staticmethod
     async def _update_stock(product: Product, options_dto: list[OptionUpdateDTO]) -> None:
+        # 옵션은 직전 단계(_update_options)에서 모두 생성/수정되어 있음
         existing_options = await Option.filter(product=product).all()
         existing_option_map = {(opt.color_code, opt.size): opt for opt in existing_options}
 
-        count_products_to_create = []
-        count_products_to_update = []
-
-        for option_dto in options_dto:
-            for size_dto in option_dto.sizes:
-                key = (option_dto.color_code, size_dto.size)
-                option = existing_option_map.get(key)
-                if option:
-                    _, created = await CountProduct.update_or_create(
-                        product=product,
-                        option=option,
-                        defaults={"count": size_dto.stock},
-                    )
-                    if not created:
-                        count_products_to_update.append(option)
-                else:
-                    count_products_to_create.append(
-                        CountProduct(
-                            product=product,
-                            option=option,
-                            count=size_dto.stock,
-                        )
-                    )
-
-        tasks = []
-        if count_products_to_create:
-            tasks.append(CountProduct.bulk_create(count_products_to_create))
-        if count_products_to_update:
-            tasks.extend(count_products_to_update)  # type: ignore
-
-        if tasks:
-            await asyncio.gather(*tasks)
+        rows = [
+            (product.id, option.id, size_dto.stock)
+            for option_dto in options_dto
+            for size_dto in option_dto.sizes
+            if (option := existing_option_map.get((option_dto.color_code, size_dto.size)))
+        ]
+        await StockService.bulk_upsert(rows)
 
     @classmethod
     async def _update_images(
@@ -471,7 +633,7 @@ class ProductService:
 
     @classmethod
     async def delete_product(cls, product_id: int) -> None:
-        async with in_transaction() as connection:
+        async with in_transaction(write_connection_name()) as connection:
             product = await Product.get(id=product_id)
 
             product_images = await OptionImage.filter(option__product=product).all()
@@ -0,0 +1,183 @@
+import asyncio
+from datetime import timedelta
+from typing import Optional
+
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.product.models.inventory import StockHold, StockHoldStatus
+from app.product.services.stock_service import StockRow, StockService
+from common.utils.logger import setup_logger
+from core.configs import settings
+
+logger = setup_logger("stock_hold_logger", settings=settings)
+
+
+class StockHoldService:
+    """
+    주문 시 차감한 재고를 결제 승인 전까지 점유(hold)로 관리
+    - 결제가 승인되면 확정(CONVERTED), 만료되면 스위퍼가 재고를 복원(RELEASED)
+    """
+
+    @staticmethod
+    async def hold(
+        order_id: int,
+        items: list[StockRow],
+        connection: BaseDBAsyncClient,
+        ttl_seconds: int = settings.STOCK_HOLD_TTL_SECONDS,
+    ) -> None:
+        """재고를 차감하고 만료 시각과 함께 점유 기록 (재고가 부족하면 400)"""
+        await StockService.decrease(items, connection, reference=f"order:{order_id}")
+
+        expires_at = timezone.now() + timedelta(seconds=ttl_seconds)
+        await StockHold.bulk_create(
+            [
+                StockHold(
+                    order_id=order_id,
+                    product_id=product_id,
+                    option_id=option_id,
+                    quantity=quantity,
+                    expires_at=expires_at,
+                )
+                for product_id, option_id, quantity in items
+            ],
+            using_db=connection,
+        )
+
+    @staticmethod
+    async def extend(
+        order_id: int, connection: BaseDBAsyncClient, ttl_seconds: int = settings.STOCK_HOLD_PAYMENT_TTL_SECONDS
+    ) -> None:
+        """
+        결제 예약 시 점유 만료를 연장 (결제 예약과 같은 트랜잭션에서 호출)
+        - 예약 전에 만료되어 복원된 점유는 재고를 다시 차감해 점유 (부족하면 400으로 결제 예약을 막음)
+        """
+        holds = (
+            await StockHold.filter(order_id=order_id, status__in=[StockHoldStatus.HELD, StockHoldStatus.RELEASED])
+            .select_for_update()
+            .using_db(connection)
+            .order_by("id")
+        )
+        if not holds:
+            return
+
+        released = [hold for hold in holds if hold.status == StockHoldStatus.RELEASED]
+        if released:
+            await StockService.decrease(
+                [(hold.product_id, hold.option_id, hold.quantity) for hold in released],
+                connection,
+                reference=f"order:{order_id}",
+            )
+
+        # 이미 더 늦게 만료되는 점유는 그대로
+        expires_at = timezone.now() + timedelta(seconds=ttl_seconds)
+        extended_ids = [hold.id for hold in holds if hold in released or hold.expires_at < expires_at]
+        if extended_ids:
+            await StockHold.filter(id__in=extended_ids).using_db(connection).update(
+                status=StockHoldStatus.HELD, expires_at=expires_at
+            )
+
+    @staticmethod
+    async def convert(order_ids: list[int], connection: BaseDBAsyncClient) -> list[StockHold]:
+        """
+        결제 승인된 주문의 점유를 확정 차감으로 전환하고, 재고를 확보하지 못한 점유를 반환
+        - 승인 전에 만료되어 복원된 점유는 재고를 다시 차감 (부족하면 RELEASED로 남기고 호출한 쪽에서 주문 상품을 표시)
+        """
+        holds = (
+            await StockHold.filter(order_id__in=order_ids, status__in=[StockHoldStatus.HELD, StockHoldStatus.RELEASED])
+            .select_for_update()
+            .using_db(connection)
+            .order_by("id")
+        )
+
+        converted_ids = [hold.id for hold in holds if hold.status == StockHoldStatus.HELD]
+        released = [hold for hold in holds if hold.status == StockHoldStatus.RELEASED]
+        shortages = []
+        if released:
+            allocations = await StockService.allocate(
+                [(hold.product_id, hold.option_id, hold.quantity) for hold in released],
+                connection,
+                references=[f"order:{hold.order_id}" for hold in released],
+            )
+            for hold, allocation in zip(released, allocations):
+                if allocation.allocated:
+                    converted_ids.append(hold.id)
+                else:
+                    logger.error(
+                        f"Oversold after stock hold expired: order {hold.order_id} option {hold.option_id} "
+                        f"(requested: {hold.quantity}, available: {allocation.available_quantity})"
+                    )
+                    shortages.append(hold)
+
+        if converted_ids:
+            await StockHold.filter(id__in=converted_ids).using_db(connection).update(status=StockHoldStatus.CONVERTED)
+
+        return shortages
+
+    @staticmethod
+    async def release_expired(batch_size: int = settings.STOCK_HOLD_SWEEP_BATCH_SIZE) -> int:
+        """만료된 점유를 한 번에 해제하고 재고 복원 (여러 워커가 같은 점유를 처리하지 않도록 SKIP LOCKED)"""
+        async with StockService.transaction() as connection:
+            holds = (
+                await StockHold.filter(status=StockHoldStatus.HELD, expires_at__lte=timezone.now())
+                .select_for_update(skip_locked=True)
+                .using_db(connection)
+                .order_by("expires_at")
+                .limit(batch_size)
+            )
+            if not holds:
+                return 0
+
+            await StockHold.filter(id__in=[hold.id for hold in holds]).using_db(connection).update(
+                status=StockHoldStatus.RELEASED
+            )
+            await StockService.restore(
+                [(hold.product_id, hold.option_id, hold.quantity) for hold in holds],
+                connection,
+                references=[f"order:{hold.order_id}" for hold in holds],
+            )
+
+        return len(holds)
+
+
+class StockHoldSweeper:
+    def __init__(
+        self,
+        interval: float = settings.STOCK_HOLD_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = settings.STOCK_HOLD_SWEEP_BATCH_SIZE,
+    ) -> None:
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                released = await StockHoldService.release_expired(self.batch_size)
+            except Exception as e:
+                logger.error(f"Stock hold sweep failed: {str(e)}", exc_info=e)
+                released = 0
+
+            # 가득 찬 배치를 처리했다면 남은 만료 점유가 있을 수 있으므로 바로 다음 배치 처리
+            if released >= self.batch_size:
+                continue
+
+            await asyncio.sleep(self.interval)
+
+
+stock_hold_sweeper = StockHoldSweeper()
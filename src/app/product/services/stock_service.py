@@ -0,0 +1,346 @@
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException, status
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+from app.product.dtos.request import StockSyncRequestDTO
+from app.product.dtos.response import StockSyncResponseDTO
+from app.product.models.inventory import InventoryMovement, InventoryReason
+from app.product.models.product import CountProduct, Option
+from app.product.services.flash_sale_stock_service import FlashSaleStockService
+from core.database.db_router import write_connection_name
+
+# 한 INSERT 문에 담을 최대 행 수 (max_allowed_packet/플레이스홀더 수 제한 대비)
+STOCK_UPSERT_CHUNK_SIZE = 1000
+
+# (product_id, option_id, count)
+StockRow = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class StockAllocation:
+    product_id: int
+    option_id: int
+    quantity: int
+    available_quantity: int  # 차감 전 재고 (앞선 라인의 차감 반영)
+    allocated: bool
+
+
+class StockService:
+    """
+    재고(count_product)를 변경하는 유일한 경로
+    - option.stock, product.total_stock, product.in_stock 비정규화 값을 같은 트랜잭션 안에서 함께 갱신
+    - 변동량은 inventory_movement 원장에 함께 기록
+    - 한정 판매 옵션은 Redis 카운터로 차감하고 MySQL에는 FlashSaleStockService가 모아서 반영
+    - 재고를 차감/복원하는 트랜잭션은 in_transaction 대신 StockService.transaction으로 열어야 함
+    """
+
+    @staticmethod
+    @asynccontextmanager
+    async def transaction() -> AsyncIterator[BaseDBAsyncClient]:
+        """
+        쓰기 트랜잭션을 열고, 본문이나 커밋이 실패하면 그 안에서 바꾼 한정 판매(Redis) 재고를 되돌림
+        (Redis 차감은 DB 롤백 대상이 아니므로 되돌리지 않으면 재고가 사라짐)
+        """
+        async with FlashSaleStockService.track_deductions() as deductions:
+            try:
+                async with in_transaction(write_connection_name()) as connection:
+                    yield connection
+            except BaseException:
+                await FlashSaleStockService.compensate(deductions)
+                raise
+
+    @staticmethod
+    async def bulk_upsert(
+        rows: list[StockRow],
+        connection: Optional[BaseDBAsyncClient] = None,
+        reason: InventoryReason = InventoryReason.SYNC,
+        reference: Optional[str] = None,
+    ) -> None:
+        """
+        count_product의 (product_id, option_id) 유니크 인덱스를 이용해
+        재고를 SELECT 없이 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 반영
+        """
+        if not rows:
+            return
+
+        # 같은 옵션이 여러 번 오면 마지막 값 기준
+        latest = {(product_id, option_id): count for product_id, option_id, count in rows}
+
+        # 한정 판매 중인 옵션은 카운터를 내리고(남은 변동량 반영) 덮어쓴 뒤 새 재고로 다시 적재
+        flash_sale_option_ids = await FlashSaleStockService.disable([option_id for _, option_id in latest])
+        try:
+            if connection is None:
+                async with in_transaction(write_connection_name()) as connection:
+                    await StockService._apply_upsert(latest, connection, reason, reference)
+            else:
+                await StockService._apply_upsert(latest, connection, reason, reference)
+        finally:
+            if flash_sale_option_ids:
+                await FlashSaleStockService.enable(flash_sale_option_ids)
+
+    @staticmethod
+    async def _apply_upsert(
+        latest: dict[tuple[int, int], int], db: BaseDBAsyncClient, reason: InventoryReason, reference: Optional[str]
+    ) -> None:
+        now = timezone.now()
+        items = list(latest.items())
+        for start in range(0, len(items), STOCK_UPSERT_CHUNK_SIZE):
+            chunk = items[start : start + STOCK_UPSERT_CHUNK_SIZE]
+            values: list[object] = []
+            for (product_id, option_id), count in chunk:
+                values.extend([product_id, option_id, count, now, now])
+            await db.execute_query(StockService._upsert_sql(db, len(chunk)), values)
+
+        option_ids = [option_id for _, option_id in latest]
+        await StockService._record_overwrites(db, option_ids, reason, reference)
+        await StockService._sync_denormalized(
+            db,
+            option_ids=option_ids,
+            product_ids=sorted({product_id for product_id, _ in latest}),
+        )
+
+    @staticmethod
+    async def decrease(items: list[StockRow], connection: BaseDBAsyncClient, reference: Optional[str] = None) -> None:
+        """
+        주문 수량만큼 재고 차감 (count_product, option.stock, product.total_stock 증분 갱신)
+        - 재고가 부족하면 400, 호출한 트랜잭션 전체가 롤백됨 (StockService.transaction이면 Redis 차감도 되돌림)
+        """
+        flash_sale_option_ids = await FlashSaleStockService.decrease(items)
+        items = [item for item in items if item[1] not in flash_sale_option_ids]
+
+        remaining = await StockService._lock_counts({option_id for _, option_id, _ in items}, connection)
+        # 잠금을 기다리는 동안 한정 판매로 전환된 옵션은 Redis에서 차감
+        if flash_sale_option_ids := await FlashSaleStockService.decrease(items):
+            items = [item for item in items if item[1] not in flash_sale_option_ids]
+
+        for product_id, option_id, quantity in items:
+            available = remaining.get((product_id, option_id), 0)
+            if available < quantity:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Insufficient stock for product {product_id} option {option_id}",
+                )
+            remaining[(product_id, option_id)] = available - quantity
+
+        await StockService._apply_deductions([(*item, reference) for item in items], connection)
+
+    @staticmethod
+    async def allocate(
+        items: list[StockRow], connection: BaseDBAsyncClient, references: Optional[list[Optional[str]]] = None
+    ) -> list[StockAllocation]:
+        """
+        여러 주문 라인을 요청 순서(FIFO)대로 차감하고 라인별 결과를 반환 (재고가 부족한 라인만 건너뜀)
+        - count_product 행을 잠근 뒤 차감량을 한 번에 계산해 다중 행 UPDATE로 반영
+        """
+        option_ids = sorted({option_id for _, option_id, _ in items})
+        flash_sale_stock = await FlashSaleStockService.counters(option_ids)
+        remaining = await StockService._lock_counts(set(option_ids) - flash_sale_stock.keys(), connection)
+        # 잠금을 기다리는 동안 한정 판매로 전환된 옵션은 Redis에서 차감
+        flash_sale_stock.update(await FlashSaleStockService.counters([option_id for _, option_id in remaining]))
+        references = references or [None] * len(items)
+
+        allocations = []
+        deductions = []
+        for (product_id, option_id, quantity), reference in zip(items, references):
+            if option_id in flash_sale_stock:
+                # 한정 판매 옵션은 라인마다 Redis에서 차감 (available은 조회 시점 기준)
+                available = flash_sale_stock[option_id]
+                allocated = await FlashSaleStockService.try_decrease([(product_id, option_id, quantity)]) == {option_id}
+                if allocated:
+                    flash_sale_stock[option_id] = available - quantity
+            else:
+                available = remaining.get((product_id, option_id), 0)
+                allocated = available >= quantity
+                if allocated:
+                    remaining[(product_id, option_id)] = available - quantity
+                    deductions.append((product_id, option_id, quantity, reference))
+            allocations.append(StockAllocation(product_id, option_id, quantity, available, allocated))
+
+        await StockService._apply_deductions(deductions, connection)
+        return allocations
+
+    @staticmethod
+    async def restore(
+        items: list[StockRow], connection: BaseDBAsyncClient, references: Optional[list[Optional[str]]] = None
+    ) -> None:
+        """차감했던 재고를 되돌림 (결제되지 않은 주문의 재고 점유 해제)"""
+        references = references or [None] * len(items)
+        flash_sale_option_ids = await FlashSaleStockService.restore(items)
+        await StockService._apply_deductions(
+            [
+                (product_id, option_id, -quantity, reference)
+                for (product_id, option_id, quantity), reference in zip(items, references)
+                if option_id not in flash_sale_option_ids
+            ],
+            connection,
+            reason=InventoryReason.RELEASE,
+        )
+
+    @staticmethod
+    async def adjust(items: list[StockRow], connection: BaseDBAsyncClient, reason: InventoryReason) -> None:
+        """검사 없이 변동량(count가 음수면 차감)을 그대로 반영 (Redis에서 이미 검사한 한정 판매 재고 반영용)"""
+        await StockService._apply_deductions(
+            [(product_id, option_id, -delta, None) for product_id, option_id, delta in items], connection, reason=reason
+        )
+
+    @staticmethod
+    async def _lock_counts(option_ids: set[int], connection: BaseDBAsyncClient) -> dict[tuple[int, int], int]:
+        # 동시 차감끼리 교착되지 않도록 항상 option_id 순서로 잠금
+        sorted_ids = sorted(option_ids)
+        counts = {}
+        for start in range(0, len(sorted_ids), STOCK_UPSERT_CHUNK_SIZE):
+            rows = (
+                await CountProduct.filter(option_id__in=sorted_ids[start : start + STOCK_UPSERT_CHUNK_SIZE])
+                .select_for_update()
+                .using_db(connection)
+                .order_by("option_id")
+            )
+            counts.update({(row.product_id, row.option_id): row.count for row in rows})  # type: ignore[attr-defined]
+        return counts
+
+    @staticmethod
+    async def _apply_deductions(
+        deductions: list[tuple[int, int, int, Optional[str]]],
+        connection: BaseDBAsyncClient,
+        reason: InventoryReason = InventoryReason.ORDER,
+    ) -> None:
+        # 수량이 음수면 재고 복원
+        if not deductions:
+            return
+
+        by_option: dict[int, int] = defaultdict(int)
+        by_product: dict[int, int] = defaultdict(int)
+        for product_id, option_id, quantity, _ in deductions:
+            by_option[option_id] += quantity
+            by_product[product_id] += quantity
+
+        await StockService._decrement(connection, "count_product", "count", "option_id", by_option)
+        await StockService._decrement(connection, "`option`", "stock", "id", by_option)
+        await StockService._decrement(connection, "product", "total_stock", "id", by_product)
+        await StockService._sync_availability(connection, sorted(by_product))
+
+        await InventoryMovement.bulk_create(
+            [
+                InventoryMovement(
+                    product_id=product_id,
+                    option_id=option_id,
+                    delta=-quantity,
+                    reason=reason,
+                    reference=reference,
+                )
+                for product_id, option_id, quantity, reference in deductions
+            ],
+            using_db=connection,
+        )
+
+    @staticmethod
+    async def _decrement(db: BaseDBAsyncClient, table: str, column: str, key: str, amounts: dict[int, int]) -> None:
+        # UPDATE ... SET column = column - CASE key WHEN ? THEN ? ... END WHERE key IN (...)
+        placeholder = "%s" if db.capabilities.dialect == "mysql" else "?"
+        now = timezone.now()
+        items = sorted(amounts.items())
+
+        for start in range(0, len(items), STOCK_UPSERT_CHUNK_SIZE):
+            chunk = items[start : start + STOCK_UPSERT_CHUNK_SIZE]
+            cases = " ".join([f"WHEN {placeholder} THEN {placeholder}"] * len(chunk))
+            await db.execute_query(
+                f"UPDATE {table} SET {column} = {column} - CASE {key} {cases} END, updated_at = {placeholder} "
+                f"WHERE {key} IN ({', '.join([placeholder] * len(chunk))})",
+                [value for pair in chunk for value in pair] + [now] + [key_id for key_id, _ in chunk],
+            )
+
+    @staticmethod
+    def _upsert_sql(db: BaseDBAsyncClient, row_count: int) -> str:
+        columns = "(product_id, option_id, count, created_at, updated_at)"
+        if db.capabilities.dialect == "mysql":
+            placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * row_count)
+            return (
+                f"INSERT INTO count_product {columns} VALUES {placeholders} "
+                "ON DUPLICATE KEY UPDATE count = VALUES(count), updated_at = VALUES(updated_at)"
+            )
+
+        # 테스트(SQLite)용
+        placeholders = ", ".join(["(?, ?, ?, ?, ?)"] * row_count)
+        return (
+            f"INSERT INTO count_product {columns} VALUES {placeholders} "
+            "ON CONFLICT (product_id, option_id) DO UPDATE SET count = excluded.count, updated_at = excluded.updated_at"
+        )
+
+    @staticmethod
+    async def _record_overwrites(
+        db: BaseDBAsyncClient, option_ids: list[int], reason: InventoryReason, reference: Optional[str]
+    ) -> None:
+        # 덮어쓰기 직후, 아직 이전 값인 option.stock과 비교해 변동량만 원장에 기록 (INSERT ... SELECT 한 문장)
+        placeholder = "%s" if db.capabilities.dialect == "mysql" else "?"
+        now = timezone.now()
+
+        for start in range(0, len(option_ids), STOCK_UPSERT_CHUNK_SIZE):
+            chunk = option_ids[start : start + STOCK_UPSERT_CHUNK_SIZE]
+            await db.execute_query(
+                "INSERT INTO inventory_movement (product_id, option_id, delta, reason, reference, created_at, updated_at) "
+                f"SELECT o.product_id, o.id, t.total - o.stock, {placeholder}, {placeholder}, {placeholder}, {placeholder} "
+                "FROM `option` o JOIN (SELECT option_id, SUM(count) AS total FROM count_product "
+                f"WHERE option_id IN ({', '.join([placeholder] * len(chunk))}) GROUP BY option_id) t "
+                "ON t.option_id = o.id WHERE t.total <> o.stock ORDER BY o.id",
+                [reason.value, reference, now, now, *chunk],
+            )
+
+    @staticmethod
+    async def _sync_denormalized(db: BaseDBAsyncClient, option_ids: list[int], product_ids: list[int]) -> None:
+        # 절대값으로 덮어쓴 재고는 증분을 알 수 없으므로, 변경된 옵션/상품만 count_product 기준으로 다시 계산
+        placeholder = "%s" if db.capabilities.dialect == "mysql" else "?"
+
+        for start in range(0, len(option_ids), STOCK_UPSERT_CHUNK_SIZE):
+            chunk = option_ids[start : start + STOCK_UPSERT_CHUNK_SIZE]
+            await db.execute_query(
+                "UPDATE `option` SET stock = "
+                "(SELECT COALESCE(SUM(cp.count), 0) FROM count_product cp WHERE cp.option_id = `option`.id) "
+                f"WHERE id IN ({', '.join([placeholder] * len(chunk))})",
+                chunk,
+            )
+
+        for start in range(0, len(product_ids), STOCK_UPSERT_CHUNK_SIZE):
+            chunk = product_ids[start : start + STOCK_UPSERT_CHUNK_SIZE]
+            await db.execute_query(
+                "UPDATE product SET total_stock = "
+                "(SELECT COALESCE(SUM(o.stock), 0) FROM `option` o WHERE o.product_id = product.id) "
+                f"WHERE id IN ({', '.join([placeholder] * len(chunk))})",
+                chunk,
+            )
+        await StockService._sync_availability(db, product_ids)
+
+    @staticmethod
+    async def _sync_availability(db: BaseDBAsyncClient, product_ids: list[int]) -> None:
+        # 재고가 0을 넘나든 상품만 in_stock 갱신 (대부분의 차감은 행을 건드리지 않음)
+        placeholder = "%s" if db.capabilities.dialect == "mysql" else "?"
+        now = timezone.now()
+
+        for start in range(0, len(product_ids), STOCK_UPSERT_CHUNK_SIZE):
+            chunk = product_ids[start : start + STOCK_UPSERT_CHUNK_SIZE]
+            await db.execute_query(
+                f"UPDATE product SET in_stock = (total_stock > 0), updated_at = {placeholder} "
+                f"WHERE id IN ({', '.join([placeholder] * len(chunk))}) AND in_stock <> (total_stock > 0)",
+                [now, *chunk],
+            )
+
+    @staticmethod
+    async def sync_stock(request: StockSyncRequestDTO) -> StockSyncResponseDTO:
+        """창고 재고 동기화: 옵션 ID 기준으로 여러 상품의 재고를 한 번에 반영"""
+        option_ids = [item.option_id for item in request.items]
+        product_id_by_option = dict(await Option.filter(id__in=option_ids).values_list("id", "product_id"))
+
+        rows = [
+            (product_id_by_option[item.option_id], item.option_id, item.stock)
+            for item in request.items
+            if item.option_id in product_id_by_option
+        ]
+        await StockService.bulk_upsert(rows)
+
+        missing_option_ids = sorted({option_id for option_id in option_ids if option_id not in product_id_by_option})
+        return StockSyncResponseDTO(updated_count=len({row[1] for row in rows}), missing_option_ids=missing_option_ids)
@@ -7,11 +7,13 @@ from app.promotion_product.dtos.promotion_request import (
 )
 from app.promotion_product.dtos.promotion_response import PromotionProductListResponse, PromotionProductResponse
 from app.promotion_product.services.promotion_services import PromotionProductService
+from common.utils.http_cache import cache_control
 
 router = APIRouter(prefix="/promotion-products", tags=["프로모션"])
 
 
 @router.get("/get-list", response_model=PromotionProductListResponse)
+@cache_control(max_age=60, stale_while_revalidate=300)
 async def get_promotion_products_route(
     promotion_type: str = Query(..., description="Promotion type: 'best' or 'md_pick'"),
     page: int = Query(1, ge=1),
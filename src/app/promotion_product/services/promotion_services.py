@@ -9,10 +9,12 @@ from app.promotion_product.dtos.promotion_request import (
 )
 from app.promotion_product.dtos.promotion_response import PromotionProductListResponse, PromotionProductResponse
 from app.promotion_product.models.promotion_product import PromotionProduct, PromotionType
+from core.database.db_router import read_replica
 
 
 class PromotionProductService:
     @staticmethod
+    @read_replica
     async def get_promotion_products(
         promotion_type: str, page: int = 1, size: int = 10
     ) -> PromotionProductListResponse:
@@ -45,6 +45,11 @@ class OauthRequestDTO(BaseModel):
     social_id: str
 
 
+class VerifyPhoneRequestDTO(BaseModel):
+    phone_number: str = Field(..., max_length=20)
+    verification_code: str = Field(..., min_length=6, max_length=6)
+
+
 class PasswordResetRequestDTO(BaseModel):
     name: str
     login_id: str
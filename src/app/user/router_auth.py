@@ -7,10 +7,13 @@ from app.user.dtos.request import (
     ResetPasswordRequest,
     UserCreateRequestDTO,
     UserLoginRequestDTO,
+    VerifyPhoneRequestDTO,
 )
 from app.user.dtos.response import JwtTokenResponseDTO, RefreshTokenRequest, UserLoginInfoResponseDTO
 from app.user.services.auth_service import AuthenticateService, get_token_from_header
 from app.user.services.user_service import UserService
+from app.user.services.verification_service import VerificationService
+from common.utils.client_ip import get_client_ip
 
 router = APIRouter(prefix="/auth", tags=["사용자 인증"])
 
@@ -32,13 +35,28 @@ async def check_login_id(
     deprecated=True,
 )
 async def send_verification_code(
+    request: Request,
     phone_number: str,
     user_service: UserService = Depends(),
 ) -> dict[str, str]:
-    await user_service.send_sms_process(phone_number=phone_number)
+    await user_service.send_sms_process(phone_number=phone_number, client_ip=get_client_ip(request))
     return {"message": "Verification code sent to your phone."}
 
 
+@router.post(
+    "/verify-phone/confirm",
+    status_code=status.HTTP_200_OK,
+    summary="휴대폰 인증번호 확인 API",
+    description="휴대폰 인증번호 확인 API입니다",
+)
+async def confirm_verification_code(
+    body: VerifyPhoneRequestDTO,
+    verification_service: VerificationService = Depends(),
+) -> dict[str, str]:
+    await verification_service.verify_code(phone_number=body.phone_number, verification_code=body.verification_code)
+    return {"message": "Phone number verified."}
+
+
 @router.post(
     "/sign-up",
     status_code=status.HTTP_201_CREATED,
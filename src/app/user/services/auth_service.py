@@ -1,9 +1,8 @@
 import random
 import time
-from typing import Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import bcrypt
-import httpx
 import jwt
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBasic, HTTPBearer
@@ -34,6 +33,9 @@ from common.exceptions.custom_exceptions import (
 )
 from core.configs import settings
 
+if TYPE_CHECKING:
+    import httpx
+
 basic_auth = HTTPBasic()
 
 
@@ -174,8 +176,15 @@ class AuthenticateService:
         return str(access_token)
 
     @staticmethod
-    async def _request_token(url: str, data: dict[str, Any]) -> httpx.Response:
-        async with httpx.AsyncClient() as client:
+    def _http_client() -> "httpx.AsyncClient":
+        # httpx는 소셜 로그인에서만 쓰므로 처음 요청할 때 불러옴 (시작 시간 단축)
+        import httpx
+
+        return httpx.AsyncClient()
+
+    @staticmethod
+    async def _request_token(url: str, data: dict[str, Any]) -> "httpx.Response":
+        async with AuthenticateService._http_client() as client:
             return await client.post(url, data=data)
 
     @staticmethod
@@ -185,7 +194,7 @@ class AuthenticateService:
     @staticmethod
     async def _get_kakao_user_info(access_token: str) -> dict[str, Any]:
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient() as client:
+        async with AuthenticateService._http_client() as client:
             response = await client.get(KAKAO_USER_INFO_URL, headers=headers)
             response.raise_for_status()
             return response.json()  # type: ignore
@@ -193,7 +202,7 @@ class AuthenticateService:
     @staticmethod
     async def _get_naver_user_info(access_token: str) -> dict[str, Any]:
         headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient() as client:
+        async with AuthenticateService._http_client() as client:
             response = await client.get(NAVER_USER_INFO_URL, headers=headers)
             response.raise_for_status()
             return response.json()  # type: ignore
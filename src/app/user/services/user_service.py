@@ -7,6 +7,7 @@ from app.user.dtos.request import UserCreateRequestDTO
 from app.user.dtos.response import JwtTokenResponseDTO, UserLoginInfoResponseDTO
 from app.user.models.user import User
 from app.user.services.auth_service import AuthenticateService
+from app.user.services.verification_service import VerificationService
 from common.constants.reset_email_message import EmailTemplates
 from common.exceptions.custom_exceptions import (
     InvalidPasswordException,
@@ -15,10 +16,7 @@ from common.exceptions.custom_exceptions import (
     SocialLoginConflictException,
     UserNotFoundException,
 )
-from common.utils.email_services import get_email_service
-from common.utils.email_services.email_service import EmailService
-from common.utils.sms_services import get_sms_service
-from common.utils.sms_services.sms_service import SmsService
+from common.utils.message_outbox.outbox_service import MessageOutboxService
 from core.configs import settings
 
 
@@ -26,12 +24,12 @@ class UserService:
     def __init__(
         self,
         auth_service: AuthenticateService = Depends(),
-        sms_service: SmsService = Depends(get_sms_service),
-        email_service: EmailService = Depends(get_email_service),
+        outbox_service: MessageOutboxService = Depends(),
+        verification_service: VerificationService = Depends(),
     ):
         self.auth_service = auth_service
-        self.sms_service = sms_service
-        self.email_service = email_service
+        self.outbox_service = outbox_service
+        self.verification_service = verification_service
 
     async def create_user(self, user_data: UserCreateRequestDTO) -> User:
 
@@ -65,10 +63,10 @@ class UserService:
         if user:
             raise LoginIdAlreadyTakenException()
 
-    async def send_sms_process(self, phone_number: str) -> None:
-        verification_code = await self.auth_service.generate_verification_code()
+    async def send_sms_process(self, phone_number: str, client_ip: str) -> None:
+        verification_code = await self.verification_service.issue_code(phone_number=phone_number, client_ip=client_ip)
 
-        await self.sms_service.send_sms(phone_number, verification_code)
+        await self.outbox_service.enqueue_sms(phone_number, verification_code)
 
     async def handle_login(self, login_id: str, password: str) -> JwtTokenResponseDTO:
         user = await User.filter(login_id=login_id).first()
@@ -164,7 +162,7 @@ class UserService:
 
         message = EmailTemplates.RESET_PASSWORD.format(user_name=user.name, reset_link=reset_link)
 
-        await self.email_service.send_email(subject="micgolf 비밀번호 초기화", to=user.email, message=message)
+        await self.outbox_service.enqueue_email(subject="micgolf 비밀번호 초기화", to=user.email, message=message)
 
     async def reset_password(self, token: str, new_password: str) -> None:
         reset_token_payload: ResetTokenPayloadTypedDict = await self.auth_service._decode_reset_token(token)
@@ -0,0 +1,66 @@
+import hmac
+
+from fastapi import Depends
+
+from app.user.services.auth_service import AuthenticateService
+from common.exceptions.custom_exceptions import InvalidVerificationCodeException, VerificationRateLimitedException
+from common.utils.cache_services import get_cache_service
+from common.utils.cache_services.cache_service import CacheService
+from core.configs import settings
+
+VERIFICATION_CODE_KEY_PREFIX = "verification-code"
+VERIFICATION_RATE_LIMIT_KEY_PREFIX = "verification-rate"
+
+
+class VerificationService:
+    """휴대폰 인증번호를 캐시(Redis/메모리)에 보관하고 발송/확인 횟수를 토큰 버킷으로 제한"""
+
+    def __init__(
+        self,
+        auth_service: AuthenticateService = Depends(),
+        cache_service: CacheService = Depends(get_cache_service),
+    ) -> None:
+        self.auth_service = auth_service
+        self.cache_service = cache_service
+
+    async def issue_code(self, phone_number: str, client_ip: str) -> str:
+        # 한 전화번호로 반복 요청해도 같은 IP(NAT 뒤의 다른 사용자)의 발송 한도를 소진하지 않도록 전화번호부터 확인
+        await self._consume(
+            f"{VERIFICATION_RATE_LIMIT_KEY_PREFIX}:phone:{phone_number}",
+            capacity=settings.VERIFICATION_PHONE_BUCKET_CAPACITY,
+            refill_interval_seconds=settings.VERIFICATION_PHONE_REFILL_SECONDS,
+        )
+        await self._consume(
+            f"{VERIFICATION_RATE_LIMIT_KEY_PREFIX}:ip:{client_ip}",
+            capacity=settings.VERIFICATION_IP_BUCKET_CAPACITY,
+            refill_interval_seconds=settings.VERIFICATION_IP_REFILL_SECONDS,
+        )
+
+        verification_code = await self.auth_service.generate_verification_code()
+        await self.cache_service.set(
+            f"{VERIFICATION_CODE_KEY_PREFIX}:{phone_number}",
+            verification_code,
+            ttl_seconds=settings.VERIFICATION_CODE_TTL_SECONDS,
+        )
+
+        return verification_code
+
+    async def verify_code(self, phone_number: str, verification_code: str) -> None:
+        await self._consume(
+            f"{VERIFICATION_RATE_LIMIT_KEY_PREFIX}:attempt:{phone_number}",
+            capacity=settings.VERIFICATION_ATTEMPT_BUCKET_CAPACITY,
+            refill_interval_seconds=settings.VERIFICATION_ATTEMPT_REFILL_SECONDS,
+        )
+
+        key = f"{VERIFICATION_CODE_KEY_PREFIX}:{phone_number}"
+        stored_code = await self.cache_service.get(key)
+
+        if stored_code is None or not hmac.compare_digest(stored_code, verification_code):
+            raise InvalidVerificationCodeException()
+
+        # 인증번호는 한 번만 사용 가능
+        await self.cache_service.delete(key)
+
+    async def _consume(self, key: str, capacity: int, refill_interval_seconds: float) -> None:
+        if not await self.cache_service.consume_token(key, capacity, refill_interval_seconds):
+            raise VerificationRateLimitedException()
@@ -0,0 +1,57 @@
+"""
+워커 부팅(import) 시간 측정
+
+새 인터프리터에서 `import main`을 반복 실행해 중앙값을 구하고,
+-X importtime 결과에서 누적 시간이 큰 최상위 모듈을 함께 출력
+ex) cd src
+    python -m benchmarks.boot_time --runs 5 --top 15
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def measure_import(module: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True, capture_output=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def slowest_imports(module: str, top: int) -> list[tuple[int, str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], check=True, capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # 대상 모듈이 직접 import한 모듈만 (하위 모듈 중복 집계 방지)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(args: argparse.Namespace) -> None:
+    samples = [measure_import(args.module) for _ in range(args.runs)]
+    print(f"import {args.module}: median={statistics.median(samples):.0f}ms min={min(samples):.0f}ms")
+
+    print(f"top {args.top} imports of {args.module} (cumulative):")
+    for cumulative_us, name in slowest_imports(args.module, args.top):
+        print(f"  {cumulative_us / 1000:8.1f}ms  {name}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure worker import/boot time")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,146 @@
+"""벤치마크용 카탈로그/주문/장바구니 데이터 생성"""
+
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from app.cart.models.cart import Cart
+from app.category.models.category import Category, CategoryProduct
+from app.order.models.order import NonUserOrder, NonUserOrderProduct
+from app.product.models.product import CountProduct, Option, OptionImage, Product
+from app.user.models.user import User
+
+COLORS = [("black", "#000000"), ("white", "#FFFFFF"), ("navy", "#000080"), ("red", "#FF0000")]
+SIZES = ["S", "M", "L", "XL"]
+ORDER_STATUSES = ["UNPAID", "ITEM_PENDING", "CONFIRMED", "SHIPPING", "DELIVERED"]
+BATCH_SIZE = 1000
+SEED_STOCK = 1_000_000
+
+
+@dataclass
+class SeedConfig:
+    products: int = 2000
+    options_per_product: int = 4
+    images_per_option: int = 2
+    root_categories: int = 5
+    subcategories_per_root: int = 4
+    orders: int = 1000
+    users: int = 50
+    random_seed: int = 42
+
+
+@dataclass
+class SeedData:
+    product_ids: list[int] = field(default_factory=list)
+    category_ids: list[int] = field(default_factory=list)
+    # (product_id, option_id, color, size, price)
+    options: list[tuple[int, int, str, str, Decimal]] = field(default_factory=list)
+    order_ids: list[int] = field(default_factory=list)
+    user_ids: list[int] = field(default_factory=list)
+
+
+async def seed(config: SeedConfig) -> SeedData:
+    rng = random.Random(config.random_seed)
+    data = SeedData()
+
+    roots = [await Category.create(name=f"root_{i}", depth=0) for i in range(config.root_categories)]
+    for root in roots:
+        data.category_ids.append(root.id)
+        for j in range(config.subcategories_per_root):
+            child = await Category.create(name=f"{root.name}_{j}", parent=root, depth=1)
+            data.category_ids.append(child.id)
+
+    await Product.bulk_create(
+        [
+            Product(
+                name=f"Benchmark Product {i}",
+                price=price,
+                origin_price=Decimal(300_000),
+                sale_price=price,
+                description="benchmark",
+                detail="<p>benchmark detail</p>",
+                product_code=f"BENCH{i:06d}",
+                total_stock=SEED_STOCK * config.options_per_product,
+                in_stock=True,
+            )
+            for i, price in enumerate(Decimal(rng.randrange(10_000, 300_000, 1000)) for _ in range(config.products))
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    # MySQL bulk_create는 PK를 채워주지 않으므로 다시 조회
+    products = await Product.filter(product_code__startswith="BENCH").order_by("id")
+    data.product_ids = [product.id for product in products]
+
+    await CategoryProduct.bulk_create(
+        [CategoryProduct(category_id=rng.choice(data.category_ids), product_id=product.id) for product in products],
+        batch_size=BATCH_SIZE,
+    )
+
+    variants = [(color, code, size) for color, code in COLORS for size in SIZES][: config.options_per_product]
+    await Option.bulk_create(
+        [
+            Option(product_id=product.id, color=color, color_code=code, size=size, stock=SEED_STOCK)
+            for product in products
+            for color, code, size in variants
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    price_map = {product.id: product.price for product in products}
+    options = await Option.filter(product_id__in=data.product_ids).order_by("id")
+    data.options = [
+        (option.product_id, option.id, option.color, option.size, price_map[option.product_id])  # type: ignore[attr-defined]
+        for option in options
+    ]
+
+    await CountProduct.bulk_create(
+        [
+            CountProduct(product_id=product_id, option_id=option_id, count=SEED_STOCK)
+            for product_id, option_id, *_ in data.options
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    await OptionImage.bulk_create(
+        [
+            OptionImage(option_id=option_id, image_url=f"https://cdn.example.com/{option_id}_{k}.jpg")
+            for _, option_id, *_ in data.options
+            for k in range(config.images_per_option)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    await NonUserOrder.bulk_create(
+        [NonUserOrder(name=f"buyer_{i}", phone=f"010{i:08d}", shipping_address="Seoul") for i in range(config.orders)],
+        batch_size=BATCH_SIZE,
+    )
+    data.order_ids = list(await NonUserOrder.filter(name__startswith="buyer_").order_by("id").values_list("id", flat=True))  # type: ignore[arg-type]
+    order_products = []
+    for order_id in data.order_ids:
+        for product_id, option_id, _, _, price in rng.sample(data.options, k=2):
+            order_products.append(
+                NonUserOrderProduct(
+                    order_id=order_id,
+                    product_id=product_id,
+                    option_id=option_id,
+                    quantity=rng.randint(1, 3),
+                    price=price,
+                    current_status=rng.choice(ORDER_STATUSES),
+                )
+            )
+    await NonUserOrderProduct.bulk_create(order_products, batch_size=BATCH_SIZE)
+
+    for i in range(config.users):
+        user = await User.create(
+            name=f"bench_user_{i}",
+            email=f"bench_user_{i}@example.com",
+            login_id=f"bench_user_{i}",
+            password="benchmark",
+        )
+        data.user_ids.append(user.id)
+        await Cart.bulk_create(
+            [
+                Cart(user_id=user.id, product_id=product_id, option_id=option_id, product_count=1)
+                for product_id, option_id, *_ in rng.sample(data.options, k=3)
+            ]
+        )
+
+    return data
@@ -0,0 +1,121 @@
+"""
+상품 목록 응답 직렬화 마이크로 벤치마크
+
+옵션 트리(색상별 이미지/사이즈)를 모두 포함한 상품 페이지를 메모리에서 만들어
+FastAPI 기본 경로와 ModelJSONResponse의 직렬화 시간을 비교 (DB 불필요)
+ex) cd src
+    python -m benchmarks.serialization --products 100 --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from starlette.responses import JSONResponse
+
+from app.product.dtos.response import (
+    OptionDTO,
+    OptionImageDTO,
+    OptionSizeDTO,
+    ProductDTO,
+    ProductResponseDTO,
+    ProductsResponseDTO,
+)
+from common.utils.json_response import ModelJSONResponse
+
+COLORS = ["블랙", "화이트", "네이비", "레드", "그레이"]
+SIZES = ["S", "M", "L", "XL", "XXL"]
+
+
+def build_page(product_count: int, images_per_color: int) -> ProductsResponseDTO:
+    products = []
+    for i in range(1, product_count + 1):
+        options = [
+            OptionDTO(
+                id=i * 10 + c,
+                color=color,
+                color_code=f"#{c:06d}",
+                images=[
+                    OptionImageDTO(id=i * 100 + c * 10 + n, image_url=f"https://cdn.example.com/images/{i}_{c}_{n}.jpg")
+                    for n in range(images_per_color)
+                ],
+                sizes=[OptionSizeDTO(id=i * 100 + c * 10 + s, size=size, stock=s * 3) for s, size in enumerate(SIZES)],
+            )
+            for c, color in enumerate(COLORS)
+        ]
+        product = ProductDTO(
+            id=i,
+            name=f"골프 상품 {i}",
+            price=85000,
+            discount=15,
+            discount_option="PERCENT",
+            origin_price=100000,
+            description="기능성 골프 웨어 " * 5,
+            detail="<p>상세 설명</p>" * 10,
+            brand="MICGOLF",
+            status="Y",
+            product_code=f"BENCH{i:05d}",
+        )
+        products.append(ProductResponseDTO.build(product=product, options=options))
+    return ProductsResponseDTO.build(products=products, total_count=product_count)
+
+
+def build_serializers(page: ProductsResponseDTO) -> dict[str, Callable[[], Awaitable[bytes]]]:
+    field = create_model_field(name="Response_products", type_=ProductsResponseDTO, mode="serialization")
+
+    async def fastapi_response_model() -> bytes:
+        # response_model 지정 시 FastAPI 기본 경로: 재검증 + dict 변환 + json.dumps
+        content = await serialize_response(field=field, response_content=page)
+        return bytes(JSONResponse(content).body)
+
+    async def jsonable_encoder_json() -> bytes:
+        # response_model 없이 모델을 반환할 때의 기본 경로
+        return bytes(JSONResponse(jsonable_encoder(page)).body)
+
+    async def model_json_response() -> bytes:
+        return bytes(ModelJSONResponse(page).body)
+
+    return {
+        "fastapi_response_model": fastapi_response_model,
+        "jsonable_encoder": jsonable_encoder_json,
+        "model_json_response": model_json_response,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    page = build_page(args.products, args.images_per_color)
+    serializers = build_serializers(page)
+
+    bodies = {name: await serialize() for name, serialize in serializers.items()}
+    assert len({json.dumps(json.loads(body), sort_keys=True) for body in bodies.values()}) == 1, "직렬화 결과가 다름"
+    print(f"products={args.products} response_size={len(bodies['model_json_response']) / 1024:.1f}KiB")
+
+    baseline_ms = None
+    for name, serialize in serializers.items():
+        samples = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            await serialize()
+            samples.append((time.perf_counter() - started) * 1000)
+
+        median_ms = statistics.median(samples)
+        baseline_ms = baseline_ms or median_ms
+        print(f"{name:<24} median={median_ms:8.3f}ms  x{baseline_ms / median_ms:5.1f}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark product list response serialization")
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--images-per-color", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=200)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -127,3 +127,13 @@ class JWTAccessNotProvidedException(CustomException):
 class InvalidTokenException(CustomException):
     def __init__(self) -> None:
         super().__init__(ErrorCode.INVALID_TOKEN)
+
+
+class InvalidVerificationCodeException(CustomException):
+    def __init__(self) -> None:
+        super().__init__(ErrorCode.INVALID_VERIFICATION_CODE)
+
+
+class VerificationRateLimitedException(CustomException):
+    def __init__(self) -> None:
+        super().__init__(ErrorCode.VERIFICATION_RATE_LIMITED)
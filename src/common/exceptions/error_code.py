@@ -30,6 +30,10 @@ class ErrorCode(Enum):
     JWT_ACCESS_NOT_PROVIDED = (4004, "JWT access token not provided.", 401)
     INVALID_TOKEN = (4005, "Invalid token or user ID not found in token.", 401)
 
+    # 인증번호 관련 에러 (5000 ~ 5999)
+    INVALID_VERIFICATION_CODE = (5001, "Verification code is invalid or expired.", 400)
+    VERIFICATION_RATE_LIMITED = (5002, "Too many verification requests. Please try again later.", 429)
+
     def __init__(self, code: int, message: str, status_code: int) -> None:
         self._code = code
         self._message = message
@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+
+from app.order.services.payment_webhook_service import payment_webhook_consumer
+from app.product.services.flash_sale_stock_service import flash_sale_stock_writer
+from app.product.services.inventory_ledger_service import inventory_snapshot_worker
+from app.product.services.stock_hold_service import stock_hold_sweeper
+from common.utils.message_outbox.outbox_worker import message_outbox_worker
+
+BACKGROUND_WORKERS = (
+    payment_webhook_consumer,
+    message_outbox_worker,
+    inventory_snapshot_worker,
+    stock_hold_sweeper,
+    flash_sale_stock_writer,
+)
+
+
+async def start_background_tasks() -> None:
+    for worker in BACKGROUND_WORKERS:
+        await worker.start()
+
+
+async def stop_background_tasks() -> None:
+    for worker in reversed(BACKGROUND_WORKERS):
+        await worker.stop()
+
+
+def attach_background_task_handlers(app: FastAPI) -> None:
+    app.add_event_handler("startup", start_background_tasks)
+    # 종료 시 마지막 반영(웹훅, 한정 판매 재고)이 DB에 기록되도록 ORM 종료 핸들러보다 먼저 실행
+    app.router.on_shutdown.insert(0, stop_background_tasks)
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException
@@ -12,10 +14,19 @@ from core.configs import settings
 logger = setup_logger("error_logger", settings=settings, enable_tortoise_logging=True)
 
 
+def _client_error_extra(request: Request, status_code: int) -> dict[str, Any]:
+    # 4xx는 클라이언트 입력 문제라 스택트레이스 없이 일부만 샘플링하여 기록
+    return {"path": request.url.path, "status_code": status_code, "sample_rate": settings.LOG_4XX_SAMPLE_RATE}
+
+
 def attach_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-        logger.error(f"Unexpected Error: {str(exc)} | Path: {request.url.path}", exc_info=exc)
+        logger.error(
+            f"Unexpected Error: {str(exc)} | Path: {request.url.path}",
+            exc_info=exc,
+            extra={"path": request.url.path, "status_code": 500},
+        )
         return JSONResponse(
             status_code=500,
             content={
@@ -29,7 +40,7 @@ def attach_exception_handlers(app: FastAPI) -> None:
     async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
         logger.warning(
             f"HTTPException: {exc.detail} | Path: {request.url.path} | Status: {exc.status_code}",
-            exc_info=exc,
+            extra=_client_error_extra(request, exc.status_code),
         )
         return JSONResponse(
             status_code=exc.status_code,
@@ -42,7 +53,10 @@ def attach_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-        logger.warning(f"Validation Error: {exc.errors()} | Path: {request.url.path}", exc_info=exc)
+        logger.warning(
+            f"Validation Error: {exc.errors()} | Path: {request.url.path}",
+            extra=_client_error_extra(request, 422),
+        )
         error_messages = []
         for error in exc.errors():
             field = ".".join(map(str, error["loc"]))  # 필드 위치
@@ -60,7 +74,10 @@ def attach_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(DoesNotExist)
     async def does_not_exist_exception_handler(request: Request, exc: DoesNotExist) -> JSONResponse:
-        logger.warning(f"DoesNotExist Error: {str(exc)} | Path: {request.url.path}", exc_info=exc)
+        logger.warning(
+            f"DoesNotExist Error: {str(exc)} | Path: {request.url.path}",
+            extra=_client_error_extra(request, 404),
+        )
         return JSONResponse(
             status_code=404,
             content={
@@ -72,7 +89,10 @@ def attach_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(TypeError)
     async def type_error_exception_handler(request: Request, exc: TypeError) -> JSONResponse:
-        logger.warning(f"Type Error: {str(exc)} | Path: {request.url.path}", exc_info=exc)
+        logger.warning(
+            f"Type Error: {str(exc)} | Path: {request.url.path}",
+            extra=_client_error_extra(request, 400),
+        )
         return JSONResponse(
             status_code=400,
             content={
@@ -1,8 +1,16 @@
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
 from common.middlewares.access_token_middleware import AccessTokenMiddleware
+from common.middlewares.etag_middleware import ETagMiddleware
+from common.middlewares.http_cache_middleware import HttpCacheMiddleware
+from common.middlewares.metrics_middleware import MetricsMiddleware
+from common.middlewares.query_counter_middleware import QueryCounterMiddleware
+from common.utils.http_cache import validate_cache_policies
+from common.utils.query_counter import install_query_counter
+from core.configs import settings
 
 
 def attach_middleware_handlers(app: FastAPI) -> None:
@@ -29,6 +37,18 @@ def attach_middleware_handlers(app: FastAPI) -> None:
         allow_headers=["*"],
     )
     app.add_middleware(AccessTokenMiddleware)
+
+    validate_cache_policies(app.routes)
+    app.add_middleware(HttpCacheMiddleware)
+    app.add_middleware(ETagMiddleware)
+
+    if settings.DB_QUERY_INSTRUMENTATION:
+        install_query_counter()
+        app.add_middleware(QueryCounterMiddleware)
+
+    app.add_middleware(MetricsMiddleware)
+    # ETag는 압축 전 본문 기준(weak ETag)으로 계산되도록 압축을 가장 바깥에 둠 (Vary: Accept-Encoding은 GZipMiddleware가 추가)
+    app.add_middleware(GZipMiddleware, minimum_size=settings.RESPONSE_GZIP_MINIMUM_SIZE)
     # app.add_middleware(CommonResponseMiddleware)
     # app.add_middleware(
     #     TrustedHostMiddleware,
@@ -0,0 +1,16 @@
+from fastapi import FastAPI
+
+from core.configs import settings
+
+
+def attach_warmup_handlers(app: FastAPI) -> None:
+    if not settings.STARTUP_WARMUP:
+        return
+
+    from common.utils.warmup import warm_up
+
+    # 다른 startup 핸들러(ORM 초기화, 백그라운드 워커) 이후에 실행되도록 마지막에 등록
+    async def warm_up_app() -> None:
+        await warm_up(app)
+
+    app.add_event_handler("startup", warm_up_app)
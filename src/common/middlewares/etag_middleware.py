@@ -0,0 +1,56 @@
+import hashlib
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+# 사용자와 무관하게 같은 내용을 내려주는 카탈로그 조회 API
+CATALOG_PATH_PREFIXES = (
+    "/api/v1/products",
+    "/api/v1/category",
+    "/api/v1/banners",
+    "/api/v1/promotion-products",
+)
+
+
+def make_etag(body: bytes) -> str:
+    # 압축 전 본문 기준이므로 weak ETag (gzip 압축본과 원본이 같은 ETag를 공유)
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교 (W/ 접두사 유무와 관계없이 값만 비교)
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """카탈로그 GET 응답에 본문 해시 기반 weak ETag를 붙이고, If-None-Match가 일치하면 304 반환"""
+
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        response = await call_next(request)
+
+        if (
+            request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or not request.url.path.startswith(CATALOG_PATH_PREFIXES)
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+        etag = make_etag(body)
+        # @cache_control 정책이 있으면 유지하고, 없으면 매번 재검증하도록 no-cache
+        headers = {"ETag": etag, "Cache-Control": response.headers.get("cache-control", "no-cache")}
+        if "vary" in response.headers:
+            headers["Vary"] = response.headers["vary"]
+
+        if etag_matches(request.headers.get("if-none-match", ""), etag):
+            return Response(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            media_type=response.media_type,
+        )
@@ -0,0 +1,27 @@
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from common.utils.http_cache import get_cache_policy, purge_targets, schedule_purge
+
+
+class HttpCacheMiddleware(BaseHTTPMiddleware):
+    """
+    - @cache_control이 선언된 GET 라우트의 200 응답에 Cache-Control/Vary 헤더 추가
+    - 카탈로그 변경 요청이 성공하면 관련 공개 캐시 무효화 훅 실행
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        response = await call_next(request)
+
+        if request.method in ("GET", "HEAD"):
+            policy = get_cache_policy(request.scope.get("route"))
+            if policy and response.status_code == 200:
+                response.headers["Cache-Control"] = policy.cache_control
+                for header in policy.vary:
+                    response.headers.add_vary_header(header)
+        elif response.status_code < 400:
+            schedule_purge(purge_targets(request.url.path))
+
+        return response
@@ -0,0 +1,33 @@
+import time
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import BaseRoute
+
+from common.utils.metrics import HTTP_REQUEST_DURATION_SECONDS, HTTP_REQUESTS_IN_FLIGHT, HTTP_REQUESTS_TOTAL
+
+# 매칭되는 라우트가 없는 요청은 경로별로 라벨을 만들지 않도록 하나로 묶음
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """라우트 템플릿(/products/{product_id}) 단위로 요청 수, 응답 코드, 처리 시간 기록"""
+
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        method = request.method
+        started_at = time.perf_counter()
+        status_code = 500
+
+        HTTP_REQUESTS_IN_FLIGHT.labels(method).inc()
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.labels(method).dec()
+
+            route: BaseRoute | None = request.scope.get("route")
+            route_path = getattr(route, "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION_SECONDS.labels(method, route_path).observe(time.perf_counter() - started_at)
+            HTTP_REQUESTS_TOTAL.labels(method, route_path, str(status_code)).inc()
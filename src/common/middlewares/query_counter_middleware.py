@@ -0,0 +1,34 @@
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from common.utils.logger import setup_logger
+from common.utils.query_counter import track_queries
+from core.configs import settings
+
+logger = setup_logger("query_counter_logger", settings=settings)
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """요청별 쿼리 수/DB 시간을 응답 헤더(Server-Timing, X-DB-Queries)와 로그로 남김"""
+
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        with track_queries(enforce_budget=False) as stats:
+            response = await call_next(request)
+
+        response.headers["X-DB-Queries"] = str(stats.count)
+        response.headers.append("Server-Timing", f'db;dur={stats.duration_ms};desc="{stats.count} queries"')
+
+        logger.debug(
+            f"db_queries method={request.method} path={request.url.path} status={response.status_code} "
+            f"queries={stats.count} db_ms={stats.duration_ms}"
+        )
+        for statement, count in stats.repeated_statements():
+            logger.warning(f"possible N+1 path={request.url.path} repeated={count} query={statement}")
+
+        # 응답이 이미 만들어진 뒤이므로 예산 초과는 로그만 남김 (테스트에서는 fixture가 실패로 처리)
+        if stats.budget_exceeded:
+            logger.warning(f"query budget exceeded path={request.url.path} queries={stats.count} budget={stats.budget}")
+
+        return response
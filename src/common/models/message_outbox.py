@@ -0,0 +1,36 @@
+from enum import Enum
+
+from tortoise import fields
+
+from common.models.base_model import BaseModel
+
+
+class MessageChannel(str, Enum):
+    EMAIL = "email"
+    SMS = "sms"
+
+
+class MessageStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class MessageOutbox(BaseModel):
+    id = fields.BigIntField(pk=True)
+    channel = fields.CharEnumField(MessageChannel, max_length=10)
+    recipient = fields.CharField(max_length=255)
+    subject = fields.CharField(max_length=255, null=True)
+    body = fields.TextField()
+    status = fields.CharEnumField(MessageStatus, max_length=10, default=MessageStatus.PENDING)
+    attempts = fields.IntField(default=0)
+    next_attempt_at = fields.DatetimeField()
+    # 발송을 가져간(SENDING) 시각, 리스 시간이 지나도록 끝나지 않으면 워커가 종료된 것으로 보고 다시 발송
+    claimed_at = fields.DatetimeField(null=True)
+    last_error = fields.TextField(null=True)
+
+    class Meta:
+        table = "message_outbox"
+        table_description = "Outbox of email/SMS messages delivered by the background worker"
+        indexes = (("status", "next_attempt_at"),)
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
 
+from common.handlers.background_task_handler import attach_background_task_handlers
 from common.handlers.exception_handler import attach_exception_handlers
 from common.handlers.middleware_handler import attach_middleware_handlers
 from common.handlers.router_handler import attach_router_handlers
+from common.handlers.warmup_handler import attach_warmup_handlers
 
 
 def post_construct(app: FastAPI) -> None:
     attach_router_handlers(app)
     attach_exception_handlers(app=app)
     attach_middleware_handlers(app=app)
+    attach_background_task_handlers(app=app)
+    attach_warmup_handlers(app=app)
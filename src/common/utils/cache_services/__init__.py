@@ -0,0 +1,29 @@
+from common.utils.cache_services.cache_service import CacheService
+from core.configs import settings
+from core.configs.settings import Env
+
+_cache_service: CacheService | None = None
+
+
+def get_cache_service() -> "CacheService":
+    global _cache_service
+    if _cache_service is not None:
+        return _cache_service
+
+    service_type = settings.CACHE_SERVICE_TYPE
+    if service_type == "redis":
+        from common.utils.cache_services.redis_cache_service import RedisCacheService
+
+        _cache_service = RedisCacheService()
+    elif service_type == "memory":
+        # 메모리 캐시는 프로세스마다 따로 있어 여러 워커가 인증번호, 요청 제한, 재고 카운터를 공유하지 못함
+        if settings.ENV != Env.LOCAL:
+            raise ValueError(f"Memory cache service is only allowed in local environment: {settings.ENV}")
+
+        from common.utils.cache_services.memory_cache_service import MemoryCacheService
+
+        _cache_service = MemoryCacheService()
+    else:
+        raise ValueError(f"Unsupported cache service type: {service_type}")
+
+    return _cache_service
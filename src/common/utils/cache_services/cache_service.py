@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheService(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def set_if_absent(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> bool:
+        """키가 없을 때만 저장하고, 저장 여부를 반환"""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def consume_token(self, key: str, capacity: int, refill_interval_seconds: float) -> bool:
+        """토큰 버킷에서 토큰 1개를 소비하고, 소비 성공 여부를 반환 (refill_interval_seconds마다 1개 충전)"""
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        pass
+
+    @abstractmethod
+    async def decrement_counters(self, keys: list[str], amounts: list[int], journal_key: str) -> Optional[list[str]]:
+        """
+        존재하는 카운터만 대상으로, 모두 충분하면 한 번에 차감하고 차감한 키 목록을 반환
+        - 하나라도 부족하면 아무것도 차감하지 않고 None
+        - 차감량은 journal_key 해시에 키별로 누적
+        """
+        pass
+
+    @abstractmethod
+    async def increment_counters(self, keys: list[str], amounts: list[int], journal_key: str) -> list[str]:
+        """존재하는 카운터만 증가시키고(journal_key에도 누적) 증가한 키 목록을 반환"""
+        pass
+
+    @abstractmethod
+    async def drain_journal(self, journal_key: str, batch_id: str) -> dict[str, dict[str, int]]:
+        """
+        누적된 저널을 batch_id의 처리 중 배치로 옮기고, ack_journal 전인 모든 배치(batch_id -> 변동량)를 반환
+        반영에 실패해도 다음 호출에서 재시도할 수 있도록 함 (이미 반영한 배치인지는 호출한 쪽에서 batch_id로 확인)
+        """
+        pass
+
+    @abstractmethod
+    async def ack_journal(self, journal_key: str, batch_ids: list[str]) -> None:
+        """drain_journal로 가져온 배치 반영 완료"""
+        pass
+
+    @abstractmethod
+    async def refresh_lock(self, key: str, token: str, ttl_seconds: int) -> bool:
+        """token으로 잡은 잠금이면 만료를 연장하고, 연장 여부를 반환"""
+        pass
+
+    @abstractmethod
+    async def release_lock(self, key: str, token: str) -> None:
+        """token으로 잡은 잠금일 때만 해제 (만료 후 다른 워커가 잡은 잠금은 그대로)"""
+        pass
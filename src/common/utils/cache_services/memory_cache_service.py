@@ -0,0 +1,125 @@
+import time
+from typing import Optional
+
+from common.utils.cache_services.cache_service import CacheService
+
+# 만료된 키 정리를 시도하는 저장 건수 간격
+PURGE_INTERVAL = 1000
+
+
+class MemoryCacheService(CacheService):
+    """로컬 개발용 프로세스 내 캐시 (워커 간 공유되지 않음)"""
+
+    def __init__(self) -> None:
+        self._store: dict[str, tuple[str, Optional[float]]] = {}
+        self._writes = 0
+        # key -> (남은 토큰, 갱신 시각, 가득 차는 시각)
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        self._journals: dict[str, dict[str, int]] = {}
+        # journal_key -> 처리 중 배치 (batch_id -> 변동량)
+        self._journal_batches: dict[str, dict[str, dict[str, int]]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._store[key]
+            return None
+
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._store[key] = (value, expires_at)
+
+        self._writes += 1
+        if self._writes % PURGE_INTERVAL == 0:
+            self._purge_expired()
+
+    async def set_if_absent(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> bool:
+        if await self.get(key) is not None:
+            return False
+
+        await self.set(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+    async def consume_token(self, key: str, capacity: int, refill_interval_seconds: float) -> bool:
+        now = time.monotonic()
+        tokens, updated_at, _ = self._buckets.get(key, (float(capacity), now, now))
+        tokens = min(float(capacity), tokens + (now - updated_at) / refill_interval_seconds)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        # 가득 찬 버킷은 없는 버킷과 같으므로 그 시각 이후 정리 (Redis의 EXPIRE와 동일)
+        self._buckets[key] = (tokens, now, now + (capacity - tokens) * refill_interval_seconds)
+
+        self._writes += 1
+        if self._writes % PURGE_INTERVAL == 0:
+            self._purge_expired()
+        return allowed
+
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        return [await self.get(key) for key in keys]
+
+    async def decrement_counters(self, keys: list[str], amounts: list[int], journal_key: str) -> Optional[list[str]]:
+        values = await self.get_many(keys)
+        if any(value is not None and int(value) < amount for value, amount in zip(values, amounts)):
+            return None
+
+        decremented = []
+        journal = self._journals.setdefault(journal_key, {})
+        for key, value, amount in zip(keys, values, amounts):
+            if value is not None:
+                self._store[key] = (str(int(value) - amount), None)
+                journal[key] = journal.get(key, 0) - amount
+                decremented.append(key)
+        return decremented
+
+    async def increment_counters(self, keys: list[str], amounts: list[int], journal_key: str) -> list[str]:
+        incremented = []
+        journal = self._journals.setdefault(journal_key, {})
+        for key, value, amount in zip(keys, await self.get_many(keys), amounts):
+            if value is not None:
+                self._store[key] = (str(int(value) + amount), None)
+                journal[key] = journal.get(key, 0) + amount
+                incremented.append(key)
+        return incremented
+
+    async def drain_journal(self, journal_key: str, batch_id: str) -> dict[str, dict[str, int]]:
+        batches = self._journal_batches.setdefault(journal_key, {})
+        if journal := self._journals.pop(journal_key, None):
+            batches[batch_id] = journal
+        return {batch_id: dict(entries) for batch_id, entries in batches.items()}
+
+    async def ack_journal(self, journal_key: str, batch_ids: list[str]) -> None:
+        batches = self._journal_batches.get(journal_key, {})
+        for batch_id in batch_ids:
+            batches.pop(batch_id, None)
+
+    async def refresh_lock(self, key: str, token: str, ttl_seconds: int) -> bool:
+        if await self.get(key) != token:
+            return False
+        await self.set(key, token, ttl_seconds)
+        return True
+
+    async def release_lock(self, key: str, token: str) -> None:
+        if await self.get(key) == token:
+            await self.delete(key)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._store.items() if expires_at is not None and expires_at <= now]
+        for key in expired:
+            del self._store[key]
+
+        full = [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]
+        for key in full:
+            del self._buckets[key]
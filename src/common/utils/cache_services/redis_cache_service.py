@@ -0,0 +1,168 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from common.utils.cache_services.cache_service import CacheService
+from core.configs import settings
+
+# 충전과 소비를 한 번에 처리하여 여러 워커에서도 원자적으로 동작
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - updated_at) / interval)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity * interval))
+return allowed
+"""
+
+# 존재하는 카운터가 모두 충분할 때만 한 번에 차감 (ARGV[1]: 저널 키, ARGV[2..]: 차감량)
+DECREMENT_COUNTERS_SCRIPT = """
+local values = redis.call('MGET', unpack(KEYS))
+for i, value in ipairs(values) do
+    if value and tonumber(value) < tonumber(ARGV[i + 1]) then
+        return false
+    end
+end
+
+local decremented = {}
+for i, value in ipairs(values) do
+    if value then
+        redis.call('DECRBY', KEYS[i], ARGV[i + 1])
+        redis.call('HINCRBY', ARGV[1], KEYS[i], -tonumber(ARGV[i + 1]))
+        table.insert(decremented, KEYS[i])
+    end
+end
+return decremented
+"""
+
+INCREMENT_COUNTERS_SCRIPT = """
+local incremented = {}
+for i, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('INCRBY', key, ARGV[i + 1])
+        redis.call('HINCRBY', ARGV[1], key, ARGV[i + 1])
+        table.insert(incremented, key)
+    end
+end
+return incremented
+"""
+
+# 새로 쌓인 변동량을 새 배치로 옮기고, 아직 ack되지 않은 배치(이전 반영 실패)까지 함께 반환
+# KEYS[1]: 저널, KEYS[2]: 처리 중 배치 ID 집합, ARGV[1]: 배치 키 접두사, ARGV[2]: 새 배치 ID
+DRAIN_JOURNAL_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], ARGV[1] .. ARGV[2])
+    redis.call('SADD', KEYS[2], ARGV[2])
+end
+
+local batches = {}
+for _, batch_id in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+    table.insert(batches, batch_id)
+    table.insert(batches, redis.call('HGETALL', ARGV[1] .. batch_id))
+end
+return batches
+"""
+
+REFRESH_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _batches_key(journal_key: str) -> str:
+    return f"{journal_key}:batches"
+
+
+def _batch_key_prefix(journal_key: str) -> str:
+    return f"{journal_key}:batch:"
+
+
+class RedisCacheService(CacheService):
+    def __init__(self) -> None:
+        self.client: Redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.token_bucket = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+        self.decrement_counters_script = self.client.register_script(DECREMENT_COUNTERS_SCRIPT)
+        self.increment_counters_script = self.client.register_script(INCREMENT_COUNTERS_SCRIPT)
+        self.drain_journal_script = self.client.register_script(DRAIN_JOURNAL_SCRIPT)
+        self.refresh_lock_script = self.client.register_script(REFRESH_LOCK_SCRIPT)
+        self.release_lock_script = self.client.register_script(RELEASE_LOCK_SCRIPT)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(key)
+        return str(value) if value is not None else None
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        await self.client.set(key, value, ex=ttl_seconds)
+
+    async def set_if_absent(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> bool:
+        return bool(await self.client.set(key, value, ex=ttl_seconds, nx=True))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+    async def consume_token(self, key: str, capacity: int, refill_interval_seconds: float) -> bool:
+        allowed = await self.token_bucket(keys=[key], args=[capacity, refill_interval_seconds])
+        return bool(allowed)
+
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        if not keys:
+            return []
+        return [str(value) if value is not None else None for value in await self.client.mget(keys)]
+
+    async def decrement_counters(self, keys: list[str], amounts: list[int], journal_key: str) -> Optional[list[str]]:
+        if not keys:
+            return []
+        decremented = await self.decrement_counters_script(keys=keys, args=[journal_key, *amounts])
+        return list(decremented) if decremented is not None else None
+
+    async def increment_counters(self, keys: list[str], amounts: list[int], journal_key: str) -> list[str]:
+        if not keys:
+            return []
+        return list(await self.increment_counters_script(keys=keys, args=[journal_key, *amounts]))
+
+    async def drain_journal(self, journal_key: str, batch_id: str) -> dict[str, dict[str, int]]:
+        result = await self.drain_journal_script(
+            keys=[journal_key, _batches_key(journal_key)], args=[_batch_key_prefix(journal_key), batch_id]
+        )
+        batches = {}
+        for i in range(0, len(result), 2):
+            entries = result[i + 1]
+            batches[result[i]] = {entries[j]: int(entries[j + 1]) for j in range(0, len(entries), 2)}
+        return batches
+
+    async def ack_journal(self, journal_key: str, batch_ids: list[str]) -> None:
+        if not batch_ids:
+            return
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.srem(_batches_key(journal_key), *batch_ids)
+            pipe.delete(*[f"{_batch_key_prefix(journal_key)}{batch_id}" for batch_id in batch_ids])
+            await pipe.execute()
+
+    async def refresh_lock(self, key: str, token: str, ttl_seconds: int) -> bool:
+        return bool(await self.refresh_lock_script(keys=[key], args=[token, ttl_seconds]))
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self.release_lock_script(keys=[key], args=[token])
@@ -0,0 +1,39 @@
+import ipaddress
+from functools import lru_cache
+
+from fastapi import Request
+
+from core.configs import settings
+
+
+@lru_cache
+def _trusted_networks() -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    return tuple(ipaddress.ip_network(network) for network in settings.TRUSTED_PROXY_NETWORKS)
+
+
+def _is_trusted(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _trusted_networks())
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    요청한 클라이언트 IP
+    - 신뢰하는 프록시(nginx 등)를 거친 요청만 X-Forwarded-For를 오른쪽부터 보며 첫 번째 신뢰하지 않는 주소를 사용
+    - 프록시를 거치지 않은 요청의 헤더는 클라이언트가 임의로 넣을 수 있으므로 무시
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted(peer):
+        return peer
+
+    forwarded_for = [host.strip() for host in request.headers.get("x-forwarded-for", "").split(",") if host.strip()]
+    for host in reversed(forwarded_for):
+        if not _is_trusted(host):
+            return host
+
+    if forwarded_for:
+        return forwarded_for[0]
+    return request.headers.get("x-real-ip", peer).strip() or peer
@@ -1,32 +1,67 @@
-from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
+import asyncio
+from email.message import EmailMessage
+from typing import Optional
+
+from aiosmtplib import SMTP
 
 from common.utils.email_services.email_service import EmailService
 from core.configs import settings
 
 
 class SmtpEmailService(EmailService):
-    def __init__(self) -> None:
-        self.conf = ConnectionConfig(
-            MAIL_USERNAME=settings.SMTP_USER,
-            MAIL_PASSWORD=settings.SMTP_PASSWORD,
-            MAIL_FROM=settings.SMTP_USER,
-            MAIL_PORT=settings.SMTP_PORT,
-            MAIL_SERVER=settings.SMTP_HOST,
-            MAIL_STARTTLS=True,
-            MAIL_SSL_TLS=False,
-        )
-        self.fm = FastMail(self.conf)
+    """
+    SMTP 연결을 최대 SMTP_POOL_SIZE개까지 열어두고 재사용
+    메시지마다 STARTTLS/로그인을 반복하지 않도록 아웃박스 워커에서 하나의 인스턴스를 공유
+    """
+
+    def __init__(self, pool_size: int = settings.SMTP_POOL_SIZE) -> None:
+        self.pool: "asyncio.LifoQueue[Optional[SMTP]]" = asyncio.LifoQueue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self.pool.put_nowait(None)
 
     async def send_email(self, to: str, subject: str, message: str) -> dict[str, str]:
-        message_obj = MessageSchema(
-            subject=subject,  # 이메일 제목
-            recipients=[to],  # 수신자 이메일 리스트
-            body=message,  # 이메일 본문
-            subtype="html",  # 이메일 본문 형식 (HTML)
-        )
+        message_obj = EmailMessage()
+        message_obj["From"] = settings.SMTP_USER
+        message_obj["To"] = to
+        message_obj["Subject"] = subject  # 이메일 제목
+        message_obj.set_content(message, subtype="html")  # 이메일 본문 (HTML)
 
+        client = await self.pool.get()
         try:
-            await self.fm.send_message(message_obj)
+            client = await self._ensure_connected(client)
+            await client.send_message(message_obj)
             return {"status": "success", "message": "Email sent successfully."}
         except Exception as e:
+            # 끊긴 연결은 버리고 다음 사용 시 새로 연결
+            await self._quit(client)
+            client = None
             return {"status": "error", "message": str(e)}
+        finally:
+            self.pool.put_nowait(client)
+
+    async def close(self) -> None:
+        clients = []
+        while not self.pool.empty():
+            clients.append(self.pool.get_nowait())
+        for client in clients:
+            await self._quit(client)
+            self.pool.put_nowait(None)
+
+    @staticmethod
+    async def _ensure_connected(client: Optional[SMTP]) -> SMTP:
+        if client is not None and client.is_connected:
+            return client
+
+        client = SMTP(hostname=settings.SMTP_HOST, port=settings.SMTP_PORT, start_tls=True)
+        await client.connect()
+        await client.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        return client
+
+    @staticmethod
+    async def _quit(client: Optional[SMTP]) -> None:
+        if client is None or not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
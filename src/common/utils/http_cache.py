@@ -0,0 +1,123 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+from common.utils.logger import setup_logger
+from core.configs import settings
+
+logger = setup_logger("http_cache_logger", settings=settings)
+
+Endpoint = TypeVar("Endpoint", bound=Callable[..., Any])
+PurgeHook = Callable[[tuple[str, ...]], Awaitable[None]]
+
+# 관리자 변경 API 경로 -> 함께 무효화할 공개 조회 경로
+CATALOG_PURGE_TARGETS: dict[str, tuple[str, ...]] = {
+    "/api/v1/products": ("/api/v1/products", "/api/v1/promotion-products"),
+    "/api/v1/category": ("/api/v1/category", "/api/v1/products"),
+    "/api/v1/banners": ("/api/v1/banners",),
+    "/api/v1/promotion-products": ("/api/v1/promotion-products",),
+}
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int
+    stale_while_revalidate: int = 0
+    vary: tuple[str, ...] = ()  # Accept-Encoding은 GZipMiddleware가 압축 시 추가
+
+    @property
+    def cache_control(self) -> str:
+        directives = ["public", f"max-age={self.max_age}"]
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+def cache_control(
+    max_age: int, stale_while_revalidate: int = 0, vary: tuple[str, ...] = ()
+) -> Callable[[Endpoint], Endpoint]:
+    """
+    공개(사용자와 무관한) GET 라우트에 Cache-Control 정책을 선언
+    ex) @router.get("/{product_id}")
+        @cache_control(max_age=60, stale_while_revalidate=300)
+        async def get_product_handler(...): ...
+    """
+    policy = CachePolicy(max_age=max_age, stale_while_revalidate=stale_while_revalidate, vary=vary)
+
+    def decorator(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, "__cache_policy__", policy)
+        return endpoint
+
+    return decorator
+
+
+def get_cache_policy(route: Optional[BaseRoute]) -> Optional[CachePolicy]:
+    return getattr(getattr(route, "endpoint", None), "__cache_policy__", None)
+
+
+def _depends_on_user(dependant: Dependant) -> bool:
+    from app.user.services.auth_service import AuthenticateService
+
+    for dependency in dependant.dependencies:
+        if isinstance(getattr(dependency.call, "__self__", None), AuthenticateService) or _depends_on_user(dependency):
+            return True
+    return False
+
+
+def validate_cache_policies(routes: list[BaseRoute]) -> None:
+    """공개 캐시 정책이 붙은 라우트가 사용자 인증 정보에 의존하면 앱 시작 시 실패"""
+    for route in routes:
+        if isinstance(route, APIRoute) and get_cache_policy(route) and _depends_on_user(route.dependant):
+            raise ValueError(f"{route.path}는 사용자별 응답이므로 공개 캐시 정책을 사용할 수 없습니다.")
+
+
+def purge_targets(path: str) -> tuple[str, ...]:
+    for prefix, targets in CATALOG_PURGE_TARGETS.items():
+        if path.startswith(prefix):
+            return targets
+    return ()
+
+
+async def purge_http_cache(paths: tuple[str, ...]) -> None:
+    """HTTP_CACHE_PURGE_URL(nginx cache_purge, CDN 등)에 PURGE 요청 (경로 뒤 *는 하위 경로 전체)"""
+    import httpx
+
+    purge_url = settings.HTTP_CACHE_PURGE_URL
+    if not purge_url:
+        return
+
+    async with httpx.AsyncClient(base_url=purge_url, timeout=5.0) as client:
+        for path in paths:
+            response = await client.request("PURGE", f"{path}*")
+            if response.status_code >= 400 and response.status_code != 404:
+                logger.warning(f"cache purge failed path={path} status={response.status_code}")
+
+
+_purge_hooks: list[PurgeHook] = [purge_http_cache] if settings.HTTP_CACHE_PURGE_URL else []
+_pending_purges: set["asyncio.Task[None]"] = set()
+
+
+def register_purge_hook(hook: PurgeHook) -> None:
+    _purge_hooks.append(hook)
+
+
+async def purge(paths: tuple[str, ...]) -> None:
+    for hook in _purge_hooks:
+        try:
+            await hook(paths)
+        except Exception as e:
+            logger.error(f"cache purge hook failed paths={paths}: {e}")
+
+
+def schedule_purge(paths: tuple[str, ...]) -> None:
+    """응답을 지연시키지 않도록 백그라운드에서 무효화"""
+    if not paths or not _purge_hooks:
+        return
+
+    task = asyncio.create_task(purge(paths))
+    _pending_purges.add(task)
+    task.add_done_callback(_pending_purges.discard)
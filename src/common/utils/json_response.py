@@ -0,0 +1,17 @@
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    pydantic-core(Rust) 직렬화기로 바로 bytes를 만드는 JSON 응답
+
+    - 앱 기본 응답 클래스로 사용하면 response_model 직렬화 결과를 json.dumps 대신 to_json으로 인코딩
+    - 대용량 목록 API는 DTO를 그대로 감싸 반환하면 response_model 재검증과 dict 변환 단계를 모두 건너뜀
+      ex) return ModelJSONResponse(await ProductService.get_products_with_options(...))
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
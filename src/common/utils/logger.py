@@ -1,12 +1,111 @@
+import atexit
+import copy
+import json
 import logging
 import os
-from typing import Optional
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 from core.configs import Settings  # type: ignore
 from core.configs.settings import Env
 
 formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
+# LogRecord 기본 속성 (extra로 넘긴 값만 JSON 필드로 출력하기 위해 제외)
+_RESERVED_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        log: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        log.update(
+            {
+                key: value
+                for key, value in vars(record).items()
+                if key not in _RESERVED_RECORD_ATTRS and key != "sample_rate"
+            }
+        )
+        if record.exc_info:
+            log["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log["exc_info"] = record.exc_text
+        return json.dumps(log, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """extra={"sample_rate": 0.1}로 기록된 로그는 해당 비율만 남김 (반복되는 4xx 로그 등)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        sample_rate = getattr(record, "sample_rate", None)
+        return sample_rate is None or random.random() < sample_rate
+
+
+class _RoutingHandler(logging.Handler):
+    """리스너 스레드에서 로거 이름별 실제 핸들러(파일/콘솔)로 전달"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.targets: dict[str, logging.Handler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        target = self.targets.get(record.name)
+        if target is not None:
+            target.handle(record)
+
+
+class _ExceptionKeepingQueueHandler(QueueHandler):
+    """
+    QueueHandler.prepare는 예외를 메시지에 합치고 exc_info를 지우므로, 메시지만 합치고 예외는 exc_text로 남김
+    (리스너 스레드의 JsonFormatter가 exc_info 필드로 출력)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_routing_handler = _RoutingHandler()
+_listener: Optional[QueueListener] = None
+
+
+def _queue_handler() -> logging.Handler:
+    """이벤트 루프에서는 큐에 넣기만 하고, 디스크/콘솔 출력은 리스너 스레드가 담당"""
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_log_queue, _routing_handler, respect_handler_level=False)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+    handler = _ExceptionKeepingQueueHandler(_log_queue)
+    handler.addFilter(SamplingFilter())
+    return handler
+
+
+def _target_handler(name: str, settings: Settings) -> logging.Handler:
+    handler: logging.Handler
+    if settings.ENV == Env.LOCAL:
+        handler = logging.StreamHandler()
+    else:
+        handler = logging.FileHandler(os.path.join(settings.PROJECT_ROOT, "logs", f"{name}.log"))
+
+    handler.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else formatter)
+    return handler
+
 
 def setup_logger(
     name: str = "app_logger",
@@ -26,22 +125,15 @@ def setup_logger(
         os.makedirs(log_dir, exist_ok=True)
 
     if not logger.hasHandlers():
-        if is_local_env:
-            handler: logging.Handler = logging.StreamHandler()
-        else:
-            log_file = os.path.join(settings.PROJECT_ROOT, "logs", f"{name}.log")
-            handler = logging.FileHandler(log_file)
-
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _routing_handler.targets[name] = _target_handler(name, settings)
+        logger.addHandler(_queue_handler())
 
     if enable_tortoise_logging and is_local_env:
         db_client_logger = logging.getLogger("tortoise.db_client")
         db_client_logger.setLevel(logging.DEBUG)
 
         if not db_client_logger.hasHandlers():
-            db_handler = logging.StreamHandler()
-            db_handler.setFormatter(formatter)
-            db_client_logger.addHandler(db_handler)
+            _routing_handler.targets["tortoise.db_client"] = _target_handler("tortoise.db_client", settings)
+            db_client_logger.addHandler(_queue_handler())
 
     return logger
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from tortoise import timezone
+
+from common.models.message_outbox import MessageChannel, MessageOutbox
+from common.utils.message_outbox.outbox_worker import message_outbox_worker
+
+
+class MessageOutboxService:
+    """요청 처리 중에는 발송 내역만 적재하고, 실제 발송은 MessageOutboxWorker가 수행"""
+
+    async def enqueue_email(self, to: str, subject: str, message: str) -> MessageOutbox:
+        return await self._enqueue(channel=MessageChannel.EMAIL, recipient=to, subject=subject, body=message)
+
+    async def enqueue_sms(self, phone_number: str, message: str) -> MessageOutbox:
+        return await self._enqueue(channel=MessageChannel.SMS, recipient=phone_number, body=message)
+
+    @staticmethod
+    async def _enqueue(
+        channel: MessageChannel, recipient: str, body: str, subject: Optional[str] = None
+    ) -> MessageOutbox:
+        outbox = await MessageOutbox.create(
+            channel=channel,
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            next_attempt_at=timezone.now(),
+        )
+        message_outbox_worker.wake()
+        return outbox
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import timedelta
+from typing import Optional
+
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
+from common.models.message_outbox import MessageChannel, MessageOutbox, MessageStatus
+from common.utils.email_services import get_email_service
+from common.utils.email_services.email_service import EmailService
+from common.utils.logger import setup_logger
+from common.utils.sms_services import get_sms_service
+from common.utils.sms_services.sms_service import SmsService
+from core.configs import settings
+from core.database.db_router import write_connection_name
+
+logger = setup_logger("message_outbox_logger", settings=settings)
+
+
+class MessageOutboxWorker:
+    def __init__(
+        self,
+        email_service: Optional[EmailService] = None,
+        sms_service: Optional[SmsService] = None,
+        batch_size: int = settings.MESSAGE_OUTBOX_BATCH_SIZE,
+        concurrency: int = settings.MESSAGE_OUTBOX_CONCURRENCY,
+        poll_interval: float = settings.MESSAGE_OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts: int = settings.MESSAGE_OUTBOX_MAX_ATTEMPTS,
+        retry_base_seconds: int = settings.MESSAGE_OUTBOX_RETRY_BASE_SECONDS,
+        claim_lease_seconds: int = settings.MESSAGE_OUTBOX_CLAIM_LEASE_SECONDS,
+    ) -> None:
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.claim_lease_seconds = claim_lease_seconds
+        # 연결을 재사용하도록 워커가 발송 서비스 인스턴스를 계속 보유 (SMTP/HTTP 클라이언트는 첫 발송 시 생성)
+        self._email_service = email_service
+        self._sms_service = sms_service
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def email_service(self) -> EmailService:
+        if self._email_service is None:
+            self._email_service = get_email_service()
+        return self._email_service
+
+    @property
+    def sms_service(self) -> SmsService:
+        if self._sms_service is None:
+            self._sms_service = get_sms_service()
+        return self._sms_service
+
+    def wake(self) -> None:
+        """새 메시지가 적재되면 폴링 주기를 기다리지 않고 바로 발송"""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        if self._email_service is not None:
+            await self._email_service.close()
+        if self._sms_service is not None:
+            await self._sms_service.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed = await self.process_batch()
+            except Exception as e:
+                logger.error(f"Message outbox batch failed: {str(e)}", exc_info=e)
+                processed = 0
+
+            # 가득 찬 배치를 처리했다면 남은 메시지가 있을 수 있으므로 바로 다음 배치 처리
+            if processed >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def process_batch(self) -> int:
+        messages = await self._claim_batch()
+        if not messages:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(message: MessageOutbox) -> dict[str, str]:
+            async with semaphore:
+                return await self._deliver(message)
+
+        results = await asyncio.gather(*(deliver(message) for message in messages))
+
+        now = timezone.now()
+        sent_ids = []
+        failed_messages = []
+        for message, result in zip(messages, results):
+            if result.get("status") == "success":
+                sent_ids.append(message.id)
+                continue
+
+            message.attempts += 1
+            message.last_error = result.get("message", "")
+            if message.attempts >= self.max_attempts:
+                message.status = MessageStatus.FAILED
+                logger.error(f"Message delivery gave up: {message.channel} {message.id} | {message.last_error}")
+            else:
+                message.status = MessageStatus.PENDING
+                message.next_attempt_at = now + timedelta(seconds=self.retry_base_seconds * 2 ** (message.attempts - 1))
+            failed_messages.append(message)
+
+        if sent_ids:
+            await MessageOutbox.filter(id__in=sent_ids).update(status=MessageStatus.SENT)
+        if failed_messages:
+            await MessageOutbox.bulk_update(
+                failed_messages, fields=["status", "attempts", "last_error", "next_attempt_at"]
+            )
+
+        return len(messages)
+
+    async def _claim_batch(self) -> list[MessageOutbox]:
+        """발송 대상 메시지를 잠그고 SENDING으로 표시 (여러 워커가 같은 메시지를 보내지 않도록 SKIP LOCKED)"""
+        now = timezone.now()
+        async with in_transaction(write_connection_name()):
+            # 리스 시간이 지나도록 끝나지 않은 발송만 복구 (다른 워커가 보내는 중인 메시지는 그대로)
+            await MessageOutbox.filter(
+                status=MessageStatus.SENDING, claimed_at__lt=now - timedelta(seconds=self.claim_lease_seconds)
+            ).update(status=MessageStatus.PENDING)
+
+            messages = (
+                await MessageOutbox.filter(status=MessageStatus.PENDING, next_attempt_at__lte=now)
+                .select_for_update(skip_locked=True)
+                .order_by("next_attempt_at")
+                .limit(self.batch_size)
+            )
+            if messages:
+                await MessageOutbox.filter(id__in=[message.id for message in messages]).update(
+                    status=MessageStatus.SENDING, claimed_at=now
+                )
+
+        return messages
+
+    async def _deliver(self, message: MessageOutbox) -> dict[str, str]:
+        try:
+            if message.channel == MessageChannel.EMAIL:
+                return await self.email_service.send_email(
+                    to=message.recipient, subject=message.subject or "", message=message.body
+                )
+
+            return await self.sms_service.send_sms(message.recipient, message.body)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+
+message_outbox_worker = MessageOutboxWorker()
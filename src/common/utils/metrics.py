@@ -0,0 +1,72 @@
+"""
+Prometheus 메트릭 정의
+PROMETHEUS_MULTIPROC_DIR 환경 변수가 있으면 gunicorn 워커별 값을 파일로 기록하고 /metrics 조회 시 합산
+(디렉토리 생성/정리는 gunicorn.conf.py에서 처리)
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "DB 커넥션 풀 커넥션 수",
+    ["connection", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_ACQUIRE_WAIT_SECONDS = Histogram(
+    "db_pool_acquire_wait_seconds",
+    "DB 커넥션 획득 대기 시간",
+    ["connection"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0),
+)
+DB_POOL_ACQUIRE_TIMEOUTS_TOTAL = Counter(
+    "db_pool_acquire_timeouts_total",
+    "DB 커넥션 획득 타임아웃 수",
+    ["connection"],
+)
+
+OBJECT_STORAGE_DURATION_SECONDS = Histogram(
+    "object_storage_request_duration_seconds",
+    "Object Storage 호출 시간",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -1,13 +1,18 @@
 from io import BytesIO
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from common.utils.logger import setup_logger
+from common.utils.metrics import OBJECT_STORAGE_DURATION_SECONDS
 from core.configs import settings
 
+logger = setup_logger("object_storage_logger", settings=settings)
+
 
 class ObjectStorageClient:
     def __init__(self) -> None:
+        import boto3  # 워커 부팅 시간을 줄이기 위해 실제로 사용할 때 import
+
         self.s3_client = boto3.client(
             service_name="s3",
             aws_access_key_id=settings.AWS_ACCESS_KEY,
@@ -22,10 +27,10 @@ class ObjectStorageClient:
 
         try:
             self.s3_client.create_bucket(Bucket=bucket_name)
-            print(f"{bucket_name} 버킷이 생성되었습니다.")
+            logger.info(f"{bucket_name} 버킷이 생성되었습니다.")
             return True
         except ClientError as e:
-            print(f"{bucket_name} 생성에 실패하였습니다: {e}")
+            logger.error(f"{bucket_name} 생성에 실패하였습니다: {e}")
             return False
 
     def upload_file(self, bucket_name: str, file_path: str, object_name: str | None = None) -> str | None:
@@ -35,33 +40,34 @@ class ObjectStorageClient:
 
         try:
             self.s3_client.upload_file(file_path, bucket_name, object_name)
-            print(f"{file_path} 파일이 {object_name} 으로 {bucket_name}에 저장되었습니다.")
+            logger.info(f"{file_path} 파일이 {object_name} 으로 {bucket_name}에 저장되었습니다.")
             return f"{self.s3_client.meta.endpoint_url}/{bucket_name}/{object_name}"
         except FileNotFoundError:
-            print(f"{file_path} 가 없습니다.")
+            logger.warning(f"{file_path} 가 없습니다.")
             return None
         except NoCredentialsError:
-            print("Credentials not available.")
+            logger.error("Credentials not available.")
             return None
         except ClientError as e:
-            print(f"Failed to upload file '{file_path}': {e}")
+            logger.error(f"Failed to upload file '{file_path}': {e}")
             return None
 
     async def upload_file_obj(self, bucket_name: str, file_obj: BytesIO, object_name: str) -> str | None:
         """파일 객체를 특정 버킷에 업로드"""
         try:
             await self._upload(bucket_name=bucket_name, file_obj=file_obj, object_name=object_name)
-            print(f"{object_name} 파일이 {bucket_name}에 업로드되었습니다.")
+            logger.info(f"{object_name} 파일이 {bucket_name}에 업로드되었습니다.")
             return f"{self.s3_client.meta.endpoint_url}/{bucket_name}/{object_name}"
         except NoCredentialsError:
-            print("Credentials not available.")
+            logger.error("Credentials not available.")
             return None
         except ClientError as e:
-            print(f"Failed to upload file '{object_name}': {e}")
+            logger.error(f"Failed to upload file '{object_name}': {e}")
             return None
 
     async def _upload(self, bucket_name: str, file_obj: BytesIO, object_name: str) -> None:
-        self.s3_client.upload_fileobj(file_obj, bucket_name, object_name, ExtraArgs={"ACL": "public-read"})
+        with OBJECT_STORAGE_DURATION_SECONDS.labels("upload").time():
+            self.s3_client.upload_fileobj(file_obj, bucket_name, object_name, ExtraArgs={"ACL": "public-read"})
 
     def find_bucket(self, bucket_name: str) -> None:
         """지정된 버킷의 모든 객체와 최상위 폴더 및 파일 목록을 출력"""
@@ -69,18 +75,21 @@ class ObjectStorageClient:
             max_keys = 300
 
             # 버킷 내 모든 객체 나열
-            print("Listing all objects in the bucket:")
+            logger.info("Listing all objects in the bucket:")
             response = self.s3_client.list_objects(Bucket=bucket_name, MaxKeys=max_keys)
 
             while True:
-                print(f"IsTruncated={response.get('IsTruncated')}")
-                print(f"Marker={response.get('Marker')}")
-                print(f"NextMarker={response.get('NextMarker')}")
+                logger.info(f"IsTruncated={response.get('IsTruncated')}")
+                logger.info(f"Marker={response.get('Marker')}")
+                logger.info(f"NextMarker={response.get('NextMarker')}")
 
-                print("Object List:")
+                logger.info("Object List:")
                 for content in response.get("Contents", []):
-                    print(
-                        f" Name={content.get('Key')}, Size={content.get('Size')}, Owner={content.get('Owner', {}).get('ID')}"
+                    logger.info(
+                        " Name=%s, Size=%s, Owner=%s",
+                        content.get("Key"),
+                        content.get("Size"),
+                        content.get("Owner", {}).get("ID"),
                     )
 
                 if response.get("IsTruncated"):
@@ -96,21 +105,23 @@ class ObjectStorageClient:
             delimiter = "/"
             response = self.s3_client.list_objects(Bucket=bucket_name, Delimiter=delimiter, MaxKeys=max_keys)
 
-            print("Top level folders and files in the bucket:")
+            logger.info("Top level folders and files in the bucket:")
             while True:
-                print(f"IsTruncated={response.get('IsTruncated')}")
-                print(f"Marker={response.get('Marker')}")
-                print(f"NextMarker={response.get('NextMarker')}")
+                logger.info(f"IsTruncated={response.get('IsTruncated')}")
+                logger.info(f"Marker={response.get('Marker')}")
+                logger.info(f"NextMarker={response.get('NextMarker')}")
 
-                print("Folder List:")
+                logger.info("Folder List:")
                 for folder in response.get("CommonPrefixes", []):
-                    print(f" Name={folder.get('Prefix')}")
+                    logger.info(f" Name={folder.get('Prefix')}")
 
-                print("File List:")
+                logger.info("File List:")
                 for content in response.get("Contents", []):
-                    print(
-                        f" Name={content.get('Key')}, Size={content.get('Size')}, Owner={content.get('Owner', {})
-                          .get('ID')}"
+                    logger.info(
+                        " Name=%s, Size=%s, Owner=%s",
+                        content.get("Key"),
+                        content.get("Size"),
+                        content.get("Owner", {}).get("ID"),
                     )
 
                 if response.get("IsTruncated"):
@@ -124,37 +135,38 @@ class ObjectStorageClient:
                     break
 
         except self.s3_client.exceptions.NoSuchBucket:
-            print(f"Bucket '{bucket_name}' does not exist.")
+            logger.warning(f"Bucket '{bucket_name}' does not exist.")
         except ClientError as e:
-            print(f"An error occurred: {e}")
+            logger.error(f"An error occurred: {e}")
 
     def download_file(self, bucket_name: str, object_name: str, local_file_path: str) -> bool:
         try:
             self.s3_client.download_file(bucket_name, object_name, local_file_path)
-            print(f"{object_name} 파일이 {local_file_path} 경로에 다운로드 되었습니다.")
+            logger.info(f"{object_name} 파일이 {local_file_path} 경로에 다운로드 되었습니다.")
             return True
 
         except FileNotFoundError:
-            print(f"{object_name} 파일을 찾을 수 없습니다.")
+            logger.warning(f"{object_name} 파일을 찾을 수 없습니다.")
             return False
         except NoCredentialsError:
-            print("자격 증명을 사용할 수 없습니다.")
+            logger.error("자격 증명을 사용할 수 없습니다.")
             return False
         except ClientError as e:
-            print(f"{object_name} 다운로드에 실패하였습니다. {e}")
+            logger.error(f"{object_name} 다운로드에 실패하였습니다. {e}")
             return False
 
     async def delete_file(self, bucket_name: str, object_name: str) -> bool:
         try:
-            self.s3_client.delete_object(Bucket=bucket_name, Key=object_name)
-            print(f"{object_name}이 삭제되었습니다.")
+            with OBJECT_STORAGE_DURATION_SECONDS.labels("delete").time():
+                self.s3_client.delete_object(Bucket=bucket_name, Key=object_name)
+            logger.info(f"{object_name}이 삭제되었습니다.")
             return True
         except FileNotFoundError:
-            print(f"{object_name} 파일을 찾을 수 없습니다.")
+            logger.warning(f"{object_name} 파일을 찾을 수 없습니다.")
             return False
         except NoCredentialsError:
-            print("자격 증명을 사용할 수 없습니다.")
+            logger.error("자격 증명을 사용할 수 없습니다.")
             return False
         except ClientError as e:
-            print(f"{object_name} 삭제에 실패하였습니다. {e}")
+            logger.error(f"{object_name} 삭제에 실패하였습니다. {e}")
             return False
@@ -0,0 +1,140 @@
+import importlib
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from core.configs import settings
+
+INSTRUMENTED_METHODS = ("execute_query", "execute_query_dict", "execute_insert", "execute_many", "execute_script")
+INSTRUMENTED_BACKENDS = ("tortoise.backends.mysql.client", "tortoise.backends.sqlite.client")
+
+# 같은 형태의 쿼리를 묶기 위해 리터럴 값을 치환
+_LITERAL_PATTERN = re.compile(r"'(?:[^'\\]|\\.)*'|\b\d+(?:\.\d+)?\b")
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+_in_query: ContextVar[bool] = ContextVar("in_query", default=False)
+_installed = False
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    def __init__(self, budget: Optional[int] = None) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+        self.budget = budget
+
+    def record(self, query: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[_LITERAL_PATTERN.sub("?", query)] += 1
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 3)
+
+    def repeated_statements(self, threshold: int = settings.DB_N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """같은 형태로 threshold번 이상 실행된 쿼리 (N+1 의심)"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+    @property
+    def budget_exceeded(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def check_budget(self) -> None:
+        if self.budget_exceeded:
+            raise QueryBudgetExceeded(f"Executed {self.count} queries, exceeding the budget of {self.budget}")
+
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(max_queries: Optional[int] = None, enforce_budget: bool = True) -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 쿼리 수/시간 집계
+    예산(max_queries 또는 QueryBudget)을 넘으면 블록 종료 시 QueryBudgetExceeded (테스트에서 N+1 회귀 방지용)
+    """
+    stats = QueryStats(budget=max_queries)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+    if enforce_budget:
+        stats.check_budget()
+
+
+class QueryBudget:
+    """
+    라우트 단위 쿼리 예산 선언
+    ex) @router.get("/", dependencies=[Depends(QueryBudget(10))])
+    """
+
+    def __init__(self, max_queries: int) -> None:
+        self.max_queries = max_queries
+
+    async def __call__(self) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.budget = self.max_queries
+
+
+def _instrument(method: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(method)
+    async def wrapper(self: BaseDBAsyncClient, query: str, *args: Any, **kwargs: Any) -> Any:
+        stats = _current_stats.get()
+        # 하위 구현이 다른 execute_* 를 호출하는 경우 한 번만 집계
+        if stats is None or _in_query.get():
+            return await method(self, query, *args, **kwargs)
+
+        token = _in_query.set(True)
+        started_at = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            stats.record(query, time.perf_counter() - started_at)
+            _in_query.reset(token)
+
+    setattr(wrapper, "__query_counter__", True)
+    return wrapper
+
+
+def _client_classes() -> Iterator[type]:
+    pending = list(BaseDBAsyncClient.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        yield cls
+
+
+def install_query_counter() -> None:
+    """Tortoise DB 클라이언트의 execute_* 메서드를 감싸 요청(컨텍스트)별 쿼리 수와 시간을 집계"""
+    global _installed
+    if _installed:
+        return
+
+    for module in INSTRUMENTED_BACKENDS:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+
+    for cls in _client_classes():
+        for name in INSTRUMENTED_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__query_counter__", False):
+                setattr(cls, name, _instrument(method))
+
+    _installed = True
@@ -9,6 +9,8 @@ class NcpSmsService(SmsService):
         self.api_key = settings.NCP_API_KEY
         self.api_secret = settings.NCP_API_SECRET
         self.from_number = settings.NCP_SMS_FROM_NUMBER
+        # 발송마다 새 연결을 맺지 않도록 클라이언트를 재사용
+        self.client = httpx.AsyncClient()
 
     async def send_sms(self, phone_number: str, message: str) -> dict[str, str]:
         url = "https://api.ncloud-docs.com/sms/v1.0/send"
@@ -26,10 +28,15 @@ class NcpSmsService(SmsService):
             "content": message,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=data)
+        try:
+            response = await self.client.post(url, headers=headers, json=data)
+        except httpx.HTTPError as e:
+            return {"status": "error", "message": str(e)}
 
         if response.status_code == 200:
             return {"status": "success", "message": "SMS sent successfully."}
         else:
             return {"status": "error", "message": response.text}
+
+    async def close(self) -> None:
+        await self.client.aclose()
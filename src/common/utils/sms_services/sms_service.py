@@ -5,3 +5,7 @@ class SmsService(ABC):
     @abstractmethod
     async def send_sms(self, phone_number: str, message: str) -> dict[str, str]:
         pass
+
+    async def close(self) -> None:
+        """보유한 연결 정리 (연결을 재사용하는 구현체에서 재정의)"""
+        pass
@@ -0,0 +1,59 @@
+import asyncio
+import importlib
+import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from tortoise import connections
+
+from common.utils.cache_services import get_cache_service
+from common.utils.logger import setup_logger
+from common.utils.ncp_s3_client import get_object_storage_client
+from core.configs import settings
+
+logger = setup_logger("warmup_logger", settings=settings)
+
+# 첫 요청에서 import 비용이 생기지 않도록 미리 불러올 지연 import 모듈
+LAZY_MODULES = ("PIL.Image",)
+
+
+async def warm_up(app: FastAPI) -> None:
+    """
+    워커가 트래픽을 받기 전(startup 단계)에 커넥션 풀, 외부 클라이언트, 주요 조회 경로를 미리 준비
+    - 실패해도 워커 기동은 계속 진행 (경고 로그만 남김)
+    """
+    started_at = time.perf_counter()
+    try:
+        await asyncio.wait_for(_warm_up(app), timeout=settings.STARTUP_WARMUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning(f"startup warm-up incomplete: {e!r}")
+
+    logger.info(f"startup warm-up finished in {(time.perf_counter() - started_at) * 1000:.0f}ms")
+
+
+async def _warm_up(app: FastAPI) -> None:
+    await _prime_db_pools()
+    await _prime_clients()
+    await _prime_routes(app)
+
+
+async def _prime_db_pools() -> None:
+    # 커넥션 풀을 만들고 최소 커넥션(DB_POOL_MINSIZE)까지 미리 연결
+    for name in connections.db_config:
+        client = connections.get(name)
+        await asyncio.gather(*[client.execute_query("SELECT 1") for _ in range(settings.DB_POOL_MINSIZE)])
+
+
+async def _prime_clients() -> None:
+    await get_cache_service().get("warmup")
+    get_object_storage_client()
+    for module in LAZY_MODULES:
+        importlib.import_module(module)
+
+
+async def _prime_routes(app: FastAPI) -> None:
+    # 라우트/직렬화기/쿼리 경로를 한 번씩 실행 (응답 코드와 무관하게 실패는 무시)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://warmup") as client:
+        for path in settings.STARTUP_WARMUP_PATHS:
+            response = await client.get(path)
+            logger.debug(f"warm-up path={path} status={response.status_code}")
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from core.configs.settings import Settings
 
 
+@lru_cache
 def get_settings() -> Settings:
     return Settings()
 
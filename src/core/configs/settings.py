@@ -1,5 +1,6 @@
 import os
 from enum import StrEnum
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 
@@ -17,6 +18,27 @@ class Settings(BaseSettings):
     DB_USER: str = "root"
     DB_PASSWORD: str = "1234"
     DB_NAME: str = "micgolf"
+    DB_POOL_MINSIZE: int = 1  # 워커(프로세스)당 커넥션 풀 크기
+    DB_POOL_MAXSIZE: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 3600  # MySQL wait_timeout 이전에 커넥션 재생성
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS: float = 10.0
+    DB_READ_HOST: Optional[str] = None  # 설정 시 조회 전용 쿼리를 replica로 분산
+    DB_READ_PORT: int = 3306
+    DB_QUERY_INSTRUMENTATION: bool = True  # 요청별 쿼리 수/시간 헤더 및 로그
+    DB_N_PLUS_ONE_THRESHOLD: int = 5  # 요청 안에서 같은 형태의 쿼리가 이 횟수 이상이면 경고
+
+    STARTUP_WARMUP: bool = False  # True면 트래픽을 받기 전에 DB 풀/클라이언트/주요 조회 API를 미리 호출
+    STARTUP_WARMUP_PATHS: list[str] = [
+        "/api/v1/category",
+        "/api/v1/products",
+        "/api/v1/banners",
+        "/api/v1/promotion-products/get-list?promotion_type=best",
+    ]
+    STARTUP_WARMUP_TIMEOUT_SECONDS: float = 30.0
+    HTTP_CACHE_PURGE_URL: Optional[str] = None  # 카탈로그 변경 시 PURGE 요청을 보낼 nginx/CDN 주소
+    RESPONSE_GZIP_MINIMUM_SIZE: int = 1024  # 이 크기(byte) 이상인 응답만 gzip 압축
+    LOG_FORMAT: str = "json"  # "json" | "text"
+    LOG_4XX_SAMPLE_RATE: float = 0.1  # 반복되는 4xx 경고 로그 중 기록할 비율
 
     PROJECT_ROOT: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
 
@@ -53,6 +75,60 @@ class Settings(BaseSettings):
     SMTP_PORT: int = 587  # SMTP 서버 포트
     SMTP_USER: str = "your_email@example.com"  # SMTP 사용자명
     SMTP_PASSWORD: str = "your_email_password"  # SMTP 비밀번호
+    SMTP_POOL_SIZE: int = 4  # 재사용하는 SMTP 연결 수
+
+    # Cache settings (memory, redis)
+    CACHE_SERVICE_TYPE: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Phone verification settings
+    VERIFICATION_CODE_TTL_SECONDS: int = 180
+    VERIFICATION_PHONE_BUCKET_CAPACITY: int = 3  # 전화번호당 연속 발송 가능 횟수
+    VERIFICATION_PHONE_REFILL_SECONDS: float = 60
+    VERIFICATION_IP_BUCKET_CAPACITY: int = 20  # IP당 연속 발송 가능 횟수
+    VERIFICATION_IP_REFILL_SECONDS: float = 30
+    VERIFICATION_ATTEMPT_BUCKET_CAPACITY: int = 5  # 전화번호당 연속 확인 시도 횟수
+    VERIFICATION_ATTEMPT_REFILL_SECONDS: float = 60
+    # X-Forwarded-For/X-Real-IP를 믿을 프록시 주소 대역 (docker 네트워크의 nginx)
+    TRUSTED_PROXY_NETWORKS: list[str] = ["127.0.0.1/32", "::1/128", "10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"]
+
+    # Payment webhook settings
+    PAYMENT_WEBHOOK_SECRET: str = "your-payment-webhook-secret"
+    PAYMENT_WEBHOOK_IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60
+    PAYMENT_WEBHOOK_QUEUE_MAXSIZE: int = 10000
+    PAYMENT_WEBHOOK_BATCH_SIZE: int = 100
+    PAYMENT_WEBHOOK_FLUSH_INTERVAL_SECONDS: float = 0.5
+    # 수신 후 이 시간이 지나도록 반영되지 않은 웹훅(워커 종료, 반영 실패)은 저장된 기록에서 다시 반영
+    PAYMENT_WEBHOOK_RETRY_AFTER_SECONDS: int = 30
+    # 결제가 아직 없거나 허용되지 않는 전이인 웹훅은 이 시간 동안만 다시 반영 시도
+    PAYMENT_WEBHOOK_RETRY_WINDOW_SECONDS: int = 60 * 60
+
+    # Message outbox settings (email, SMS)
+    MESSAGE_OUTBOX_BATCH_SIZE: int = 50
+    MESSAGE_OUTBOX_CONCURRENCY: int = 10
+    MESSAGE_OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    MESSAGE_OUTBOX_MAX_ATTEMPTS: int = 5
+    MESSAGE_OUTBOX_RETRY_BASE_SECONDS: int = 30
+    # 발송 중(SENDING)으로 가져간 뒤 이 시간이 지나면 가져간 워커가 종료된 것으로 보고 다시 발송 대기로 돌림
+    MESSAGE_OUTBOX_CLAIM_LEASE_SECONDS: int = 300
+
+    # Inventory ledger settings
+    INVENTORY_SNAPSHOT_INTERVAL_SECONDS: float = 300.0
+    # 아직 커밋되지 않은 원장 행을 건너뛰지 않도록 이 시간보다 오래된 변동만 스냅샷에 반영
+    INVENTORY_SNAPSHOT_LAG_SECONDS: int = 60
+
+    # Stock hold settings (주문 ~ 결제 승인 사이 재고 점유)
+    STOCK_HOLD_TTL_SECONDS: int = 15 * 60
+    STOCK_HOLD_PAYMENT_TTL_SECONDS: int = 30 * 60  # 결제 예약 시 연장
+    STOCK_HOLD_SWEEP_INTERVAL_SECONDS: float = 30.0
+    STOCK_HOLD_SWEEP_BATCH_SIZE: int = 500
+
+    # Flash sale (hot SKU) stock settings: 지정한 옵션의 재고를 Redis 카운터로 차감하고 MySQL에는 모아서 반영
+    FLASH_SALE_STOCK_ENABLED: bool = False
+    FLASH_SALE_FLUSH_INTERVAL_SECONDS: float = 1.0
+
+    # Product facet settings (상품 목록 필터 사이드바 집계)
+    PRODUCT_FACET_CACHE_TTL_SECONDS: int = 60
 
     class Config:
         env_file = f".env.{os.getenv('ENV', 'local')}"
@@ -0,0 +1,70 @@
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar
+
+from tortoise.connection import connections
+from tortoise.transactions import in_transaction
+
+DEFAULT_CONNECTION = "default"
+READ_REPLICA_CONNECTION = "replica"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_use_read_replica: ContextVar[bool] = ContextVar("use_read_replica", default=False)
+
+
+class ReadReplicaRouter:
+    """
+    read_replica로 감싼 호출 안의 조회만 replica 커넥션으로 보냄
+    replica가 설정되지 않았거나 쓰기/SELECT ... FOR UPDATE는 항상 default 커넥션 사용
+    """
+
+    def db_for_read(self, model: Any) -> Optional[str]:
+        if _use_read_replica.get() and READ_REPLICA_CONNECTION in connections.db_config:
+            return READ_REPLICA_CONNECTION
+        return None
+
+    def db_for_write(self, model: Any) -> Optional[str]:
+        return None
+
+
+def write_connection_name() -> Optional[str]:
+    """
+    in_transaction()에 넘길 커넥션 이름
+    replica가 설정되면 커넥션이 여러 개라 이름을 지정해야 함 (설정되지 않았으면 기존처럼 단일 커넥션 사용)
+    """
+    if READ_REPLICA_CONNECTION in connections.db_config:
+        return DEFAULT_CONNECTION
+    return None
+
+
+def write_atomic(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """
+    tortoise의 @atomic() 대신 사용
+    @atomic()은 데코레이터를 붙일 때(임포트 시점) 커넥션 이름이 정해지므로, 호출 시점에 쓰기 커넥션을 골라 트랜잭션을 염
+    """
+
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        async with in_transaction(write_connection_name()):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def read_replica(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """
+    조회 전용 서비스 메서드에만 사용
+    쓰기 직후 다시 읽어야 하는 경로(예: create_order → get_order)에는 사용하지 않음 (복제 지연)
+    """
+
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _use_read_replica.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _use_read_replica.reset(token)
+
+    return wrapper
@@ -1,8 +1,11 @@
+from typing import Any, Optional
+
 from fastapi import FastAPI
 from tortoise import Tortoise
 from tortoise.contrib.fastapi import register_tortoise
 
 from core.configs import settings
+from core.database.db_router import DEFAULT_CONNECTION, READ_REPLICA_CONNECTION
 
 TORTOISE_MODELS = [
     "app.banner.models.banner",
@@ -12,43 +15,59 @@ TORTOISE_MODELS = [
     "app.order.models.order",
     "app.order.models.payment",
     "app.product.models.product",
+    "app.product.models.inventory",
     "app.promotion_product.models.promotion_product",
+    "common.models.message_outbox",
     "aerich.models",
 ]
 
 
-TORTOISE_ORM = {
-    "connections": {
-        "default": {
-            "engine": "tortoise.backends.mysql",
-            "credentials": {
-                "host": settings.DB_HOST,
-                "port": settings.DB_PORT,
-                "user": settings.DB_USER,
-                "password": settings.DB_PASSWORD,
-                "database": settings.DB_NAME,
-                "connect_timeout": 5,
-                # "maxsize": configs.MAX_CONNECTION_PER_CONNECTION_POOL,
-            },
+def _mysql_connection(host: str, port: int) -> dict[str, Any]:
+    return {
+        "engine": "core.database.mysql_client",
+        "credentials": {
+            "host": host,
+            "port": port,
+            "user": settings.DB_USER,
+            "password": settings.DB_PASSWORD,
+            "database": settings.DB_NAME,
+            "connect_timeout": 5,
+            "minsize": settings.DB_POOL_MINSIZE,
+            "maxsize": settings.DB_POOL_MAXSIZE,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
         },
-    },
+    }
+
+
+TORTOISE_CONNECTIONS = {DEFAULT_CONNECTION: _mysql_connection(settings.DB_HOST, settings.DB_PORT)}
+if settings.DB_READ_HOST:
+    TORTOISE_CONNECTIONS[READ_REPLICA_CONNECTION] = _mysql_connection(settings.DB_READ_HOST, settings.DB_READ_PORT)
+
+TORTOISE_ORM = {
+    "connections": TORTOISE_CONNECTIONS,
     "apps": {
         "models": {
             "models": TORTOISE_MODELS,
+            "default_connection": DEFAULT_CONNECTION,
         },
     },
+    "routers": ["core.database.db_router.ReadReplicaRouter"],
     "timezone": "Asia/Seoul",
 }
 
 
-async def database_initialize(app: FastAPI) -> None:
-    try:
-        await Tortoise.init(config=TORTOISE_ORM)
-        register_tortoise(
-            app,
-            config=TORTOISE_ORM,
-            generate_schemas=False,
-            add_exception_handlers=True,
-        )
-    except Exception as e:
-        print(f"Database initialization failed: {e}")
+def database_initialize(app: FastAPI) -> None:
+    """앱 시작 시 ORM 초기화, 종료 시 커넥션 정리 (다른 startup 핸들러보다 먼저 등록해야 함)"""
+    register_tortoise(
+        app,
+        config=TORTOISE_ORM,
+        generate_schemas=False,
+        add_exception_handlers=True,
+    )
+
+
+def get_db_pool_metrics() -> Optional[dict[str, Any]]:
+    """현재 워커의 커넥션 풀 사용 현황 (in-use, idle, 대기 시간, acquire 타임아웃)"""
+    connection = Tortoise.get_connection(DEFAULT_CONNECTION)
+    pool_snapshot = getattr(connection, "pool_snapshot", None)
+    return pool_snapshot() if pool_snapshot else None
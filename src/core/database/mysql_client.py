@@ -0,0 +1,106 @@
+"""
+커넥션 풀 사용량을 기록하는 MySQL 클라이언트
+TORTOISE_ORM의 engine으로 지정하면 tortoise.backends.mysql 대신 사용됨
+"""
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from aiomysql import Connection, Pool
+from tortoise.backends.mysql.client import MySQLClient
+from tortoise.exceptions import DBConnectionError
+
+from common.utils.metrics import DB_POOL_ACQUIRE_TIMEOUTS_TOTAL, DB_POOL_ACQUIRE_WAIT_SECONDS, DB_POOL_CONNECTIONS
+from core.configs import settings
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self.acquire_count = 0
+        self.acquire_timeouts = 0
+        self.waiting = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, wait_seconds: float) -> None:
+        self.acquire_count += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+class InstrumentedPool:
+    """aiomysql Pool의 acquire에 대기 시간/타임아웃 계측을 추가하고 나머지는 그대로 위임"""
+
+    def __init__(self, pool: Pool, acquire_timeout: float, connection_name: str = "default") -> None:
+        self._pool = pool
+        self.acquire_timeout = acquire_timeout
+        self.connection_name = connection_name
+        self.metrics = PoolMetrics()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    async def acquire(self) -> Connection:
+        started_at = time.monotonic()
+        self.metrics.waiting += 1
+        try:
+            connection = await asyncio.wait_for(self._pool.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.metrics.acquire_timeouts += 1
+            DB_POOL_ACQUIRE_TIMEOUTS_TOTAL.labels(self.connection_name).inc()
+            raise DBConnectionError(f"Timed out acquiring a connection from the pool ({self.acquire_timeout}s)")
+        finally:
+            self.metrics.waiting -= 1
+
+        wait_seconds = time.monotonic() - started_at
+        self.metrics.record_wait(wait_seconds)
+        DB_POOL_ACQUIRE_WAIT_SECONDS.labels(self.connection_name).observe(wait_seconds)
+        self._export_gauges()
+        return connection
+
+    def release(self, connection: Connection) -> Any:
+        result = self._pool.release(connection)
+        self._export_gauges()
+        return result
+
+    def _export_gauges(self) -> None:
+        idle = self._pool.freesize
+        DB_POOL_CONNECTIONS.labels(self.connection_name, "in_use").set(self._pool.size - idle)
+        DB_POOL_CONNECTIONS.labels(self.connection_name, "idle").set(idle)
+
+    def snapshot(self) -> dict[str, Any]:
+        size = self._pool.size
+        idle = self._pool.freesize
+        acquire_count = self.metrics.acquire_count
+        return {
+            "minsize": self._pool.minsize,
+            "maxsize": self._pool.maxsize,
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": self.metrics.waiting,
+            "acquire_count": acquire_count,
+            "acquire_timeouts": self.metrics.acquire_timeouts,
+            "avg_wait_ms": round(self.metrics.total_wait_seconds / acquire_count * 1000, 3) if acquire_count else 0.0,
+            "max_wait_ms": round(self.metrics.max_wait_seconds * 1000, 3),
+        }
+
+
+class InstrumentedMySQLClient(MySQLClient):
+    async def create_connection(self, with_db: bool) -> None:
+        await super().create_connection(with_db)
+        if isinstance(self._pool, Pool):
+            self._pool = InstrumentedPool(
+                self._pool,
+                acquire_timeout=settings.DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+                connection_name=self.connection_name,
+            )
+
+    def pool_snapshot(self) -> Optional[dict[str, Any]]:
+        if isinstance(self._pool, InstrumentedPool):
+            return self._pool.snapshot()
+        return None
+
+
+client_class = InstrumentedMySQLClient
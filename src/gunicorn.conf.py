@@ -0,0 +1,18 @@
+import os
+import shutil
+from typing import Any
+
+from prometheus_client import multiprocess
+
+# 워커들이 메트릭을 기록하는 공유 디렉토리 (common/utils/metrics.py)
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server: Any) -> None:
+    # 이전 실행에서 남은 메트릭 파일 정리
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
@@ -1,24 +1,35 @@
-from fastapi import FastAPI
+from typing import Any, Optional
+
+from fastapi import FastAPI, Response
 
 from common.post_construct import post_construct
+from common.utils.json_response import ModelJSONResponse
 from common.utils.logger import setup_logger
+from common.utils.metrics import render_metrics
 from core.configs import settings
-from core.database.db_settings import database_initialize
+from core.database.db_settings import database_initialize, get_db_pool_metrics
 
 logger = setup_logger("my_app_logger", settings=settings, enable_tortoise_logging=True)
 
-app = FastAPI()
-
-
-async def startup_event() -> None:
-    await database_initialize(app)
+app = FastAPI(default_response_class=ModelJSONResponse)
 
+# 백그라운드 작업이 DB를 사용하므로 ORM 초기화를 가장 먼저 등록 (작업 종료는 ORM 종료 전에 실행되도록 앞쪽에 등록됨)
+database_initialize(app)
 
 post_construct(app=app)
 
-app.add_event_handler("startup", startup_event)
-
 
 @app.get("/health-check")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/health-check/db-pool")
+async def db_pool_health_check() -> Optional[dict[str, Any]]:
+    return get_db_pool_metrics()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
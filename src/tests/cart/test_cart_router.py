@@ -40,6 +40,7 @@ class TestCartRouter(TestCase):
             color="Red",
             color_code="#FF0000",
             product=self.product,
+            stock=50,
         )
         self.option_image = await OptionImage.create(
             image_url="http://example.com/image.jpg",
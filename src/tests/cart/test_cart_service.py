@@ -39,6 +39,7 @@ class TestCartService(TestCase):
             color="Red",
             color_code="#FF0000",
             product=self.product,
+            stock=50,
         )
 
         self.option_image = await OptionImage.create(
@@ -1,6 +1,7 @@
 import asyncio
 from asyncio import AbstractEventLoop
-from typing import Any, Generator
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator, Optional
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +9,8 @@ from pytest import FixtureRequest
 from tortoise.backends.base.config_generator import generate_config
 from tortoise.contrib.test import finalizer, initializer
 
+from common.middlewares import query_counter_middleware
+from common.utils.query_counter import QueryStats, track_queries
 from core.configs import settings
 from core.database.db_settings import TORTOISE_MODELS
 
@@ -40,3 +43,21 @@ def initialize(request: FixtureRequest) -> None:
     with patch("tortoise.contrib.test.getDBConfig", Mock(return_value=get_test_db_config())):
         initializer(modules=TORTOISE_MODELS)
     request.addfinalizer(finalizer)
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budget() -> Generator[None, None, None]:
+    """요청이 라우트의 QueryBudget을 넘으면 테스트 실패 (운영에서는 미들웨어가 경고 로그만 남김)"""
+    requests: list[QueryStats] = []
+
+    @contextmanager
+    def tracking(max_queries: Optional[int] = None, enforce_budget: bool = True) -> Iterator[QueryStats]:
+        with track_queries(max_queries=max_queries, enforce_budget=enforce_budget) as stats:
+            yield stats
+        requests.append(stats)
+
+    with patch.object(query_counter_middleware, "track_queries", tracking):
+        yield
+
+    for stats in requests:
+        stats.check_budget()
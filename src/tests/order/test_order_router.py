@@ -21,10 +21,13 @@ class TestOrderRouter(TestCase):
             price=Decimal("85000"),
             origin_price=Decimal("100000"),
             product_code="TEST001",
+            total_stock=10,
         )
 
         # 테스트용 옵션 생성
-        self.test_option = await Option.create(product=self.test_product, size="M", color="Red", color_code="#FF0000")
+        self.test_option = await Option.create(
+            product=self.test_product, size="M", color="Red", color_code="#FF0000", stock=10
+        )
 
         self.test_stock = await CountProduct.create(
             product=self.test_product,
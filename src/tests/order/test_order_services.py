@@ -5,6 +5,7 @@ from tortoise.contrib.test import TestCase
 
 from app.order.dtos.order_request import (
     BatchOrderStatusRequest,
+    BatchPurchaseOrderRequest,
     CreateOrderRequest,
     OrderProductRequest,
     OrderVerificationRequest,
@@ -25,10 +26,13 @@ class TestOrderServices(TestCase):
             price=Decimal("85000"),
             origin_price=Decimal("100000"),
             product_code="TEST001",
+            total_stock=10,
         )
 
         # 테스트용 옵션 생성
-        self.test_option = await Option.create(product=self.test_product, size="M", color="Red", color_code="#FF0000")
+        self.test_option = await Option.create(
+            product=self.test_product, size="M", color="Red", color_code="#FF0000", stock=10
+        )
 
         # 테스트용 재고 생성
         self.test_stock = await CountProduct.create(
@@ -144,6 +148,38 @@ class TestOrderServices(TestCase):
         # 재고 업데이트 확인
         updated_stock = await CountProduct.get(product=self.test_product, option=self.test_option)
         assert updated_stock.count == initial_stock - requested_quantity
+        assert (await Option.get(id=self.test_option.id)).stock == initial_stock - requested_quantity
+        assert (await Product.get(id=self.test_product.id)).total_stock == initial_stock - requested_quantity
+
+    async def test_batch_update_purchase_orders_service(self) -> None:
+        # Given: 재고 10개에 6개, 5개, 3개 주문 (두 번째 주문은 재고 부족)
+        orders = []
+        for quantity in (6, 5, 3):
+            order = await NonUserOrder.create(name="Test User", phone="01012345678", shipping_address="Test Address")
+            await NonUserOrderProduct.create(
+                order=order,
+                product=self.test_product,
+                option_id=self.test_option.id,
+                quantity=quantity,
+                price=Decimal("85000"),
+                current_status="PENDING",
+            )
+            orders.append(order)
+        request = BatchPurchaseOrderRequest(order_ids=[order.id for order in orders])
+
+        # When
+        result = await OrderService.batch_update_purchase_orders(request)
+        retried = await OrderService.batch_update_purchase_orders(request)
+
+        # Then
+        assert (result.confirmed_count, result.pending_count) == (2, 1)
+        assert [check.has_sufficient_stock for check in result.stock_checks] == [True, False, True]
+        assert [check.available_quantity for check in result.stock_checks] == [10, 4, 4]
+        assert (retried.confirmed_count, retried.pending_count) == (0, 1)
+        assert (await CountProduct.get(option=self.test_option)).count == 1
+        assert (await Option.get(id=self.test_option.id)).stock == 1
+        statuses = await NonUserOrderProduct.filter(order_id__in=request.order_ids).order_by("order_id")
+        assert [line.procurement_status for line in statuses] == ["CONFIRMED", "PENDING", "CONFIRMED"]
 
     async def test_get_order_statistics_service(self) -> None:
         # Given
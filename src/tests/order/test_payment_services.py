@@ -0,0 +1,132 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from tortoise.contrib.test import TestCase, TruncationTestCase
+
+from app.order.dtos.payment_request import PaymentApproveRequestDTO
+from app.order.models.order import NonUserOrder, NonUserOrderProduct
+from app.order.models.payment import NonUserPayment, PaymentStatus
+from app.order.services.payment_service import PaymentService
+from app.product.models.product import Product
+from common.exceptions.payment_exception import PaymentStatusError
+
+
+class PaymentFixtureMixin:
+    test_product: Product
+
+    async def _create_product(self) -> None:
+        self.test_product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="TEST001",
+        )
+
+    async def _create_reserved_payment(self, transaction_id: str) -> tuple[NonUserPayment, NonUserOrderProduct]:
+        order = await NonUserOrder.create(name="Test User", phone="01012345678", shipping_address="Test Address")
+        order_product = await NonUserOrderProduct.create(
+            order=order,
+            product=self.test_product,
+            quantity=1,
+            price=Decimal("85000"),
+            current_status="PENDING",
+        )
+        payment = await NonUserPayment.create(
+            transaction_id=transaction_id,
+            amount=Decimal("85000"),
+            payment_type="kakao_pay",
+            payment_status=PaymentStatus.RESERVED.value,
+            order=order,
+        )
+        return payment, order_product
+
+
+class TestPaymentServices(PaymentFixtureMixin, TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        await self._create_product()
+
+    async def test_approve_payment_service(self) -> None:
+        # Given
+        payment, order_product = await self._create_reserved_payment("PAYMENT_1_aaaaaaaa")
+
+        # When
+        await PaymentService.approve_payment(PaymentApproveRequestDTO(payment_id=payment.transaction_id, tx_id="tx_1"))
+
+        # Then
+        approved_payment = await NonUserPayment.get(id=payment.pk)
+        approved_order_product = await NonUserOrderProduct.get(id=order_product.pk)
+        assert approved_payment.payment_status == PaymentStatus.PAID.value
+        assert approved_payment.approval_number == "tx_1"
+        assert approved_order_product.current_status == "ITEM_PENDING"
+
+    async def test_approve_payments_batch_service(self) -> None:
+        # Given
+        payment_1, order_product_1 = await self._create_reserved_payment("PAYMENT_1_aaaaaaaa")
+        payment_2, order_product_2 = await self._create_reserved_payment("PAYMENT_1_bbbbbbbb")
+        cancelled, cancelled_order_product = await self._create_reserved_payment("PAYMENT_1_cccccccc")
+        await NonUserPayment.filter(id=cancelled.pk).update(payment_status=PaymentStatus.CANCELLED.value)
+
+        # When
+        result = await PaymentService.approve_payments(
+            [
+                PaymentApproveRequestDTO(payment_id=payment_1.transaction_id, tx_id="tx_1"),
+                PaymentApproveRequestDTO(payment_id=payment_2.transaction_id, tx_id="tx_2"),
+                PaymentApproveRequestDTO(payment_id="UNKNOWN", tx_id="tx_3"),
+                PaymentApproveRequestDTO(payment_id=cancelled.transaction_id, tx_id="tx_4"),
+            ]
+        )
+
+        # Then
+        assert result.approved_count == 2
+        assert result.not_found == ["UNKNOWN"]
+        assert result.rejected == [cancelled.transaction_id]
+        assert (await NonUserPayment.get(id=cancelled.pk)).payment_status == PaymentStatus.CANCELLED.value
+        assert (await NonUserOrderProduct.get(id=cancelled_order_product.pk)).current_status == "PENDING"
+        assert (await NonUserPayment.get(id=payment_2.pk)).approval_number == "tx_2"
+        assert (await NonUserOrderProduct.get(id=order_product_1.pk)).current_status == "ITEM_PENDING"
+        assert (await NonUserOrderProduct.get(id=order_product_2.pk)).current_status == "ITEM_PENDING"
+
+
+class TestPaymentServicesTransaction(PaymentFixtureMixin, TruncationTestCase):
+    """승인 트랜잭션이 롤백되는 경우 (테스트 트랜잭션 없이 실제 트랜잭션으로 확인)"""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        await self._create_product()
+
+    async def test_취소된_결제는_승인하지_않음(self) -> None:
+        # Given
+        payment, order_product = await self._create_reserved_payment("PAYMENT_1_aaaaaaaa")
+        await NonUserPayment.filter(id=payment.pk).update(payment_status=PaymentStatus.CANCELLED.value)
+
+        # When & Then
+        with pytest.raises(PaymentStatusError):
+            await PaymentService.approve_payment(
+                PaymentApproveRequestDTO(payment_id=payment.transaction_id, tx_id="tx_1")
+            )
+
+        assert (await NonUserPayment.get(id=payment.pk)).payment_status == PaymentStatus.CANCELLED.value
+        assert (await NonUserOrderProduct.get(id=order_product.pk)).current_status == "PENDING"
+
+    async def test_일괄_승인_중_실패하면_모든_결제_롤백(self) -> None:
+        # Given
+        payment_1, order_product_1 = await self._create_reserved_payment("PAYMENT_1_aaaaaaaa")
+        payment_2, _ = await self._create_reserved_payment("PAYMENT_1_bbbbbbbb")
+
+        # When: 결제 상태를 바꾼 뒤 주문 상품 전환에서 실패
+        with patch.object(PaymentService, "mark_orders_paid", side_effect=RuntimeError("mark failed")):
+            with pytest.raises(RuntimeError):
+                await PaymentService.approve_payments(
+                    [
+                        PaymentApproveRequestDTO(payment_id=payment_1.transaction_id, tx_id="tx_1"),
+                        PaymentApproveRequestDTO(payment_id=payment_2.transaction_id, tx_id="tx_2"),
+                    ]
+                )
+
+        # Then
+        for payment in await NonUserPayment.filter(id__in=[payment_1.pk, payment_2.pk]):
+            assert payment.payment_status == PaymentStatus.RESERVED.value
+            assert payment.approval_number is None
+        assert (await NonUserOrderProduct.get(id=order_product_1.pk)).current_status == "PENDING"
@@ -0,0 +1,164 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from tortoise import timezone
+from tortoise.contrib.test import TestCase
+
+from app.order.models.order import NonUserOrder, NonUserOrderProduct
+from app.order.models.payment import NonUserPayment, PaymentStatus, PaymentWebhookEvent
+from app.order.services.payment_webhook_service import (
+    PaymentWebhookConsumer,
+    PaymentWebhookService,
+    payment_webhook_queue,
+)
+from app.product.models.product import Product
+from common.exceptions.payment_exception import PaymentValidationError
+from common.utils.cache_services.memory_cache_service import MemoryCacheService
+from core.configs import settings
+
+
+def sign(payload: bytes) -> str:
+    return hmac.new(settings.PAYMENT_WEBHOOK_SECRET.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+
+
+class TestPaymentWebhookService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.webhook_service = PaymentWebhookService(cache_service=MemoryCacheService())
+
+        product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="TEST001",
+        )
+        self.order = await NonUserOrder.create(name="Test User", phone="01012345678", shipping_address="Test Address")
+        self.order_product = await NonUserOrderProduct.create(
+            order=self.order,
+            product=product,
+            quantity=1,
+            price=Decimal("85000"),
+            current_status="PENDING",
+        )
+        self.payment = await NonUserPayment.create(
+            transaction_id="PAYMENT_1_abcdef12",
+            amount=Decimal("85000"),
+            payment_type="kakao_pay",
+            payment_status=PaymentStatus.RESERVED.value,
+            order=self.order,
+        )
+
+    async def asyncTearDown(self) -> None:
+        while not payment_webhook_queue.empty():
+            payment_webhook_queue.get_nowait()
+        await super().asyncTearDown()
+
+    async def test_webhook_invalid_signature(self) -> None:
+        # Given
+        payload = json.dumps({"imp_uid": "imp_1", "merchant_uid": "PAYMENT_1_abcdef12", "status": "paid"}).encode()
+
+        # When & Then
+        with pytest.raises(PaymentValidationError):
+            await self.webhook_service.ingest(payload=payload, signature="invalid")
+
+        assert payment_webhook_queue.empty()
+
+    async def test_webhook_duplicate_is_acknowledged_once(self) -> None:
+        # Given
+        payload = json.dumps({"imp_uid": "imp_1", "merchant_uid": "PAYMENT_1_abcdef12", "status": "paid"}).encode()
+
+        # When
+        first = await self.webhook_service.ingest(payload=payload, signature=sign(payload))
+        second = await self.webhook_service.ingest(payload=payload, signature=sign(payload))
+        # Redis 키가 만료된 뒤의 재전송은 수신 기록의 유니크 인덱스로 거름
+        third = await PaymentWebhookService(cache_service=MemoryCacheService()).ingest(
+            payload=payload, signature=sign(payload)
+        )
+
+        # Then
+        assert first.status == "accepted"
+        assert second.status == "duplicate"
+        assert third.status == "duplicate"
+        assert payment_webhook_queue.qsize() == 1
+        assert await PaymentWebhookEvent.filter(imp_uid="imp_1").count() == 1
+
+    async def test_apply_batch_marks_payment_paid(self) -> None:
+        # Given
+        events = [
+            await PaymentWebhookEvent.create(imp_uid="imp_1", merchant_uid=self.payment.transaction_id, status="paid"),
+            await PaymentWebhookEvent.create(imp_uid="imp_2", merchant_uid="UNKNOWN", status="paid"),
+        ]
+
+        # When
+        await PaymentWebhookConsumer.apply_batch([event.pk for event in events])
+
+        # Then
+        payment = await NonUserPayment.get(id=self.payment.pk)
+        order_product = await NonUserOrderProduct.get(id=self.order_product.pk)
+        assert payment.payment_status == PaymentStatus.PAID.value
+        assert payment.approval_number == "imp_1"
+        assert order_product.current_status == "ITEM_PENDING"
+        # 결제가 없는 기록은 반영하지 않고 남겨 다시 반영
+        assert await PaymentWebhookEvent.filter(applied_at__isnull=True).count() == 1
+        assert not (await PaymentWebhookEvent.get(id=events[1].pk)).applied_at
+
+    async def test_허용되지_않는_전이는_반영하지_않고_재시도(self) -> None:
+        # Given: 결제 승인 전에 취소 웹훅이 먼저 반영되어 승인 웹훅이 허용되지 않는 상황
+        await NonUserPayment.filter(id=self.payment.pk).update(payment_status=PaymentStatus.CANCELLED.value)
+        event = await PaymentWebhookEvent.create(
+            imp_uid="imp_1", merchant_uid=self.payment.transaction_id, status="paid"
+        )
+        consumer = PaymentWebhookConsumer(queue=payment_webhook_queue, retry_after=30, retry_window=3600)
+        await PaymentWebhookEvent.all().update(created_at=timezone.now() - timedelta(seconds=60))
+
+        # When
+        await consumer.apply_batch([event.pk])
+
+        # Then
+        assert (await NonUserPayment.get(id=self.payment.pk)).payment_status == PaymentStatus.CANCELLED.value
+        assert await consumer.pending_event_ids() == [event.pk]
+
+        # retry_window가 지나면 더 이상 다시 반영하지 않음
+        await PaymentWebhookEvent.all().update(created_at=timezone.now() - timedelta(seconds=7200))
+        assert await consumer.pending_event_ids() == []
+
+    async def test_반영되지_않은_수신_기록_재반영(self) -> None:
+        # Given
+        payload = json.dumps({"imp_uid": "imp_1", "merchant_uid": "PAYMENT_1_abcdef12", "status": "paid"}).encode()
+        await self.webhook_service.ingest(payload=payload, signature=sign(payload))
+        # 응답 후 반영 전에 워커가 종료되어 대기열의 이벤트가 사라진 상황
+        payment_webhook_queue.get_nowait()
+        consumer = PaymentWebhookConsumer(queue=payment_webhook_queue, retry_after=30)
+        await PaymentWebhookEvent.all().update(created_at=timezone.now() - timedelta(seconds=60))
+
+        # When
+        event_ids = await consumer.pending_event_ids()
+        await consumer.apply_batch(event_ids)
+
+        # Then
+        payment = await NonUserPayment.get(id=self.payment.pk)
+        assert len(event_ids) == 1
+        assert payment.payment_status == PaymentStatus.PAID.value
+        assert await consumer.pending_event_ids() == []
+
+    async def test_대기열이_차_있어도_주기적으로_재반영(self) -> None:
+        # Given: 반영되지 않은 채 남은 기록과 계속 들어오는 새 이벤트
+        await PaymentWebhookEvent.create(imp_uid="imp_1", merchant_uid=self.payment.transaction_id, status="paid")
+        await PaymentWebhookEvent.all().update(created_at=timezone.now() - timedelta(seconds=60))
+        consumer = PaymentWebhookConsumer(queue=payment_webhook_queue, flush_interval=0.01, retry_after=30)
+        for _ in range(5):
+            payment_webhook_queue.put_nowait(0)
+
+        # When
+        await consumer.start()
+        await asyncio.sleep(0.1)
+        await consumer.stop()
+
+        # Then
+        payment = await NonUserPayment.get(id=self.payment.pk)
+        assert payment.payment_status == PaymentStatus.PAID.value
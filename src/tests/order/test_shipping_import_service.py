@@ -0,0 +1,93 @@
+from decimal import Decimal
+from io import BytesIO
+from unittest.mock import patch
+
+from fastapi import UploadFile
+from tortoise.contrib.test import TestCase
+
+from app.order.dtos.order_request import UpdateShippingRequest
+from app.order.models.order import NonUserOrder, NonUserOrderProduct
+from app.order.services.shipping_import_service import ShippingImportService
+from app.product.models.product import Option, Product
+
+
+class TestShippingImportService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="SHIP001",
+        )
+        option = await Option.create(product=product, size="M", color="Red", color_code="#FF0000")
+
+        self.orders = []
+        for i in range(3):
+            order = await NonUserOrder.create(name=f"buyer_{i}", phone="01012345678", shipping_address="Seoul")
+            await NonUserOrderProduct.create(
+                order=order, product=product, option_id=option.id, price=Decimal("85000"), current_status="CONFIRMED"
+            )
+            self.orders.append(order)
+
+    async def _shipping(self, order: NonUserOrder) -> tuple[str, str, str]:
+        order_product = await NonUserOrderProduct.get(order=order)
+        return order_product.courier, order_product.shipping_id, order_product.current_status
+
+    async def test_송장_목록_일괄_반영(self) -> None:
+        # Given
+        first, second, _ = self.orders
+        requests = [
+            UpdateShippingRequest(order_id=first.id, courier="CJ", tracking_number="111", shipping_status="SHIPPING"),
+            UpdateShippingRequest(order_id=second.id, courier="CJ", tracking_number="222", shipping_status="SHIPPING"),
+            UpdateShippingRequest(order_id=999999, courier="CJ", tracking_number="333", shipping_status="SHIPPING"),
+            UpdateShippingRequest(
+                order_id=first.id, courier="HANJIN", tracking_number="444", shipping_status="SHIPPING"
+            ),
+        ]
+
+        # When
+        response = await ShippingImportService.import_rows(requests)
+
+        # Then
+        assert (response.total_count, response.updated_count, response.failed_count) == (4, 2, 2)
+        assert [(failure.row, failure.reason) for failure in response.failures] == [(1, "duplicate"), (3, "not_found")]
+        assert await self._shipping(first) == ("HANJIN", "444", "SHIPPING")
+        assert await self._shipping(second) == ("CJ", "222", "SHIPPING")
+
+    async def test_송장_CSV_일괄_반영(self) -> None:
+        # Given
+        first, second, third = self.orders
+        content = (
+            "주문번호,택배사,운송장번호,배송상태\n"
+            f"ORD-{first.id},CJ,111,\n"
+            f"{second.id},CJ,222,DELIVERED\n"
+            f"{third.id},CJ,,\n"
+            "abc,CJ,444,\n"
+        )
+        file = UploadFile(filename="shipping.csv", file=BytesIO(content.encode("utf-8-sig")))
+
+        # When
+        response = await ShippingImportService.import_csv(file, default_shipping_status="SHIPPING")
+
+        # Then
+        assert (response.total_count, response.updated_count, response.failed_count) == (4, 2, 2)
+        assert [(failure.row, failure.reason) for failure in response.failures] == [(3, "invalid"), (4, "invalid")]
+        assert await self._shipping(first) == ("CJ", "111", "SHIPPING")
+        assert await self._shipping(second) == ("CJ", "222", "DELIVERED")
+        assert (await NonUserOrderProduct.get(order=third)).shipping_id is None
+
+    async def test_청크가_달라도_같은_주문은_마지막_행만_반영(self) -> None:
+        # Given
+        first, second, _ = self.orders
+        content = f"주문번호,택배사,운송장번호\n{first.id},CJ,111\n{second.id},CJ,222\n{first.id},HANJIN,333\n"
+        file = UploadFile(filename="shipping.csv", file=BytesIO(content.encode("utf-8")))
+
+        # When
+        with patch("app.order.services.shipping_import_service.SHIPPING_IMPORT_CHUNK_SIZE", 2):
+            response = await ShippingImportService.import_csv(file, default_shipping_status="SHIPPING")
+
+        # Then
+        assert (response.total_count, response.updated_count, response.failed_count) == (3, 2, 1)
+        assert [(failure.row, failure.reason) for failure in response.failures] == [(1, "duplicate")]
+        assert await self._shipping(first) == ("HANJIN", "333", "SHIPPING")
@@ -0,0 +1,151 @@
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from typing import AsyncIterator, Optional
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.contrib.test import TestCase
+
+from app.product.models.inventory import FlashSaleJournalBatch, InventoryMovement, InventoryReason
+from app.product.models.product import CountProduct, Option, Product
+from app.product.services.flash_sale_stock_service import (
+    FLASH_SALE_FLUSH_LOCK_KEY,
+    FLASH_SALE_JOURNAL_KEY,
+    FlashSaleStockService,
+)
+from app.product.services.stock_service import StockService
+from common.utils.cache_services.memory_cache_service import MemoryCacheService
+from core.configs import settings
+
+
+@asynccontextmanager
+async def _without_rollback(connection_name: Optional[str]) -> AsyncIterator[BaseDBAsyncClient]:
+    # 테스트 트랜잭션 안에서 중첩 트랜잭션을 롤백하면 테스트 트랜잭션까지 끝나므로 예외만 그대로 전달
+    yield CountProduct._meta.db
+
+
+class TestFlashSaleStockService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.enterContext(patch.object(settings, "FLASH_SALE_STOCK_ENABLED", True))
+        self.cache = MemoryCacheService()
+        self.enterContext(patch("common.utils.cache_services._cache_service", self.cache))
+        self.enterContext(patch("app.product.services.stock_service.in_transaction", _without_rollback))
+
+        self.product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="FLASH001",
+        )
+        self.hot = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="M")
+        self.cold = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="L")
+        await StockService.bulk_upsert([(self.product.id, self.hot.id, 5), (self.product.id, self.cold.id, 5)])
+        await FlashSaleStockService.enable([self.hot.id])
+
+    async def _count(self, option: Option) -> int:
+        return (await CountProduct.get(option=option)).count
+
+    async def test_한정_판매_옵션은_Redis에서_차감후_모아서_반영(self) -> None:
+        # When
+        await StockService.decrease(
+            [(self.product.id, self.hot.id, 2), (self.product.id, self.cold.id, 1)], CountProduct._meta.db
+        )
+
+        # Then: 한정 판매 옵션은 반영 전까지 MySQL 재고 그대로
+        assert await FlashSaleStockService.counters([self.hot.id, self.cold.id]) == {self.hot.id: 3}
+        assert await self._count(self.hot) == 5
+        assert await self._count(self.cold) == 4
+
+        assert await FlashSaleStockService.flush() == 1
+        assert await self._count(self.hot) == 3
+        assert (await Option.get(id=self.hot.id)).stock == 3
+        assert (await Product.get(id=self.product.id)).total_stock == 7
+        assert await InventoryMovement.filter(option_id=self.hot.id, reason=InventoryReason.FLASH_SALE).count() == 1
+
+    async def test_재고_부족시_모든_라인_차감하지_않음(self) -> None:
+        # When
+        with self.assertRaises(HTTPException):
+            await StockService.decrease(
+                [(self.product.id, self.hot.id, 3), (self.product.id, self.hot.id, 3)], CountProduct._meta.db
+            )
+
+        # Then
+        assert await FlashSaleStockService.counters([self.hot.id]) == {self.hot.id: 5}
+
+    async def test_MySQL_차감_실패시_Redis_차감_복원(self) -> None:
+        # When
+        with self.assertRaises(HTTPException):
+            async with StockService.transaction() as connection:
+                await StockService.decrease(
+                    [(self.product.id, self.hot.id, 2), (self.product.id, self.cold.id, 6)], connection
+                )
+
+        # Then
+        assert await FlashSaleStockService.counters([self.hot.id]) == {self.hot.id: 5}
+        assert await FlashSaleStockService.flush() == 0
+
+    async def test_차감_후_트랜잭션이_실패하면_Redis_차감_복원(self) -> None:
+        # When
+        with self.assertRaises(RuntimeError):
+            async with StockService.transaction() as connection:
+                await StockService.decrease([(self.product.id, self.hot.id, 2)], connection)
+                raise RuntimeError("after decrease")
+
+        # Then
+        assert await FlashSaleStockService.counters([self.hot.id]) == {self.hot.id: 5}
+        assert await FlashSaleStockService.flush() == 0
+        assert await self._count(self.hot) == 5
+
+    async def test_실패한_트랜잭션_도중_해제된_옵션은_MySQL_재고로_복원(self) -> None:
+        # When: 차감 후 커밋 전에 한정 판매가 해제되어 차감이 MySQL에 반영됨
+        with self.assertRaises(RuntimeError):
+            async with StockService.transaction() as connection:
+                await StockService.decrease([(self.product.id, self.hot.id, 2)], connection)
+                await FlashSaleStockService.disable([self.hot.id])
+                raise RuntimeError("after disable")
+
+        # Then
+        assert await FlashSaleStockService.counters([self.hot.id]) == {}
+        assert await self._count(self.hot) == 5
+        assert (await Option.get(id=self.hot.id)).stock == 5
+
+    async def test_해제시_남은_변동량_반영(self) -> None:
+        # Given
+        await StockService.decrease([(self.product.id, self.hot.id, 4)], CountProduct._meta.db)
+
+        # When
+        disabled = await FlashSaleStockService.disable([self.hot.id, self.cold.id])
+
+        # Then
+        assert disabled == [self.hot.id]
+        assert await FlashSaleStockService.counters([self.hot.id]) == {}
+        assert await self._count(self.hot) == 1
+
+    async def test_ack_실패한_배치는_다시_반영하지_않음(self) -> None:
+        # Given: 반영은 커밋됐지만 Redis ack가 실패
+        await StockService.decrease([(self.product.id, self.hot.id, 2)], CountProduct._meta.db)
+        with patch.object(self.cache, "ack_journal", AsyncMock(side_effect=ConnectionError("redis down"))):
+            with self.assertRaises(ConnectionError):
+                await FlashSaleStockService.flush()
+        await StockService.decrease([(self.product.id, self.hot.id, 1)], CountProduct._meta.db)
+
+        # When
+        flushed = await FlashSaleStockService.flush()
+
+        # Then: 이미 반영한 배치는 건너뛰고 새 변동량만 반영
+        assert flushed == 1
+        assert await self._count(self.hot) == 2
+        assert await FlashSaleJournalBatch.all().count() == 2
+        assert await self.cache.drain_journal(FLASH_SALE_JOURNAL_KEY, "check") == {}
+
+    async def test_다른_워커가_잡은_잠금은_해제하지_않음(self) -> None:
+        # Given: 잠금이 만료된 뒤 다른 워커가 잠금을 가져감
+        async with FlashSaleStockService._flush_lock(wait=False) as acquired:
+            assert acquired
+            await self.cache.delete(FLASH_SALE_FLUSH_LOCK_KEY)
+            await self.cache.set_if_absent(FLASH_SALE_FLUSH_LOCK_KEY, "other", 30)
+
+        # Then
+        assert await self.cache.get(FLASH_SALE_FLUSH_LOCK_KEY) == "other"
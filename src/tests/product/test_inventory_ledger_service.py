@@ -0,0 +1,99 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from httpx import AsyncClient
+from tortoise import timezone
+from tortoise.contrib.test import TestCase
+
+from app.product.models.inventory import InventoryMovement, InventoryReason, InventorySnapshot
+from app.product.models.product import CountProduct, Option, Product
+from app.product.services.inventory_ledger_service import InventoryLedgerService
+from app.product.services.stock_service import StockService
+from main import app
+
+
+class TestInventoryLedgerService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="LEDGER001",
+        )
+        self.option_m = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="M")
+        self.option_l = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="L")
+        await StockService.bulk_upsert(
+            [(self.product.id, self.option_m.id, 10), (self.product.id, self.option_l.id, 5)],
+            reason=InventoryReason.INITIAL,
+        )
+
+    async def test_재고_변경시_변동량만_원장에_기록(self) -> None:
+        # When
+        await StockService.bulk_upsert([(self.product.id, self.option_m.id, 7), (self.product.id, self.option_l.id, 5)])
+        await StockService.decrease([(self.product.id, self.option_m.id, 2)], CountProduct._meta.db, "order:1")
+
+        # Then
+        movements = await InventoryMovement.filter(option_id=self.option_m.id).order_by("id")
+        assert [(m.delta, m.reason, m.reference) for m in movements] == [
+            (10, InventoryReason.INITIAL, None),
+            (-3, InventoryReason.SYNC, None),
+            (-2, InventoryReason.ORDER, "order:1"),
+        ]
+        assert await InventoryMovement.filter(option_id=self.option_l.id).count() == 1
+        assert await InventoryLedgerService.stock_of([self.option_m.id, self.option_l.id]) == {
+            self.option_m.id: 5,
+            self.option_l.id: 5,
+        }
+
+    async def test_스냅샷_이후_변동만_합산(self) -> None:
+        # Given
+        created = await InventoryLedgerService.take_snapshots(lag_seconds=0)
+        await StockService.decrease([(self.product.id, self.option_l.id, 4)], CountProduct._meta.db)
+
+        # When
+        stocks = await InventoryLedgerService.stock_of([self.option_m.id, self.option_l.id])
+
+        # Then
+        assert created == 2
+        assert [snapshot.quantity for snapshot in await InventorySnapshot.filter(option_id=self.option_m.id)] == [10]
+        assert stocks == {self.option_m.id: 10, self.option_l.id: 1}
+        assert await InventoryLedgerService.take_snapshots(lag_seconds=0) == 1
+        assert await InventoryLedgerService.stock_of([self.option_l.id]) == {self.option_l.id: 1}
+
+    async def test_특정_시점_재고_조회(self) -> None:
+        # Given
+        before = timezone.now() - timedelta(days=1)
+        await InventoryMovement.filter(option_id=self.option_m.id).update(created_at=before)
+        await StockService.decrease([(self.product.id, self.option_m.id, 3)], CountProduct._meta.db)
+
+        # When
+        past = await InventoryLedgerService.get_product_stock(self.product.id, at=before + timedelta(hours=1))
+        current = await InventoryLedgerService.get_product_stock(self.product.id)
+
+        # Then
+        assert [(o.option_id, o.stock) for o in past.options] == [(self.option_m.id, 10), (self.option_l.id, 0)]
+        assert current.total_stock == 12
+
+    async def test_재고_대사_API(self) -> None:
+        # Given: 원장을 거치지 않고 직접 수정된 재고
+        await CountProduct.filter(option_id=self.option_l.id).update(count=50)
+
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/api/v1/products/stock/reconciliation")
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {
+            "checked_count": 2,
+            "mismatches": [
+                {
+                    "product_id": self.product.id,
+                    "option_id": self.option_l.id,
+                    "ledger_stock": 5,
+                    "count_product_stock": 50,
+                    "option_stock": 5,
+                }
+            ],
+        }
@@ -0,0 +1,74 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from app.category.models.category import Category, CategoryProduct
+from app.product.dtos.request import ProductFilterRequestDTO
+from app.product.models.product import Option, Product
+from app.product.services.product_facet_service import ProductFacetService, invalidate_product_facets
+from common.utils.cache_services.memory_cache_service import MemoryCacheService
+
+
+class TestProductFacetService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.cache_patch = patch("common.utils.cache_services._cache_service", MemoryCacheService())
+        self.cache_patch.start()
+
+        self.category_1 = await Category.create(name="Category 1")
+        self.category_2 = await Category.create(name="Category 2")
+
+        # (상품 코드, 가격, 판매 상태, 카테고리, [(색상, 색상 코드, 사이즈)])
+        fixtures = [
+            ("FACET001", 30000, "Y", self.category_1, [("Red", "#FF0000", "M"), ("Red", "#FF0000", "L")]),
+            ("FACET002", 80000, "Y", self.category_1, [("Red", "#FF0000", "M"), ("Blue", "#0000FF", "M")]),
+            ("FACET003", 150000, "Y", self.category_2, [("Blue", "#0000FF", "L")]),
+            ("FACET004", 80000, "N", self.category_2, [("Red", "#FF0000", "M")]),
+        ]
+        for product_code, price, sale_status, category, options in fixtures:
+            product = await Product.create(
+                name=product_code,
+                price=Decimal(price),
+                origin_price=Decimal(price),
+                product_code=product_code,
+                status=sale_status,
+            )
+            await CategoryProduct.create(category=category, product=product)
+            for color, color_code, size in options:
+                await Option.create(product=product, color=color, color_code=color_code, size=size)
+
+    async def asyncTearDown(self) -> None:
+        self.cache_patch.stop()
+        await super().asyncTearDown()
+
+    async def test_필터에_맞는_상품으로_패싯_집계(self) -> None:
+        # When
+        facets = await ProductFacetService.get_facets(ProductFilterRequestDTO(sale_status="Y"))
+
+        # Then
+        assert facets.total_count == 3
+        assert [(facet.category_id, facet.count) for facet in facets.categories] == [
+            (self.category_1.id, 2),
+            (self.category_2.id, 1),
+        ]
+        # 같은 상품의 여러 사이즈는 한 번만 셈
+        assert [(facet.color, facet.count) for facet in facets.colors] == [("Blue", 2), ("Red", 2)]
+        assert [(facet.size, facet.count) for facet in facets.sizes] == [("L", 2), ("M", 2)]
+        assert [facet.count for facet in facets.price_buckets] == [1, 1, 1, 0, 0]
+        assert facets.price_buckets[-1].max_price is None
+
+    async def test_같은_필터는_캐시에서_조회하고_카탈로그_변경시_무효화(self) -> None:
+        # Given
+        filters = ProductFilterRequestDTO(sale_status="Y")
+        await ProductFacetService.get_facets(filters)
+        await Product.filter(product_code="FACET004").update(status="Y")
+
+        # When
+        cached = await ProductFacetService.get_facets(ProductFilterRequestDTO(sale_status="Y", product_name=None))
+        await invalidate_product_facets(("/api/v1/products",))
+        refreshed = await ProductFacetService.get_facets(filters)
+
+        # Then
+        assert cached.total_count == 3
+        assert refreshed.total_count == 4
@@ -1,7 +1,7 @@
 from httpx import AsyncClient
 from tortoise.contrib.test import TestCase
 
-from app.product.models.product import DiscountOption, Product
+from app.product.models.product import DiscountOption, Option, OptionImage, Product
 from main import app
 
 
@@ -38,3 +38,22 @@ class TestProductRouter(TestCase):
         # data = response.json()
         # assert len(data) > 0
         # assert data[0]["name"] == "Test Product"
+
+    async def test_products_요약_조회(self) -> None:
+        # Given
+        option = await Option.create(product=self.test_product, color="Red", color_code="#FF0000", size="M")
+        await OptionImage.create(option=option, image_url="https://cdn.example.com/first.jpg")
+        await OptionImage.create(option=option, image_url="https://cdn.example.com/second.jpg")
+
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(url="/api/v1/products", params={"view": "summary"})
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 1
+        product = data["products"][0]
+        assert product["sale_price"] == 90.0
+        assert product["thumbnail_url"] == "https://cdn.example.com/first.jpg"
+        assert "description" not in product and "options" not in product
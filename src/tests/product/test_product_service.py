@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
+from decimal import Decimal
 from io import BytesIO
 from typing import Optional, TypedDict
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from fastapi import UploadFile
 from pydantic import ValidationError
 from starlette.datastructures import Headers
@@ -953,6 +955,49 @@ class TestProductService(TestCase):
         for product in updated_products:
             self.assertEqual(product.status, batch_request.status)
 
+    async def test_상품_조회_할인가_범위로_검색(self) -> None:
+        # When
+        products_response_dto = await ProductService.get_products_with_options(
+            min_price=49000, max_price=82000, sort="sale_price", order="asc"
+        )
+
+        # Then
+        assert [product.product.product_code for product in products_response_dto.products][-1] == "TEST-PRODUCT-1"
+        assert {product.product.sale_price for product in products_response_dto.products} == {49995, 81000}
+        assert products_response_dto.total_count == 3
+
+    async def test_상품_할인_일괄_변경(self) -> None:
+        # When
+        await ProductService.update_products_discount([self.product_1.id], discount=20, discount_option="percent")
+
+        # Then
+        assert (await Product.get(id=self.product_1.id)).sale_price == Decimal("72000")
+        assert (await Product.get(id=self.product_2.id)).sale_price == Decimal("102000")
+
+        # When: 전체 상품
+        await ProductService.update_products_discount(None, discount=1000, discount_option="amount")
+
+        # Then
+        sale_prices = {product.product_code: product.sale_price for product in await Product.all()}
+        assert sale_prices == {
+            "TEST-PRODUCT-1": Decimal("89000"),
+            "TEST-PRODUCT-2": Decimal("119000"),
+            "TEST-PRODUCT-3": Decimal("49000"),
+            "TEST-PRODUCT-4": Decimal("49000"),
+        }
+
+    async def test_상품_가격_일괄_변경시_할인가_재계산(self) -> None:
+        # When
+        await ProductService.update_pricing([self.product_2.id], price=Decimal("100000"))
+
+        # Then
+        product = await Product.get(id=self.product_2.id)
+        assert product.sale_price == Product.calculate_sale_price(
+            product.price, product.discount, product.discount_option
+        )
+        with pytest.raises(ValueError):
+            await ProductService.update_pricing([self.product_2.id], status="N")
+
     async def test_상품_업데이트_카테고리_동일(self) -> None:
         await ProductService._update_category(product=self.product_1, new_category_id=self.category_1.id)
 
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from tortoise import timezone
+from tortoise.contrib.test import TestCase
+
+from app.order.dtos.payment_request import PaymentApproveRequestDTO, PaymentReserveRequestDTO
+from app.order.models.order import NonUserOrder, NonUserOrderProduct
+from app.order.models.payment import NonUserPayment, PaymentStatus
+from app.order.services.payment_service import PaymentService
+from app.product.models.inventory import StockHold, StockHoldStatus
+from app.product.models.product import CountProduct, Option, Product
+from app.product.services.stock_hold_service import StockHoldService
+from app.product.services.stock_service import StockService
+
+
+class TestStockHoldService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="HOLD001",
+        )
+        self.option = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="M")
+        await StockService.bulk_upsert([(self.product.id, self.option.id, 10)])
+        self.order = await NonUserOrder.create(name="Test User", phone="01012345678", shipping_address="Test Address")
+        await StockHoldService.hold(self.order.id, [(self.product.id, self.option.id, 4)], CountProduct._meta.db)
+
+    async def _stock(self) -> int:
+        return (await CountProduct.get(option=self.option)).count
+
+    async def _expire_holds(self) -> None:
+        await StockHold.filter(order_id=self.order.id).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+    async def test_만료된_점유는_재고_복원(self) -> None:
+        # Given
+        await self._expire_holds()
+
+        # When
+        released = await StockHoldService.release_expired()
+
+        # Then
+        assert released == 1
+        assert await self._stock() == 10
+        assert (await Option.get(id=self.option.id)).stock == 10
+        assert (await StockHold.get(order_id=self.order.id)).status == StockHoldStatus.RELEASED
+        assert await StockHoldService.release_expired() == 0
+
+    async def test_만료_전_점유는_유지(self) -> None:
+        # When
+        released = await StockHoldService.release_expired()
+
+        # Then
+        assert released == 0
+        assert await self._stock() == 6
+
+    async def test_결제_승인시_점유_확정(self) -> None:
+        # Given
+        payment = await NonUserPayment.create(
+            transaction_id="PAYMENT_1_aaaaaaaa",
+            amount=Decimal("85000"),
+            payment_type="kakao_pay",
+            payment_status=PaymentStatus.RESERVED.value,
+            order=self.order,
+        )
+
+        # When
+        await PaymentService.approve_payment(PaymentApproveRequestDTO(payment_id=payment.transaction_id, tx_id="tx_1"))
+        await self._expire_holds()
+        released = await StockHoldService.release_expired()
+
+        # Then
+        assert released == 0
+        assert await self._stock() == 6
+        assert (await StockHold.get(order_id=self.order.id)).status == StockHoldStatus.CONVERTED
+
+    async def test_만료_후_승인되면_재고_다시_차감(self) -> None:
+        # Given
+        await self._expire_holds()
+        await StockHoldService.release_expired()
+
+        # When
+        await StockHoldService.convert([self.order.id], CountProduct._meta.db)
+
+        # Then
+        assert await self._stock() == 6
+        assert (await StockHold.get(order_id=self.order.id)).status == StockHoldStatus.CONVERTED
+
+    async def test_만료_후_재고가_없으면_주문_상품을_재고_부족으로_표시(self) -> None:
+        # Given
+        await NonUserOrderProduct.create(
+            order=self.order, product=self.product, option_id=self.option.id, quantity=4, price=Decimal("85000")
+        )
+        payment = await NonUserPayment.create(
+            transaction_id="PAYMENT_1_bbbbbbbb",
+            amount=Decimal("85000"),
+            payment_type="kakao_pay",
+            payment_status=PaymentStatus.RESERVED.value,
+            order=self.order,
+        )
+        await self._expire_holds()
+        await StockHoldService.release_expired()
+        await StockService.bulk_upsert([(self.product.id, self.option.id, 2)])
+
+        # When
+        await PaymentService.approve_payment(PaymentApproveRequestDTO(payment_id=payment.transaction_id, tx_id="tx_1"))
+
+        # Then
+        assert await self._stock() == 2
+        assert (await StockHold.get(order_id=self.order.id)).status == StockHoldStatus.RELEASED
+        assert (await NonUserOrderProduct.get(order=self.order)).current_status == "OUT_OF_STOCK"
+        # 재고를 확보하지 못한 주문의 결제는 PAID로 남기지 않고 환불 대상으로 전환
+        assert (await NonUserPayment.get(id=payment.pk)).payment_status == PaymentStatus.REFUND_REQUIRED.value
+
+    async def test_결제_예약시_만료된_점유를_다시_점유(self) -> None:
+        # Given
+        await self._expire_holds()
+        await StockHoldService.release_expired()
+
+        # When
+        await PaymentService().reserve_payment(
+            PaymentReserveRequestDTO(
+                user_id=None, non_user_order_id=self.order.id, amount=Decimal("85000"), payment_type="kakao_pay"
+            )
+        )
+
+        # Then
+        hold = await StockHold.get(order_id=self.order.id)
+        assert await self._stock() == 6
+        assert hold.status == StockHoldStatus.HELD
+        assert hold.expires_at > timezone.now()
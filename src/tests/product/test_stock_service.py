@@ -0,0 +1,112 @@
+from decimal import Decimal
+
+from fastapi import HTTPException
+from httpx import AsyncClient
+from tortoise.contrib.test import TestCase
+from tortoise.transactions import in_transaction
+
+from app.product.dtos.request import StockSyncItemDTO, StockSyncRequestDTO
+from app.product.models.product import CountProduct, Option, Product
+from app.product.services.product_service import ProductService
+from app.product.services.stock_service import StockService
+from main import app
+
+
+class TestStockService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.product = await Product.create(
+            name="Test Product",
+            price=Decimal("85000"),
+            origin_price=Decimal("100000"),
+            product_code="STOCK001",
+            description="Test Description",
+            detail="Test Detail",
+        )
+        self.option_m = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="M")
+        self.option_l = await Option.create(product=self.product, color="Red", color_code="#FF0000", size="L")
+        await StockService.bulk_upsert([(self.product.id, self.option_m.id, 5)])
+
+    async def test_bulk_upsert_기존_재고는_수정_없는_재고는_생성(self) -> None:
+        # When
+        await StockService.bulk_upsert(
+            [
+                (self.product.id, self.option_m.id, 30),
+                (self.product.id, self.option_l.id, 10),
+                (self.product.id, self.option_l.id, 12),
+            ]
+        )
+
+        # Then
+        stocks = {stock.option_id: stock.count for stock in await CountProduct.filter(product=self.product)}  # type: ignore[attr-defined]
+        assert stocks == {self.option_m.id: 30, self.option_l.id: 12}
+        assert (await Option.get(id=self.option_m.id)).stock == 30
+        assert (await Option.get(id=self.option_l.id)).stock == 12
+        assert (await Product.get(id=self.product.id)).total_stock == 42
+
+    async def test_decrease_비정규화_재고도_함께_차감(self) -> None:
+        # When
+        async with in_transaction() as connection:
+            await StockService.decrease([(self.product.id, self.option_m.id, 2)], connection)
+
+        # Then
+        assert (await CountProduct.get(option=self.option_m)).count == 3
+        assert (await Option.get(id=self.option_m.id)).stock == 3
+        assert (await Product.get(id=self.product.id)).total_stock == 3
+
+    async def test_decrease_재고_부족시_변경_없음(self) -> None:
+        # When
+        with self.assertRaises(HTTPException):
+            await StockService.decrease([(self.product.id, self.option_m.id, 6)], CountProduct._meta.db)
+
+        # Then
+        assert (await CountProduct.get(option=self.option_m)).count == 5
+        assert (await Option.get(id=self.option_m.id)).stock == 5
+        assert (await Product.get(id=self.product.id)).total_stock == 5
+
+    async def test_재고가_0을_넘나들면_구매_가능_여부_갱신(self) -> None:
+        # When
+        await StockService.decrease([(self.product.id, self.option_m.id, 5)], CountProduct._meta.db)
+
+        # Then
+        assert (await Product.get(id=self.product.id)).in_stock is False
+        assert (await ProductService.get_products_with_options(in_stock=True)).total_count == 0
+
+        # When
+        await StockService.restore([(self.product.id, self.option_m.id, 1)], CountProduct._meta.db)
+
+        # Then
+        assert (await Product.get(id=self.product.id)).in_stock is True
+        assert (await ProductService.get_products_with_options(in_stock=True)).total_count == 1
+
+    async def test_sync_stock_없는_옵션은_제외하고_반환(self) -> None:
+        # Given
+        request = StockSyncRequestDTO(
+            items=[
+                StockSyncItemDTO(option_id=self.option_m.id, stock=0),
+                StockSyncItemDTO(option_id=999999, stock=3),
+            ]
+        )
+
+        # When
+        response = await StockService.sync_stock(request)
+
+        # Then
+        assert response.updated_count == 1
+        assert response.missing_option_ids == [999999]
+        assert (await CountProduct.get(option=self.option_m)).count == 0
+
+    async def test_재고_일괄_동기화_API(self) -> None:
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.put(
+                "/api/v1/products/stock",
+                json={
+                    "items": [{"option_id": self.option_m.id, "stock": 7}, {"option_id": self.option_l.id, "stock": 9}]
+                },
+            )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {"updated_count": 2, "missing_option_ids": []}
+        assert await CountProduct.filter(product=self.product).count() == 2
@@ -0,0 +1,15 @@
+from tortoise.contrib.test import SimpleTestCase
+
+from common.handlers.background_task_handler import stop_background_tasks
+from main import app
+
+
+class TestBackgroundTaskHandlers(SimpleTestCase):
+    async def test_작업_종료가_ORM_종료보다_먼저_실행(self) -> None:
+        # When
+        handlers = app.router.on_shutdown
+        orm_close = [index for index, handler in enumerate(handlers) if handler.__module__.startswith("tortoise")]
+
+        # Then
+        assert orm_close
+        assert handlers.index(stop_background_tasks) < min(orm_close)
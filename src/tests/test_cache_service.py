@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from common.utils.cache_services import get_cache_service
+from common.utils.cache_services.memory_cache_service import MemoryCacheService
+from core.configs import settings
+from core.configs.settings import Env
+
+
+class TestCacheService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.enterContext(patch("common.utils.cache_services._cache_service", None))
+        self.enterContext(patch.object(settings, "CACHE_SERVICE_TYPE", "memory"))
+
+    async def test_로컬_환경은_메모리_캐시_사용(self) -> None:
+        # Given
+        with patch.object(settings, "ENV", Env.LOCAL):
+            # When
+            cache = get_cache_service()
+
+        # Then
+        assert isinstance(cache, MemoryCacheService)
+
+    async def test_로컬_외_환경은_메모리_캐시_거부(self) -> None:
+        # Given
+        with patch.object(settings, "ENV", Env.PROD):
+            # When / Then
+            with self.assertRaises(ValueError):
+                get_cache_service()
@@ -0,0 +1,34 @@
+from starlette.requests import Request
+from tortoise.contrib.test import SimpleTestCase
+
+from common.utils.client_ip import get_client_ip
+
+
+def make_request(peer: str, headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+            "client": (peer, 12345),
+        }
+    )
+
+
+class TestClientIp(SimpleTestCase):
+    async def test_신뢰하는_프록시를_거친_요청은_전달된_IP_사용(self) -> None:
+        # Given
+        forwarded = make_request("172.18.0.2", {"X-Forwarded-For": "1.1.1.1, 203.0.113.7, 10.0.0.5"})
+        real_ip = make_request("172.18.0.2", {"X-Real-IP": "203.0.113.8"})
+
+        # When & Then - 클라이언트가 넣은 왼쪽 값(1.1.1.1)이 아닌 마지막 신뢰하지 않는 주소
+        assert get_client_ip(forwarded) == "203.0.113.7"
+        assert get_client_ip(real_ip) == "203.0.113.8"
+
+    async def test_프록시를_거치지_않은_요청의_헤더는_무시(self) -> None:
+        # Given
+        request = make_request("203.0.113.9", {"X-Forwarded-For": "1.1.1.1", "X-Real-IP": "1.1.1.1"})
+
+        # When & Then
+        assert get_client_ip(request) == "203.0.113.9"
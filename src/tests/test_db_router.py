@@ -0,0 +1,85 @@
+import tempfile
+from pathlib import Path
+
+from tortoise import Tortoise
+from tortoise.connection import connections
+from tortoise.contrib.test import SimpleTestCase
+from tortoise.transactions import in_transaction
+
+from app.banner.models.banner import Banner, BannerType
+from app.banner.services.banner_service import BannerService
+from core.database.db_router import DEFAULT_CONNECTION, READ_REPLICA_CONNECTION, read_replica, write_connection_name
+
+
+@read_replica
+async def _titles_from_replica() -> list[str]:
+    return [banner.title for banner in await Banner.all().order_by("id")]
+
+
+@read_replica
+async def _create_inside_read_replica(title: str) -> Banner:
+    return await Banner.create(title=title, sub_title="", image_url="", event_url="", category_type=BannerType.BANNER)
+
+
+class TestReadReplicaRouter(SimpleTestCase):
+    """primary/replica SQLite 두 개로 읽기/쓰기 커넥션 분리 확인 (세션 테스트 DB 대신 별도로 초기화)"""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        await Tortoise.init(
+            config={
+                "connections": {
+                    DEFAULT_CONNECTION: f"sqlite://{Path(self.tmp_dir.name) / 'primary.sqlite3'}",
+                    READ_REPLICA_CONNECTION: f"sqlite://{Path(self.tmp_dir.name) / 'replica.sqlite3'}",
+                },
+                "apps": {"models": {"models": ["app.banner.models.banner"], "default_connection": DEFAULT_CONNECTION}},
+                "routers": ["core.database.db_router.ReadReplicaRouter"],
+            }
+        )
+        await Tortoise.generate_schemas()
+        # 복제본에만 있는 행으로 어느 커넥션에서 읽었는지 구분
+        replica = connections.get(READ_REPLICA_CONNECTION)
+        await replica.execute_script(await self._banner_schema())
+        await replica.execute_query(
+            "INSERT INTO banner (title, sub_title, image_url, event_url, is_active, category_type, display_order, "
+            "created_at, updated_at) VALUES ('replica', '', '', '', 1, 'banner', 1, '2024-01-01', '2024-01-01')"
+        )
+        self.banner = await Banner.create(
+            title="primary", sub_title="", image_url="", event_url="", category_type=BannerType.BANNER
+        )
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+        await super().asyncTearDown()
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    async def _banner_schema() -> str:
+        rows = await connections.get(DEFAULT_CONNECTION).execute_query_dict(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'banner'"
+        )
+        return f"{rows[0]['sql']};"
+
+    async def test_read_replica_안의_조회만_복제본에서_읽음(self) -> None:
+        # When
+        replica_titles = await _titles_from_replica()
+        primary_titles = [banner.title for banner in await Banner.all().order_by("id")]
+
+        # Then
+        assert replica_titles == ["replica"]
+        assert primary_titles == ["primary"]
+
+    async def test_쓰기와_트랜잭션은_기본_커넥션_사용(self) -> None:
+        # When
+        await _create_inside_read_replica("written")
+        async with in_transaction(write_connection_name()) as connection:
+            await Banner.filter(id=self.banner.pk).using_db(connection).update(title="updated")
+        toggled = await BannerService.toggle_banner_status(self.banner.pk)
+
+        # Then
+        assert write_connection_name() == DEFAULT_CONNECTION
+        assert connection.connection_name == DEFAULT_CONNECTION
+        assert toggled.is_active is False
+        assert [banner.title for banner in await Banner.all().order_by("id")] == ["updated", "written"]
+        assert await _titles_from_replica() == ["replica"]
@@ -0,0 +1,57 @@
+from httpx import AsyncClient
+from tortoise.contrib.test import TestCase
+
+from app.category.models.category import Category
+from main import app
+
+CATALOG_URL = "/api/v1/category?limit=100"
+
+
+class TestETag(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        for i in range(50):
+            await Category.create(name=f"카테고리 {i}", depth=0)
+
+    async def test_변경없는_카탈로그는_304_반환(self) -> None:
+        # Given
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            first = await ac.get(CATALOG_URL)
+            etag = first.headers["etag"]
+
+            # When
+            second = await ac.get(CATALOG_URL, headers={"If-None-Match": etag})
+            strong = await ac.get(CATALOG_URL, headers={"If-None-Match": etag.removeprefix("W/")})
+
+        # Then
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"].startswith("public, max-age=")
+        assert second.headers["cache-control"] == first.headers["cache-control"]
+        assert second.status_code == 304
+        assert second.content == b""
+        assert strong.status_code == 304
+
+    async def test_내용이_바뀌면_etag_변경(self) -> None:
+        # Given
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            etag = (await ac.get(CATALOG_URL)).headers["etag"]
+            await Category.create(name="새 카테고리", depth=0)
+
+            # When
+            response = await ac.get(CATALOG_URL, headers={"If-None-Match": etag})
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_큰_응답은_gzip_압축(self) -> None:
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(CATALOG_URL, headers={"Accept-Encoding": "gzip"})
+
+        # Then
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"].startswith('W/"')
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()) == 50
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, Depends
+from httpx import AsyncClient
+from tortoise.contrib.test import TestCase
+
+from app.category.models.category import Category
+from app.user.services.auth_service import AuthenticateService
+from common.utils import http_cache
+from common.utils.http_cache import cache_control, register_purge_hook, validate_cache_policies
+from main import app
+
+
+class TestHttpCache(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.category = await Category.create(name="드라이버", depth=0)
+        self.purged: list[tuple[str, ...]] = []
+
+        async def capture(paths: tuple[str, ...]) -> None:
+            self.purged.append(paths)
+
+        self.hook = capture
+        register_purge_hook(capture)
+
+    async def asyncTearDown(self) -> None:
+        http_cache._purge_hooks.remove(self.hook)
+        await super().asyncTearDown()
+
+    async def test_공개_조회_라우트에_cache_control_헤더(self) -> None:
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(f"/api/v1/category/{self.category.id}")
+            not_found = await ac.get("/api/v1/category/999999")
+
+        # Then
+        assert response.headers["cache-control"] == "public, max-age=300, stale-while-revalidate=3600"
+        assert "etag" in response.headers
+        assert not_found.headers.get("cache-control") is None
+
+    async def test_카탈로그_변경시_purge_훅_실행(self) -> None:
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post("/api/v1/category", json={"name": "아이언"})
+        await asyncio.gather(*http_cache._pending_purges)
+
+        # Then
+        assert response.status_code == 201
+        assert self.purged == [("/api/v1/category", "/api/v1/products")]
+
+    async def test_사용자별_라우트에는_공개_캐시_정책_불가(self) -> None:
+        # Given
+        router = APIRouter()
+
+        @router.get("/me")
+        @cache_control(max_age=60)
+        async def me(user_id: int = Depends(AuthenticateService().get_user_id)) -> int:
+            return user_id
+
+        # When & Then
+        with pytest.raises(ValueError):
+            validate_cache_policies(router.routes)
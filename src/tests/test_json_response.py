@@ -0,0 +1,29 @@
+import json
+from decimal import Decimal
+
+from pydantic import BaseModel
+from tortoise.contrib.test import TestCase
+
+from common.utils.json_response import ModelJSONResponse
+
+
+class Item(BaseModel):
+    name: str
+    price: Decimal
+
+
+class TestModelJSONResponse(TestCase):
+    async def test_모델을_바로_직렬화(self) -> None:
+        # When
+        response = ModelJSONResponse([Item(name="골프공", price=Decimal("85000"))])
+
+        # Then
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(bytes(response.body)) == [{"name": "골프공", "price": "85000"}]
+
+    async def test_dict_응답도_동일하게_직렬화(self) -> None:
+        # When
+        response = ModelJSONResponse({"code": 404, "data": None, "ratio": float("nan")})
+
+        # Then
+        assert response.body == b'{"code":404,"data":null,"ratio":null}'
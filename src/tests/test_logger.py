@@ -0,0 +1,54 @@
+import json
+import logging
+import queue
+
+from tortoise.contrib.test import TestCase
+
+from common.utils.logger import JsonFormatter, SamplingFilter, _ExceptionKeepingQueueHandler
+
+
+def make_record(**extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("test_logger", logging.WARNING, __file__, 1, "Validation Error", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestLogger(TestCase):
+    async def test_json_포맷에_extra_필드_포함(self) -> None:
+        # Given
+        record = make_record(path="/api/v1/product", status_code=422, sample_rate=0.1)
+
+        # When
+        log = json.loads(JsonFormatter().format(record))
+
+        # Then
+        assert log["level"] == "WARNING"
+        assert log["logger"] == "test_logger"
+        assert log["message"] == "Validation Error"
+        assert log["path"] == "/api/v1/product"
+        assert log["status_code"] == 422
+        assert "sample_rate" not in log
+
+    async def test_샘플링_비율에_따라_로그_필터링(self) -> None:
+        # Given
+        sampling_filter = SamplingFilter()
+
+        # When & Then
+        assert sampling_filter.filter(make_record())
+        assert sampling_filter.filter(make_record(sample_rate=1.0))
+        assert not sampling_filter.filter(make_record(sample_rate=0.0))
+
+    async def test_큐를_거친_로그에_예외_필드_포함(self) -> None:
+        # Given
+        try:
+            raise ValueError("invalid stock")
+        except ValueError as e:
+            record = make_record(exc_info=(type(e), e, e.__traceback__))
+        handler = _ExceptionKeepingQueueHandler(queue.SimpleQueue())
+
+        # When
+        log = json.loads(JsonFormatter().format(handler.prepare(record)))
+
+        # Then
+        assert log["message"] == "Validation Error"
+        assert "ValueError: invalid stock" in log["exc_info"]
@@ -0,0 +1,20 @@
+from httpx import AsyncClient
+from tortoise.contrib.test import TestCase
+
+from main import app
+
+
+class TestMetrics(TestCase):
+    async def test_라우트_템플릿별_메트릭_노출(self) -> None:
+        # Given
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            await ac.get("/api/v1/category/999999")
+
+            # When
+            response = await ac.get("/metrics")
+
+        # Then
+        assert response.status_code == 200
+        assert 'http_requests_total{method="GET",route="/api/v1/category/{category_id}",status="404"}' in response.text
+        assert "http_request_duration_seconds_bucket" in response.text
+        assert "http_requests_in_flight" in response.text
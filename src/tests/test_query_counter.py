@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+from tortoise.contrib.test import TestCase
+
+from app.category.models.category import Category
+from common.middlewares import query_counter_middleware
+from common.middlewares.query_counter_middleware import QueryCounterMiddleware
+from common.utils.query_counter import QueryBudget, QueryBudgetExceeded, track_queries
+from main import app
+
+
+class TestQueryCounter(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        for i in range(3):
+            await Category.create(name=f"category_{i}")
+
+    async def test_쿼리_수_집계(self) -> None:
+        # When
+        with track_queries() as stats:
+            for category in await Category.all():
+                await Category.filter(id=category.id).first()
+
+        # Then
+        assert stats.count == 4
+        assert stats.repeated_statements(threshold=3)
+
+    async def test_쿼리_예산_초과(self) -> None:
+        # When & Then
+        with pytest.raises(QueryBudgetExceeded):
+            with track_queries(max_queries=1):
+                await Category.all()
+                await Category.all()
+
+    async def test_응답_헤더에_쿼리_수_포함(self) -> None:
+        # When
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/api/v1/category", params={"page": 1, "limit": 10})
+
+        # Then
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Queries"]) >= 1
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    async def test_요청_쿼리_예산_초과는_응답을_막지_않음(self) -> None:
+        # Given
+        budget_app = FastAPI()
+        budget_app.add_middleware(QueryCounterMiddleware)
+
+        @budget_app.get("/categories", dependencies=[Depends(QueryBudget(1))])
+        async def categories() -> int:
+            await Category.all()
+            return await Category.all().count()
+
+        # When: 테스트 fixture의 예산 검사 없이 운영과 같은 미들웨어로 호출
+        with patch.object(query_counter_middleware, "track_queries", track_queries):
+            with self.assertLogs("query_counter_logger", level="WARNING") as logs:
+                async with AsyncClient(app=budget_app, base_url="http://test") as ac:
+                    response = await ac.get("/categories")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["X-DB-Queries"] == "2"
+        assert any("query budget exceeded" in message for message in logs.output)
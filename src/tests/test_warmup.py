@@ -0,0 +1,20 @@
+import sys
+
+from tortoise.contrib.test import TestCase
+
+from app.category.models.category import Category
+from common.utils.warmup import warm_up
+from main import app
+
+
+class TestWarmup(TestCase):
+    async def test_warm_up_주요_경로_사전_실행(self) -> None:
+        # Given
+        await Category.create(name="드라이버", depth=0)
+
+        # When
+        await warm_up(app)
+
+        # Then
+        assert "PIL.Image" in sys.modules
+        assert "boto3" in sys.modules
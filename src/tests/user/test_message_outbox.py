@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from tortoise import timezone
+from tortoise.contrib.test import TestCase
+
+from app.user.dtos.request import UserCreateRequestDTO
+from app.user.services.auth_service import AuthenticateService
+from app.user.services.user_service import UserService
+from app.user.services.verification_service import VerificationService
+from common.models.message_outbox import MessageChannel, MessageOutbox, MessageStatus
+from common.utils.cache_services.memory_cache_service import MemoryCacheService
+from common.utils.email_services.email_service import EmailService
+from common.utils.message_outbox.outbox_service import MessageOutboxService
+from common.utils.message_outbox.outbox_worker import MessageOutboxWorker
+from common.utils.sms_services.sms_service import SmsService
+
+
+class StubEmailService(EmailService):
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send_email(self, to: str, subject: str, message: str) -> dict[str, str]:
+        self.sent.append(to)
+        return {"status": "success", "message": "Email sent successfully."}
+
+
+class FailingSmsService(SmsService):
+    async def send_sms(self, phone_number: str, message: str) -> dict[str, str]:
+        return {"status": "error", "message": "provider unavailable"}
+
+
+class TestMessageOutbox(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.user_service = UserService(
+            auth_service=AuthenticateService(),
+            outbox_service=MessageOutboxService(),
+            verification_service=VerificationService(
+                auth_service=AuthenticateService(), cache_service=MemoryCacheService()
+            ),
+        )
+        self.user = await self.user_service.create_user(
+            UserCreateRequestDTO(
+                name="홍길동",
+                email="hong@example.com",
+                phone="010-1234-1234",
+                login_id="hong1",
+                password="Password1!",
+                password2="Password1!",
+            )
+        )
+        self.email_service = StubEmailService()
+        self.worker = MessageOutboxWorker(
+            email_service=self.email_service,
+            sms_service=FailingSmsService(),
+            max_attempts=2,
+        )
+
+    async def test_비밀번호_초기화_메일_아웃박스_적재(self) -> None:
+        # When
+        await self.user_service.send_password_reset_mail(
+            name=self.user.name, login_id=self.user.login_id, base_url="http://test/"
+        )
+
+        # Then
+        outbox = await MessageOutbox.get(recipient=self.user.email)
+        assert outbox.channel == MessageChannel.EMAIL
+        assert outbox.status == MessageStatus.PENDING
+        assert self.email_service.sent == []
+
+    async def test_워커_발송_성공_및_재시도(self) -> None:
+        # Given
+        await self.user_service.send_password_reset_mail(
+            name=self.user.name, login_id=self.user.login_id, base_url="http://test/"
+        )
+        await self.user_service.send_sms_process(phone_number="01012341234", client_ip="127.0.0.1")
+
+        # When
+        processed = await self.worker.process_batch()
+
+        # Then
+        assert processed == 2
+        assert self.email_service.sent == [self.user.email]
+
+        email_outbox = await MessageOutbox.get(channel=MessageChannel.EMAIL)
+        sms_outbox = await MessageOutbox.get(channel=MessageChannel.SMS)
+        assert email_outbox.status == MessageStatus.SENT
+        assert sms_outbox.status == MessageStatus.PENDING
+        assert sms_outbox.attempts == 1
+        assert sms_outbox.next_attempt_at > sms_outbox.created_at
+
+    async def test_워커_최대_재시도_초과시_실패_처리(self) -> None:
+        # Given
+        await self.user_service.send_sms_process(phone_number="01012341234", client_ip="127.0.0.1")
+        await MessageOutbox.filter(channel=MessageChannel.SMS).update(attempts=1)
+
+        # When
+        await self.worker.process_batch()
+
+        # Then
+        sms_outbox = await MessageOutbox.get(channel=MessageChannel.SMS)
+        assert sms_outbox.status == MessageStatus.FAILED
+        assert sms_outbox.last_error == "provider unavailable"
+
+    async def test_리스가_지난_발송만_복구(self) -> None:
+        # Given: 종료된 워커가 가져간 메시지와 다른 워커가 보내는 중인 메시지
+        now = timezone.now()
+        stale, sending = [
+            await MessageOutbox.create(
+                channel=MessageChannel.EMAIL,
+                recipient=recipient,
+                subject="subject",
+                body="body",
+                status=MessageStatus.SENDING,
+                next_attempt_at=now - timedelta(hours=1),
+                claimed_at=claimed_at,
+            )
+            for recipient, claimed_at in [("stale@example.com", now - timedelta(hours=1)), ("live@example.com", now)]
+        ]
+
+        # When
+        processed = await self.worker.process_batch()
+
+        # Then
+        assert processed == 1
+        assert self.email_service.sent == ["stale@example.com"]
+        assert (await MessageOutbox.get(id=stale.id)).status == MessageStatus.SENT
+        assert (await MessageOutbox.get(id=sending.id)).status == MessageStatus.SENDING
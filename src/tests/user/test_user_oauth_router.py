@@ -8,8 +8,7 @@ from app.user.dtos.request import UserCreateRequestDTO
 from app.user.models.user import User
 from app.user.services.auth_service import AuthenticateService
 from app.user.services.user_service import UserService
-from common.utils.email_services import get_email_service
-from common.utils.sms_services import get_sms_service
+from common.utils.message_outbox.outbox_service import MessageOutboxService
 from main import app
 
 
@@ -18,13 +17,11 @@ class TestUserService(TestCase):
     async def asyncSetUp(self) -> None:
         await super().asyncSetUp()
         auth_service = AuthenticateService()
-        sms_service = get_sms_service()
-        email_service = get_email_service()
+        outbox_service = MessageOutboxService()
 
         self.user_service = UserService(
             auth_service=auth_service,
-            sms_service=sms_service,
-            email_service=email_service,
+            outbox_service=outbox_service,
         )
         self.user_kakao = await self.user_service.create_social_user(
             name="홍길동",
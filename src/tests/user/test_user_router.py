@@ -7,8 +7,7 @@ from app.user.dtos.request import UserCreateRequestDTO
 from app.user.models.user import User
 from app.user.services.auth_service import AuthenticateService
 from app.user.services.user_service import UserService
-from common.utils.email_services import get_email_service
-from common.utils.sms_services import get_sms_service
+from common.utils.message_outbox.outbox_service import MessageOutboxService
 from main import app
 
 
@@ -28,13 +27,11 @@ class TestUserService(TestCase):
         body = UserCreateRequestDTO(**user_data)
 
         auth_service = AuthenticateService()
-        sms_service = get_sms_service()
-        email_service = get_email_service()
+        outbox_service = MessageOutboxService()
 
         self.user_service = UserService(
             auth_service=auth_service,
-            sms_service=sms_service,
-            email_service=email_service,
+            outbox_service=outbox_service,
         )
 
         self.user_1 = await self.user_service.create_user(body)
@@ -0,0 +1,61 @@
+import pytest
+from tortoise.contrib.test import TestCase
+
+from app.user.services.auth_service import AuthenticateService
+from app.user.services.verification_service import VerificationService
+from common.exceptions.custom_exceptions import InvalidVerificationCodeException, VerificationRateLimitedException
+from common.utils.cache_services.memory_cache_service import MemoryCacheService
+from core.configs import settings
+
+
+class TestVerificationService(TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.verification_service = VerificationService(
+            auth_service=AuthenticateService(), cache_service=MemoryCacheService()
+        )
+
+    async def test_인증번호_확인_성공(self) -> None:
+        # Given
+        code = await self.verification_service.issue_code(phone_number="01012341234", client_ip="127.0.0.1")
+
+        # When
+        await self.verification_service.verify_code(phone_number="01012341234", verification_code=code)
+
+        # Then - 한 번 사용한 인증번호는 재사용 불가
+        with pytest.raises(InvalidVerificationCodeException):
+            await self.verification_service.verify_code(phone_number="01012341234", verification_code=code)
+
+    async def test_인증번호_불일치(self) -> None:
+        # Given
+        code = await self.verification_service.issue_code(phone_number="01012341234", client_ip="127.0.0.1")
+        wrong_code = "000000" if code != "000000" else "111111"
+
+        # When & Then
+        with pytest.raises(InvalidVerificationCodeException):
+            await self.verification_service.verify_code(phone_number="01012341234", verification_code=wrong_code)
+
+    async def test_전화번호당_발송_횟수_제한(self) -> None:
+        # Given
+        for _ in range(settings.VERIFICATION_PHONE_BUCKET_CAPACITY):
+            await self.verification_service.issue_code(phone_number="01012341234", client_ip="127.0.0.1")
+
+        # When & Then
+        with pytest.raises(VerificationRateLimitedException):
+            await self.verification_service.issue_code(phone_number="01012341234", client_ip="127.0.0.1")
+
+        # 다른 전화번호는 영향 없음
+        await self.verification_service.issue_code(phone_number="01099998888", client_ip="127.0.0.1")
+
+    async def test_전화번호_한도_초과시_IP_한도는_소진하지_않음(self) -> None:
+        # Given
+        for _ in range(settings.VERIFICATION_PHONE_BUCKET_CAPACITY):
+            await self.verification_service.issue_code(phone_number="01012341234", client_ip="203.0.113.1")
+
+        # When
+        for _ in range(settings.VERIFICATION_IP_BUCKET_CAPACITY):
+            with pytest.raises(VerificationRateLimitedException):
+                await self.verification_service.issue_code(phone_number="01012341234", client_ip="203.0.113.1")
+
+        # Then - 같은 IP의 다른 전화번호는 발송 가능
+        await self.verification_service.issue_code(phone_number="01099998888", client_ip="203.0.113.1")